@@ -5,6 +5,23 @@ Configuration Module.
 p = {}
 
 p["dataset_folder"] = "src/shared/infrastructure/datasets"
+p["snapshot_folder"] = ".cache/snapshots"  # Columnar snapshots of parsed datasets (safe to delete).
+p["result_cache_size"] = 256  # Postal codes whose search results are kept per service.
+p["result_cache_ttl_seconds"] = 3600  # Lifetime of a cached result; caches are also reset when a dataset changes.
+
+# Read-through caches in front of repositories, keyed by registry name. Each entry lists the cached query
+# methods and the eviction bounds: entries (max_size), estimated bytes (max_bytes) and lifetime (ttl_seconds).
+# Empty results, e.g. postal codes without stations, are cached for negative_ttl_seconds.
+p["repository_caches"] = {
+    "charging_stations": {
+        "methods": ["find_stations_by_postal_code", "find_stations_by_postal_codes"],
+        "max_size": 512,
+        "max_bytes": 32 * 1024 * 1024,
+        "ttl_seconds": 3600,
+        "negative_caching": True,
+        "negative_ttl_seconds": 600,
+    },
+}
 
 p["geocode"] = "PLZ"
 
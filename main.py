@@ -19,9 +19,16 @@ from src.shared.domain.events import (
     StationSearchFailedEvent,
     NoStationsFoundEvent,
     StationsFoundEvent,
+    StationStatisticsQueriedEvent,
     PostalCodeValidatedEvent,
 )
 from src.shared.infrastructure.event_bus import InMemoryEventBus
+from src.shared.infrastructure.caching import (
+    CachingRepository,
+    LRUCache,
+    RepositoryRegistry,
+    get_repository_registry,
+)
 from src.shared.infrastructure.repositories import (
     CSVChargingStationRepository,
     CSVGeoDataRepository,
@@ -41,31 +48,153 @@ from src.demand.application.event_handlers import DemandAnalysisEventHandler, Hi
 logger = get_logger(__name__)
 
 
-def setup_repositories():
+def get_dataset_paths():
+    """
+    Resolve the dataset file paths from the project configuration.
+
+    Returns:
+        Tuple of (lstations_path, geodat_plz_path, residents_path)
+    """
+    dataset_folder = Path(os.getcwd()) / pdict["dataset_folder"]
+
+    lstations_path = os.path.join(dataset_folder, pdict["file_lstations"])
+    geodat_plz_path = os.path.join(dataset_folder, pdict["file_geodat_plz"])
+    residents_path = os.path.join(dataset_folder, pdict["file_residents"])
+
+    return lstations_path, geodat_plz_path, residents_path
+
+
+def with_repository_cache(name: str, repository):
+    """
+    Wrap a repository in a read-through cache if one is configured for it.
+
+    Args:
+        name: Registry name of the repository, looked up in `pdict["repository_caches"]`.
+        repository: Repository instance to wrap.
+    Returns:
+        CachingRepository around `repository`, or `repository` itself if no cache is configured.
+    """
+    settings = pdict.get("repository_caches", {}).get(name)
+    if not settings:
+        return repository
+
+    cache = LRUCache(
+        max_size=settings.get("max_size", 256),
+        ttl_seconds=settings.get("ttl_seconds"),
+        max_bytes=settings.get("max_bytes"),
+    )
+    return CachingRepository(
+        repository,
+        cache,
+        methods=settings["methods"],
+        negative_caching=settings.get("negative_caching", True),
+        negative_ttl_seconds=settings.get("negative_ttl_seconds"),
+    )
+
+
+def setup_repositories(registry: RepositoryRegistry | None = None):
     """
     Setup all repository instances.
+
+    Dataset-backed repositories are taken from the process-wide registry, so Streamlit
+    reruns and concurrent sessions reuse them until the underlying files change.
+
+    Args:
+        registry: Repository registry to resolve instances from (defaults to the process-wide one).
     Returns:
         Tuple of (charging_station_repo, geo_data_repo, population_repo, demand_analysis_repo)
     """
-    # Determine the current working directory.
-    cwd = Path(os.getcwd())
-    dataset_folder: str | None = cwd / pdict["dataset_folder"]
-
-    # Initialize repositories with data.
-    charging_station_repo = CSVChargingStationRepository(os.path.join(dataset_folder, pdict["file_lstations"]))
-    geo_data_repo = CSVGeoDataRepository(os.path.join(dataset_folder, pdict["file_geodat_plz"]))
-    population_repo = CSVPopulationRepository(os.path.join(dataset_folder, pdict["file_residents"]))
+    if registry is None:
+        registry = get_repository_registry()
+
+    lstations_path, geodat_plz_path, residents_path = get_dataset_paths()
+    snapshot_folder = Path(os.getcwd()) / pdict["snapshot_folder"]
+
+    # Initialize repositories with data (built once per dataset version), behind their configured caches.
+    charging_station_repo = registry.get_or_create(
+        "charging_stations",
+        lambda: with_repository_cache(
+            "charging_stations", CSVChargingStationRepository(lstations_path, snapshot_dir=snapshot_folder)
+        ),
+        sources=[lstations_path],
+    )
+    geo_data_repo = registry.get_or_create(
+        "geo_data",
+        lambda: with_repository_cache("geo_data", CSVGeoDataRepository(geodat_plz_path)),
+        sources=[geodat_plz_path],
+    )
+    # Postal codes of the geo dataset are the application's source of truth.
+    population_repo = registry.get_or_create(
+        "population",
+        lambda: with_repository_cache(
+            "population",
+            CSVPopulationRepository(residents_path, postal_code_registry=geo_data_repo.get_postal_code_registry()),
+        ),
+        sources=[residents_path, geodat_plz_path],
+    )
     demand_analysis_repo = InMemoryDemandAnalysisRepository()
 
     return charging_station_repo, geo_data_repo, population_repo, demand_analysis_repo
 
 
+def setup_demand_snapshot_cache(registry: RepositoryRegistry | None = None) -> dict:
+    """
+    Setup the cache of demand snapshots.
+
+    The cache is taken from the process-wide registry and tied to the station, resident and
+    geo datasets (the latter decides which postal codes are analyzed), so all sessions share
+    one snapshot per target ratio until any of these files changes.
+
+    Args:
+        registry: Repository registry to resolve the cache from (defaults to the process-wide one).
+    Returns:
+        Dict of demand snapshots keyed by target ratio.
+    """
+    if registry is None:
+        registry = get_repository_registry()
+
+    lstations_path, geodat_plz_path, residents_path = get_dataset_paths()
+    return registry.get_or_create("demand_snapshots", dict, sources=[lstations_path, residents_path, geodat_plz_path])
+
+
+def setup_result_caches(registry: RepositoryRegistry | None = None) -> dict[str, LRUCache]:
+    """
+    Setup the per-postal-code result caches of the application services.
+
+    Each cache is taken from the process-wide registry and tied to the dataset files its
+    results are computed from, so it is shared by all sessions and replaced by an empty one
+    as soon as a new version of those files is loaded.
+
+    Args:
+        registry: Repository registry to resolve the caches from (defaults to the process-wide one).
+    Returns:
+        Dict with the "stations", "geolocation" and "residents" result caches.
+    """
+    if registry is None:
+        registry = get_repository_registry()
+
+    lstations_path, geodat_plz_path, residents_path = get_dataset_paths()
+
+    def new_cache() -> LRUCache:
+        return LRUCache(max_size=pdict["result_cache_size"], ttl_seconds=pdict["result_cache_ttl_seconds"])
+
+    return {
+        "stations": registry.get_or_create("station_search_results", new_cache, sources=[lstations_path]),
+        "geolocation": registry.get_or_create("geolocation_results", new_cache, sources=[geodat_plz_path]),
+        "residents": registry.get_or_create(
+            "resident_data_results", new_cache, sources=[residents_path, geodat_plz_path]
+        ),
+    }
+
+
 def setup_services(
     charging_station_repo: CSVChargingStationRepository,
     geo_data_repo: CSVGeoDataRepository,
     population_repo: CSVPopulationRepository,
     demand_analysis_repo: InMemoryDemandAnalysisRepository,
     event_bus: IDomainEventPublisher,
+    demand_snapshot_cache: dict | None = None,
+    result_caches: dict[str, LRUCache] | None = None,
 ):
     """
     Setup all application services.
@@ -73,19 +202,28 @@ def setup_services(
         Tuple of (postal_code_residents_service, charging_station_service,
         geolocation_service, demand_analysis_service, power_capacity_service)
     """
+    result_caches = result_caches or {}
+
     # Station Discovery service.
-    charging_station_service = ChargingStationService(repository=charging_station_repo, event_bus=event_bus)
+    charging_station_service = ChargingStationService(
+        repository=charging_station_repo, event_bus=event_bus, result_cache=result_caches.get("stations")
+    )
 
     # Postal Code Residents service.
-    postal_code_residents_service = PostalCodeResidentService(repository=population_repo, event_bus=event_bus)
+    postal_code_residents_service = PostalCodeResidentService(
+        repository=population_repo, event_bus=event_bus, result_cache=result_caches.get("residents")
+    )
 
     # Geo Location service.
-    geolocation_service = GeoLocationService(repository=geo_data_repo, event_bus=event_bus)
+    geolocation_service = GeoLocationService(
+        repository=geo_data_repo, event_bus=event_bus, result_cache=result_caches.get("geolocation")
+    )
 
     # Demand Analysis service.
     demand_analysis_service = DemandAnalysisService(
         repository=demand_analysis_repo,
         event_bus=event_bus,
+        snapshot_cache=demand_snapshot_cache,
     )
 
     # Power Capacity service.
@@ -109,6 +247,7 @@ def setup_event_handlers(event_bus: IDomainEventPublisher):
     event_bus.subscribe(StationSearchFailedEvent, StationSearchEventHandler.handle_failure)
     event_bus.subscribe(NoStationsFoundEvent, StationSearchEventHandler.handle_no_results)
     event_bus.subscribe(StationsFoundEvent, StationSearchEventHandler.handle_stations_found)
+    event_bus.subscribe(StationStatisticsQueriedEvent, StationSearchEventHandler.handle_statistics_queried)
     event_bus.subscribe(PostalCodeValidatedEvent, PostalCodeEventHandler.handle_postal_code_validated)
 
     # Subscribe handlers for demand events.
@@ -143,7 +282,15 @@ def main():
             geolocation_service,
             demand_analysis_service,
             power_capacity_service,
-        ) = setup_services(charging_station_repo, geo_data_repo, population_repo, demand_analysis_repo, event_bus)
+        ) = setup_services(
+            charging_station_repo,
+            geo_data_repo,
+            population_repo,
+            demand_analysis_repo,
+            event_bus,
+            demand_snapshot_cache=setup_demand_snapshot_cache(),
+            result_caches=setup_result_caches(),
+        )
 
         # Setup event handlers.
         logger.info("[3/4] Configuring event handlers...")
@@ -152,7 +299,7 @@ def main():
         # Prepare Validation Data (Source of Truth)
         # Furthermore, we retrieve the authoritative list of valid Berlin PLZs from the
         # geolocation service to ensure the UI validation matches the underlying data.
-        valid_berlin_plzs = geolocation_service.get_all_plzs()
+        valid_berlin_plzs = geolocation_service.get_postal_code_registry()
         logger.info("Loaded %d valid postal codes for validation.", len(valid_berlin_plzs))
 
         logger.info("EVision Berlin Application Preparation Complete!")
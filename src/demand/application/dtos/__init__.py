@@ -3,7 +3,9 @@ src.demand.application.dtos - Demand Application DTOs.
 """
 
 from .demand_analysis_dto import DemandAnalysisDTO
+from .demand_snapshot_dto import DemandSnapshotDTO
 
 __all__ = [
     "DemandAnalysisDTO",
+    "DemandSnapshotDTO",
 ]
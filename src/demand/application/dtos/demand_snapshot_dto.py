@@ -0,0 +1,95 @@
+"""
+Data Transfer Object for a city-wide Demand Snapshot.
+"""
+
+import math
+from dataclasses import dataclass, field
+
+from .demand_analysis_dto import DemandAnalysisDTO
+
+
+@dataclass(frozen=True)
+class DemandSnapshotDTO:
+    """
+    DTO holding the demand analysis of all postal code areas, computed in one pass.
+
+    The demand map, the overview tables and the detailed analysis all read from the same
+    snapshot, so the analysis runs once per dataset version and target ratio.
+
+    High-priority areas are ranked by urgency and, within the same urgency, by residents
+    per km², so dense areas where a station serves the most people come first.
+
+    Attributes:
+        target_ratio: Target residents per station the recommendations are based on.
+        analyses: Demand analyses keyed by postal code value, in analysis order.
+        recommendations: Infrastructure recommendations keyed by postal code value.
+        densities: Residents per km² keyed by postal code value, for areas of known size.
+    """
+
+    target_ratio: float
+    analyses: dict[str, DemandAnalysisDTO] = field(default_factory=dict)
+    recommendations: dict[str, dict] = field(default_factory=dict)
+    densities: dict[str, float] = field(default_factory=dict)
+
+    def get_analysis(self, postal_code: str) -> DemandAnalysisDTO | None:
+        """
+        Get the demand analysis of a postal code area.
+
+        Args:
+            postal_code: Postal code value.
+
+        Returns:
+            DemandAnalysisDTO or None if the area was not analyzed.
+        """
+        return self.analyses.get(postal_code)
+
+    def get_recommendations(self, postal_code: str) -> dict | None:
+        """
+        Get the infrastructure recommendations of a postal code area.
+
+        Args:
+            postal_code: Postal code value.
+
+        Returns:
+            Dict with recommendations or None if the area was not analyzed.
+        """
+        return self.recommendations.get(postal_code)
+
+    def get_density(self, postal_code: str) -> float | None:
+        """
+        Get the residents per km² of a postal code area.
+
+        Args:
+            postal_code: Postal code value.
+
+        Returns:
+            Residents per km² or None if the size of the area is unknown.
+        """
+        density = self.densities.get(postal_code)
+        return None if density is None or math.isnan(density) else density
+
+    def get_high_priority_areas(self) -> list[DemandAnalysisDTO]:
+        """
+        Get all high-priority areas sorted by urgency, then by residents per km².
+
+        Returns:
+            List[DemandAnalysisDTO]: High-priority areas, most urgent and densest first.
+        """
+        high_priority = [analysis for analysis in self.analyses.values() if analysis.is_high_priority]
+        return sorted(
+            high_priority,
+            key=lambda analysis: (analysis.urgency_score, self.get_density(analysis.postal_code) or 0.0),
+            reverse=True,
+        )
+
+    def count_by_priority(self) -> dict[str, int]:
+        """
+        Count the analyzed areas per demand priority.
+
+        Returns:
+            Dict mapping priority level (e.g. "High") to the number of areas.
+        """
+        counts: dict[str, int] = {}
+        for analysis in self.analyses.values():
+            counts[analysis.demand_priority] = counts.get(analysis.demand_priority, 0) + 1
+        return counts
@@ -2,13 +2,17 @@
 Demand Application Service for Demand Analysis.
 """
 
+from collections.abc import Callable
+
 from src.shared.infrastructure import get_logger
 
+from src.shared.domain.constants import InfrastructureThresholds
 from src.shared.domain.events import IDomainEventPublisher
 from src.shared.domain.value_objects import PostalCode
 from src.shared.application.services import BaseService
-from src.demand.application.dtos import DemandAnalysisDTO
+from src.demand.application.dtos import DemandAnalysisDTO, DemandSnapshotDTO
 from src.demand.domain.aggregates import DemandAnalysisAggregate
+from src.demand.domain.services import BatchDemandCalculator, BatchDemandResult
 from src.demand.infrastructure.repositories import DemandAnalysisRepository
 
 logger = get_logger(__name__)
@@ -35,8 +39,20 @@ class DemandAnalysisService(BaseService):
         self,
         repository: DemandAnalysisRepository,
         event_bus: IDomainEventPublisher,
+        snapshot_cache: dict[float, DemandSnapshotDTO] | None = None,
     ):
+        """
+        Initialize `DemandAnalysisService`.
+
+        Args:
+            repository: Repository for demand analysis aggregates.
+            event_bus: Publisher for domain events.
+            snapshot_cache: Demand snapshots keyed by target ratio. Pass a cache scoped to the
+                dataset version to share snapshots across reruns and sessions; defaults to a
+                cache private to this service.
+        """
         super().__init__(repository, event_bus)
+        self._snapshot_cache = snapshot_cache if snapshot_cache is not None else {}
 
     def analyze_demand(self, postal_code: str, population: int, station_count: int) -> DemandAnalysisDTO:
         """
@@ -101,6 +117,88 @@ class DemandAnalysisService(BaseService):
 
         return results
 
+    def analyze_areas_batch(
+        self,
+        postal_codes,
+        population,
+        station_count,
+        target_ratio: float = InfrastructureThresholds.TARGET_COVERAGE_RATIO,
+    ) -> BatchDemandResult:
+        """
+        Use case: Analyze demand for many areas or scenarios in one vectorized pass.
+
+        Unlike `analyze_multiple_areas`, no aggregates are stored and no events are
+        published, and postal codes are not validated against the Berlin range.
+
+        Args:
+            postal_codes: Sequence of postal code values
+            population: Sequence of population counts
+            station_count: Sequence of station counts
+            target_ratio: Target residents per station ratio
+
+        Returns:
+            BatchDemandResult: Columnar results in input order
+
+        Raises:
+            ValueError: If the inputs differ in length, counts are negative or the target ratio is not positive
+        """
+
+        result = BatchDemandCalculator.calculate(postal_codes, population, station_count, target_ratio=target_ratio)
+        logger.debug("Analyzed %d areas in batch (target ratio %.0f)", len(result), target_ratio)
+        return result
+
+    def build_demand_snapshot(
+        self, areas: list[dict[str, any]], target_ratio: float = InfrastructureThresholds.TARGET_COVERAGE_RATIO
+    ) -> DemandSnapshotDTO:
+        """
+        Use case: Analyze all areas and their recommendations in one pass.
+
+        Args:
+            areas: List of dicts with 'postal_code', 'population', 'station_count' and
+                optionally 'residents_per_km2', used to rank areas of equal urgency
+            target_ratio: Target residents per station ratio
+
+        Returns:
+            DemandSnapshotDTO: Analyses and recommendations keyed by postal code
+        """
+
+        analyses = {analysis.postal_code: analysis for analysis in self.analyze_multiple_areas(areas)}
+        recommendations = {
+            postal_code: self.get_recommendations(postal_code, target_ratio=target_ratio) for postal_code in analyses
+        }
+        densities = {
+            str(area["postal_code"]): float(area["residents_per_km2"]) for area in areas if "residents_per_km2" in area
+        }
+
+        return DemandSnapshotDTO(
+            target_ratio=target_ratio, analyses=analyses, recommendations=recommendations, densities=densities
+        )
+
+    def get_demand_snapshot(
+        self,
+        load_areas: Callable[[], list[dict[str, any]]],
+        target_ratio: float = InfrastructureThresholds.TARGET_COVERAGE_RATIO,
+    ) -> DemandSnapshotDTO:
+        """
+        Use case: Get the demand snapshot for a target ratio, building it on first access.
+
+        Args:
+            load_areas: Zero-argument callable returning the areas to analyze; only called
+                when no snapshot is cached for the target ratio
+            target_ratio: Target residents per station ratio
+
+        Returns:
+            DemandSnapshotDTO: Cached or newly built snapshot
+        """
+
+        snapshot = self._snapshot_cache.get(target_ratio)
+        if snapshot is None:
+            snapshot = self.build_demand_snapshot(load_areas(), target_ratio=target_ratio)
+            self._snapshot_cache[target_ratio] = snapshot
+            logger.info("Built demand snapshot of %d areas (target ratio %.0f)", len(snapshot.analyses), target_ratio)
+
+        return snapshot
+
     def get_high_priority_areas(self) -> list[DemandAnalysisDTO]:
         """
         Use case: Get all high-priority areas requiring attention.
@@ -174,7 +272,9 @@ class DemandAnalysisService(BaseService):
 
         return DemandAnalysisDTO.from_aggregate(aggregate)
 
-    def get_recommendations(self, postal_code: str, target_ratio: float = 2000.0) -> dict:
+    def get_recommendations(
+        self, postal_code: str, target_ratio: float = InfrastructureThresholds.TARGET_COVERAGE_RATIO
+    ) -> dict:
         """
         Use case: Get infrastructure recommendations for an area.
 
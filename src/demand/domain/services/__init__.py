@@ -2,9 +2,12 @@
 src.demand.domain.services - Demand Domain Services.
 """
 
+from .batch_demand_calculator import BatchDemandCalculator, BatchDemandResult
 from .demand_calculation_service import DemandCalculationService, RegionalDemandAnalysis
 
 __all__ = [
+    "BatchDemandCalculator",
+    "BatchDemandResult",
     "DemandCalculationService",
     "RegionalDemandAnalysis",
 ]
@@ -0,0 +1,168 @@
+"""
+Domain Service for Vectorized Batch Demand Calculations.
+
+This service applies the demand business rules of `DemandPriority` and
+`DemandAnalysisAggregate` to whole arrays of areas at once with NumPy.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.demand.domain.enums import PriorityLevel
+from src.shared.domain.constants import InfrastructureThresholds
+from src.shared.domain.enums import CoverageAssessment
+
+
+@dataclass(frozen=True)
+class BatchDemandResult:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Value object holding columnar demand analysis results.
+
+    Every attribute is a NumPy array with one entry per analyzed area, in input order.
+
+    Attributes:
+        postal_codes: Postal code values
+        population: Population counts
+        station_count: Charging station counts
+        residents_per_station: Residents per station (population if no stations)
+        demand_priority: Priority level values ("High", "Medium", "Low")
+        urgency_score: Urgency scores (25, 50, 75 or 100)
+        is_high_priority: Whether the area is high priority
+        needs_expansion: Whether infrastructure expansion is needed
+        coverage_assessment: Coverage assessment values ("CRITICAL", "POOR", "ADEQUATE", "GOOD")
+        recommended_additional_stations: Stations needed to meet the target ratio
+        target_ratio: Target residents per station the recommendations are based on
+    """
+
+    postal_codes: np.ndarray
+    population: np.ndarray
+    station_count: np.ndarray
+    residents_per_station: np.ndarray
+    demand_priority: np.ndarray
+    urgency_score: np.ndarray
+    is_high_priority: np.ndarray
+    needs_expansion: np.ndarray
+    coverage_assessment: np.ndarray
+    recommended_additional_stations: np.ndarray
+    target_ratio: float
+
+    def __len__(self) -> int:
+        """Return the number of analyzed areas."""
+        return len(self.postal_codes)
+
+    def to_dict(self) -> dict[str, np.ndarray]:
+        """
+        Convert the result to a dictionary of columns, e.g. for `pandas.DataFrame`.
+
+        Returns:
+            dict: Column name to array mapping, using the `DemandAnalysisDTO` field names.
+        """
+        return {
+            "postal_code": self.postal_codes,
+            "population": self.population,
+            "station_count": self.station_count,
+            "demand_priority": self.demand_priority,
+            "residents_per_station": self.residents_per_station,
+            "urgency_score": self.urgency_score,
+            "is_high_priority": self.is_high_priority,
+            "needs_expansion": self.needs_expansion,
+            "coverage_assessment": self.coverage_assessment,
+            "recommended_additional_stations": self.recommended_additional_stations,
+        }
+
+
+class BatchDemandCalculator:
+    """
+    Domain Service: Calculates demand metrics for many areas in one vectorized pass.
+
+    Produces the same priority, urgency, coverage, expansion and recommendation results
+    as `DemandAnalysisAggregate`, without creating aggregates, value objects or events.
+    Use it for bulk and scenario analysis; use the aggregate when events matter.
+    """
+
+    @staticmethod
+    def calculate(
+        postal_codes,
+        population,
+        station_count,
+        target_ratio: float = InfrastructureThresholds.TARGET_COVERAGE_RATIO,
+    ) -> BatchDemandResult:
+        """
+        Calculate demand metrics for all areas at once.
+
+        Args:
+            postal_codes: Sequence of postal code values
+            population: Sequence of non-negative population counts
+            station_count: Sequence of non-negative station counts
+            target_ratio: Target residents per station for recommendations
+
+        Returns:
+            BatchDemandResult: Columnar results in input order
+
+        Raises:
+            ValueError: If the inputs differ in length, counts are negative or the target ratio is not positive
+        """
+        if target_ratio <= 0:
+            raise ValueError("Target ratio must be positive")
+
+        postal_codes = np.asarray(postal_codes, dtype=str)
+        population = np.asarray(population, dtype=np.int64)
+        station_count = np.asarray(station_count, dtype=np.int64)
+
+        if not len(postal_codes) == len(population) == len(station_count):
+            raise ValueError("Postal codes, population and station count must have the same length")
+        if (population < 0).any():
+            raise ValueError("Population cannot be negative")
+        if (station_count < 0).any():
+            raise ValueError("Station count cannot be negative")
+
+        no_stations = station_count == 0
+        residents_per_station = population / np.where(no_stations, 1, station_count)
+
+        # Areas without stations are always high priority, whatever their population.
+        demand_priority = np.select(
+            [
+                no_stations | (residents_per_station > InfrastructureThresholds.HIGH_PRIORITY_THRESHOLD),
+                residents_per_station > InfrastructureThresholds.MEDIUM_PRIORITY_THRESHOLD,
+            ],
+            [PriorityLevel.HIGH.value, PriorityLevel.MEDIUM.value],
+            default=PriorityLevel.LOW.value,
+        )
+
+        urgency_score = np.select(
+            [
+                residents_per_station >= InfrastructureThresholds.CRITICAL_URGENCY_THRESHOLD,
+                residents_per_station >= InfrastructureThresholds.HIGH_URGENCY_THRESHOLD,
+                residents_per_station >= InfrastructureThresholds.MEDIUM_URGENCY_THRESHOLD,
+            ],
+            [100.0, 75.0, 50.0],
+            default=25.0,
+        )
+
+        coverage_assessment = np.select(
+            [
+                residents_per_station > InfrastructureThresholds.CRITICAL_COVERAGE_RATIO,
+                residents_per_station > InfrastructureThresholds.POOR_COVERAGE_RATIO,
+                residents_per_station > InfrastructureThresholds.ADEQUATE_COVERAGE_RATIO,
+            ],
+            [CoverageAssessment.CRITICAL.value, CoverageAssessment.POOR.value, CoverageAssessment.ADEQUATE.value],
+            default=CoverageAssessment.GOOD.value,
+        )
+
+        recommended_total = np.floor(population / target_ratio).astype(np.int64)
+
+        return BatchDemandResult(
+            postal_codes=postal_codes,
+            population=population,
+            station_count=station_count,
+            residents_per_station=residents_per_station,
+            demand_priority=demand_priority,
+            urgency_score=urgency_score,
+            is_high_priority=demand_priority == PriorityLevel.HIGH.value,
+            needs_expansion=residents_per_station > InfrastructureThresholds.EXPANSION_NEEDED_RATIO,
+            coverage_assessment=coverage_assessment,
+            recommended_additional_stations=np.maximum(recommended_total - station_count, 0),
+            target_ratio=float(target_ratio),
+        )
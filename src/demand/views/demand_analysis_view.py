@@ -5,7 +5,6 @@ This view handles visualization of EV charging infrastructure demand analysis,
 following DDD principles by keeping demand-related UI concerns within the Demand context.
 """
 
-import json
 import folium
 import streamlit
 import pandas as pd
@@ -13,14 +12,18 @@ import pandas as pd
 from streamlit_folium import folium_static
 
 from src.shared.infrastructure import get_logger
-from src.shared.domain.value_objects import PostalCode
 from src.shared.application.services import (
     ChargingStationService,
     GeoLocationService,
     PostalCodeResidentService,
 )
+from src.demand.application.dtos import DemandSnapshotDTO
 from src.demand.application.services import DemandAnalysisService
-from src.shared.views.components import get_map_center_and_zoom
+from src.shared.views.components import (
+    add_choropleth_layer,
+    get_map_center_and_zoom,
+    get_map_zoom,
+)
 
 logger = get_logger(__name__)
 
@@ -57,7 +60,7 @@ class DemandAnalysisView:
         self.geolocation_service = geolocation_service
         self.postal_code_residents_service = postal_code_residents_service
 
-    def render_demand_analysis(self, selected_postal_code: str):  # pylint: disable=too-many-locals
+    def render_demand_analysis(self, selected_postal_code: str):
         """
         Render comprehensive demand analysis dashboard.
 
@@ -85,74 +88,70 @@ class DemandAnalysisView:
         )
         demand_map = folium.Map(location=center, zoom_start=zoom, tiles="OpenStreetMap")
 
-        self._render_demand_map(demand_map, selected_postal_code)
+        # Analyze all areas once; the map, the detailed analysis and the tables share the snapshot
+        snapshot = self.demand_analysis_service.get_demand_snapshot(self._collect_areas_data)
+
+        self._render_demand_map(demand_map, selected_postal_code, snapshot)
 
         folium_static(demand_map, width=1400, height=600)
 
-        # Get all postal codes for analysis
+        if snapshot.analyses:
+            # Show detailed analysis for specific postal code
+            if selected_postal_code and selected_postal_code != "All areas":
+                self._render_detailed_analysis(selected_postal_code, snapshot)
+
+            # Show overview table
+            self._render_overview_tables(snapshot)
+        else:
+            streamlit.warning("No data available for demand analysis.")
+
+    def _collect_areas_data(self) -> list[dict]:
+        """
+        Collect population and station count of every postal code area for demand analysis.
+
+        Returns:
+            List of dicts with 'postal_code', 'population', 'station_count' and 'residents_per_km2'.
+        """
         postal_codes = self.postal_code_residents_service.get_all_postal_codes(sort=True)
+        postal_code_areas = self.charging_station_service.get_area_statistics(postal_codes)
+
+        densities = self.postal_code_residents_service.get_area_densities(postal_codes)
+        populations = self.postal_code_residents_service.get_residents_counts(postal_codes).tolist()
 
-        # Collect data for demand analysis
         areas_data = []
-        for postal_code in postal_codes:
-            resident_data = self.postal_code_residents_service.get_resident_data(postal_code)
-            postal_code_area = self.charging_station_service.search_by_postal_code(postal_code)
+        for postal_code, population, residents_per_km2 in zip(
+            postal_codes, populations, densities.residents_per_km2.tolist()
+        ):
+            postal_code_area = postal_code_areas.get(postal_code.value)
 
-            if resident_data and postal_code_area:
+            if postal_code_area:
                 areas_data.append(
                     {
                         "postal_code": postal_code.value,
-                        "population": resident_data.get_population(),
+                        "population": population,
                         "station_count": postal_code_area.station_count,
+                        "residents_per_km2": residents_per_km2,
                     }
                 )
 
-        # Perform batch analysis
-        if areas_data:
-            analyses = self.demand_analysis_service.analyze_multiple_areas(areas_data)
-
-            # Show detailed analysis for specific postal code
-            if selected_postal_code and selected_postal_code != "All areas":
-                self._render_detailed_analysis(selected_postal_code)
-
-            # Show overview table
-            self._render_overview_tables(analyses)
-        else:
-            streamlit.warning("No data available for demand analysis.")
+        return areas_data
 
-    def _render_demand_map(self, folium_map: folium.Map, selected_postal_code: str):  # pylint: disable=too-many-locals
+    def _render_demand_map(
+        self, folium_map: folium.Map, selected_postal_code: str, snapshot: DemandSnapshotDTO
+    ):  # pylint: disable=too-many-locals
         """
         Render demand analysis map with color-coded priority levels.
 
         Args:
             folium_map: The Folium map object to add the visualization to.
             selected_postal_code: Currently selected postal code for highlighting.
+            snapshot: Demand snapshot of all postal code areas.
         """
         try:
-            postal_codes = self.postal_code_residents_service.get_all_postal_codes(sort=True)
-
-            # Collect data and perform demand analysis
-            areas_data = []
-            for postal_code in postal_codes:
-                resident_data = self.postal_code_residents_service.get_resident_data(postal_code)
-                postal_code_area = self.charging_station_service.search_by_postal_code(postal_code)
-
-                if resident_data and postal_code_area:
-                    areas_data.append(
-                        {
-                            "postal_code": postal_code.value,
-                            "population": resident_data.get_population(),
-                            "station_count": postal_code_area.station_count,
-                        }
-                    )
-
-            if not areas_data:
+            if not snapshot.analyses:
                 streamlit.warning("No data available for demand map visualization.")
                 return
 
-            # Perform batch analysis
-            results = self.demand_analysis_service.analyze_multiple_areas(areas_data)
-
             # Define color mapping for priorities
             priority_colors = {
                 "High": "#ff6b6b",
@@ -160,61 +159,46 @@ class DemandAnalysisView:
                 "Low": "#6bcf7f",
             }
 
-            areas_rendered = 0
-
-            # Render each postal code area with color-coded priority
-            for analysis in results:
-                try:
-                    plz = analysis.postal_code
-                    priority = analysis.demand_priority
-                    postal_code_obj = PostalCode(plz)
-
-                    plz_geometry = self.geolocation_service.get_geolocation_data_for_postal_code(postal_code_obj)
-
-                    if plz_geometry is not None and plz_geometry.boundary is not None:
-                        fill_color = priority_colors.get(priority, "#cccccc")
-
-                        border_color = "#000000" if plz == selected_postal_code else "#666666"
-                        border_weight = 3 if plz == selected_postal_code else 1
-
-                        boundary_geojson = json.loads(plz_geometry.boundary.to_json())
-
-                        urgency_score = analysis.urgency_score
-                        residents_per_station = analysis.residents_per_station
-
-                        tooltip_html = (
-                            f"<b>Postal Code: {plz}</b><br>"
-                            f"Priority: {priority}<br>"
-                            f"Population: {analysis.population:,}<br>"
-                            f"Stations: {analysis.station_count}<br>"
-                            f"Residents/Station: {residents_per_station:.0f}<br>"
-                            f"Urgency Score: {urgency_score:.0f}/100"
-                        )
-
-                        folium.GeoJson(
-                            boundary_geojson,
-                            name=f"PLZ {plz} - {priority}",
-                            style_function=lambda x, color=fill_color, border=border_color, weight=border_weight: {
-                                "fillColor": color,
-                                "color": border,
-                                "weight": weight,
-                                "fillOpacity": 0.7,
-                            },
-                            tooltip=tooltip_html,
-                        ).add_to(folium_map)
-                        areas_rendered += 1
-                except Exception as e:
-                    logger.warning("Could not render demand map for postal code: %s", e)
+            # Render all postal code areas as one layer color-coded by priority
+            properties = {}
+            for analysis in snapshot.analyses.values():
+                is_selected = analysis.postal_code == selected_postal_code
+                properties[analysis.postal_code] = {
+                    "fill_color": priority_colors.get(analysis.demand_priority, "#cccccc"),
+                    "line_color": "#000000" if is_selected else "#666666",
+                    "line_weight": 3 if is_selected else 1,
+                    "priority": analysis.demand_priority,
+                    "population": f"{analysis.population:,}",
+                    "stations": str(analysis.station_count),
+                    "residents_per_station": f"{analysis.residents_per_station:.0f}",
+                    "urgency_score": f"{analysis.urgency_score:.0f}/100",
+                }
+
+            areas_rendered = add_choropleth_layer(
+                folium_map,
+                self.geolocation_service.get_boundaries_topology(get_map_zoom(folium_map)),
+                properties,
+                name="Demand priority by postal code",
+                tooltip_fields={
+                    "PLZ": "Postal Code",
+                    "priority": "Priority",
+                    "population": "Population",
+                    "stations": "Stations",
+                    "residents_per_station": "Residents/Station",
+                    "urgency_score": "Urgency Score",
+                },
+            )
+            logger.info("✓ Rendered %d postal code areas by demand priority", areas_rendered)
 
         except Exception as e:
             logger.error("Error rendering demand analysis map: %s", e, exc_info=True)
             streamlit.error(f"Error rendering demand analysis map: {e}")
 
-    def _render_detailed_analysis(self, selected_postal_code: str):
+    def _render_detailed_analysis(self, selected_postal_code: str, snapshot: DemandSnapshotDTO):
         """Render detailed analysis for a specific postal code."""
         streamlit.subheader(f"🔍 Detailed Analysis: {selected_postal_code}")
 
-        analysis = self.demand_analysis_service.get_demand_analysis(selected_postal_code)
+        analysis = snapshot.get_analysis(selected_postal_code)
 
         if analysis:
             # Display metrics
@@ -251,15 +235,13 @@ class DemandAnalysisView:
             streamlit.markdown("---")
             streamlit.subheader("💡 Recommendations")
 
-            recommendations = self.demand_analysis_service.get_recommendations(
-                selected_postal_code, target_ratio=2000.0
-            )
+            recommendations = snapshot.get_recommendations(selected_postal_code)
 
             if recommendations["recommended_additional_stations"] > 0:
                 streamlit.warning(
                     f"🚨 **Action Needed**: This area requires approximately "
                     f"**{recommendations['recommended_additional_stations']} additional charging stations** "
-                    f"to meet the target ratio of 2,000 residents per station."
+                    f"to meet the target ratio of {snapshot.target_ratio:,.0f} residents per station."
                 )
             else:
                 streamlit.success("✅ This area has adequate charging infrastructure coverage.")
@@ -274,14 +256,17 @@ class DemandAnalysisView:
         else:
             streamlit.warning(f"No analysis data available for {selected_postal_code}")
 
-    def _render_overview_tables(self, analyses: list):  # pylint: disable=too-many-locals
-        """Render overview tables with all analyses."""
+    def _render_overview_tables(self, snapshot: DemandSnapshotDTO):  # pylint: disable=too-many-locals
+        """Render overview tables with all analyses of the snapshot."""
         streamlit.markdown("---")
         streamlit.subheader("📋 Overview: All Postal Code Areas")
 
         # Get high priority areas
-        high_priority_areas = self.demand_analysis_service.get_high_priority_areas()
-        high_priority_dicts = [area.to_dict() for area in high_priority_areas]
+        high_priority_areas = snapshot.get_high_priority_areas()
+        high_priority_dicts = [
+            {**area.to_dict(), "residents_per_km2": snapshot.get_density(area.postal_code)}
+            for area in high_priority_areas
+        ]
 
         if high_priority_dicts:
             streamlit.markdown(f"**🔴 {len(high_priority_dicts)} High Priority Areas Identified**")
@@ -293,6 +278,7 @@ class DemandAnalysisView:
                     "population",
                     "station_count",
                     "residents_per_station",
+                    "residents_per_km2",
                     "urgency_score",
                     "coverage_assessment",
                 ]
@@ -302,18 +288,20 @@ class DemandAnalysisView:
                 "Population",
                 "Stations",
                 "Residents/Station",
+                "Residents/km²",
                 "Urgency Score",
                 "Coverage",
             ]
-            high_priority_df = high_priority_df.sort_values("Urgency Score", ascending=False)
+            high_priority_df["Residents/km²"] = high_priority_df["Residents/km²"].round(0)
 
+            # Rows keep the snapshot ranking: most urgent first, denser areas first within the same urgency
             streamlit.dataframe(high_priority_df, width="stretch", hide_index=True)
 
         # Display overview table with color-coded priority visualization
         streamlit.markdown("---")
         streamlit.subheader("📊 All Areas Analysis")
 
-        results_dicts = [analysis.to_dict() for analysis in analyses]
+        results_dicts = [analysis.to_dict() for analysis in snapshot.analyses.values()]
         results_df = pd.DataFrame(results_dicts)
         results_df = results_df[
             [
@@ -351,9 +339,10 @@ class DemandAnalysisView:
 
         col_stat1, col_stat2, col_stat3 = streamlit.columns(3)
 
-        high_count = len([r for r in analyses if r.demand_priority == "High"])
-        medium_count = len([r for r in analyses if r.demand_priority == "Medium"])
-        low_count = len([r for r in analyses if r.demand_priority == "Low"])
+        priority_counts = snapshot.count_by_priority()
+        high_count = priority_counts.get("High", 0)
+        medium_count = priority_counts.get("Medium", 0)
+        low_count = priority_counts.get("Low", 0)
 
         with col_stat1:
             streamlit.metric("🔴 High Priority Areas", high_count)
@@ -57,3 +57,26 @@ class PostalCodeAreaDTO:
             is_well_equipped=aggregate.is_well_equipped(),
             coverage_level=aggregate.get_coverage_level().value,
         )
+
+    @staticmethod
+    def from_statistics(postal_code: str, statistics) -> "PostalCodeAreaDTO":
+        """
+        Create DTO from precomputed station statistics.
+
+        Args:
+            postal_code: The postal code value as string
+            statistics: StationStatistics value object of the area
+
+        Returns:
+            PostalCodeAreaDTO: Immutable data transfer object
+        """
+        return PostalCodeAreaDTO(
+            postal_code=postal_code,
+            station_count=statistics.station_count,
+            fast_charger_count=statistics.fast_charger_count,
+            total_capacity_kw=statistics.total_capacity_kw,
+            average_power_kw=statistics.get_average_power_kw(),
+            has_fast_charging=statistics.has_fast_charging(),
+            is_well_equipped=statistics.is_well_equipped(),
+            coverage_level=statistics.get_coverage_level().value,
+        )
@@ -4,7 +4,7 @@ Discovery Domain Aggregate - Postal Code Area Aggregate Module.
 
 from src.shared.domain.entities import ChargingStation
 from src.shared.domain.aggregates import BaseAggregate
-from src.shared.domain.value_objects import PostalCode
+from src.shared.domain.value_objects import PostalCode, StationStatistics
 from src.shared.domain.enums import CoverageLevel
 from src.shared.domain.events import (
     StationSearchPerformedEvent,
@@ -13,7 +13,6 @@ from src.shared.domain.events import (
     StationsFoundEvent,
     PostalCodeValidatedEvent,
 )
-from src.shared.domain.constants import InfrastructureThresholds
 
 
 class PostalCodeAreaAggregate(BaseAggregate):
@@ -168,6 +167,19 @@ class PostalCodeAreaAggregate(BaseAggregate):
         """
         return self.get_fast_charger_count() > 0
 
+    def get_statistics(self) -> StationStatistics:
+        """
+        Query: Aggregated metrics of the stations in this area.
+
+        Returns:
+            StationStatistics: Station count, fast charger count and total capacity.
+        """
+        return StationStatistics(
+            station_count=self.get_station_count(),
+            fast_charger_count=self.get_fast_charger_count(),
+            total_capacity_kw=self.get_total_capacity_kw(),
+        )
+
     def is_well_equipped(self) -> bool:
         """
         Business rule: Determine if area is well-equipped with charging infrastructure.
@@ -179,10 +191,7 @@ class PostalCodeAreaAggregate(BaseAggregate):
         Returns:
             bool: True if area meets well-equipped criteria.
         """
-        return (
-            self.get_station_count() >= InfrastructureThresholds.WELL_EQUIPPED_STATION_COUNT
-            or self.get_fast_charger_count() >= InfrastructureThresholds.WELL_EQUIPPED_FAST_CHARGER_COUNT
-        )
+        return self.get_statistics().is_well_equipped()
 
     def get_coverage_level(self) -> CoverageLevel:
         """
@@ -198,26 +207,7 @@ class PostalCodeAreaAggregate(BaseAggregate):
         Returns:
             CoverageLevel: Coverage level assessment.
         """
-        count = self.get_station_count()
-        fast_count = self.get_fast_charger_count()
-
-        if count == 0:
-            return CoverageLevel.NO_COVERAGE
-
-        if (
-            count >= InfrastructureThresholds.EXCELLENT_COVERAGE_STATION_COUNT
-            and fast_count >= InfrastructureThresholds.EXCELLENT_COVERAGE_FAST_CHARGER_COUNT
-        ):
-            return CoverageLevel.EXCELLENT
-        if (
-            count >= InfrastructureThresholds.GOOD_COVERAGE_STATION_COUNT
-            and fast_count >= InfrastructureThresholds.GOOD_COVERAGE_FAST_CHARGER_COUNT
-        ):
-            return CoverageLevel.GOOD
-        if count >= InfrastructureThresholds.ADEQUATE_COVERAGE_THRESHOLD:
-            return CoverageLevel.ADEQUATE
-
-        return CoverageLevel.POOR
+        return self.get_statistics().get_coverage_level()
 
     def get_stations_by_category(self) -> dict:
         """
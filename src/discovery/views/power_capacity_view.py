@@ -5,7 +5,6 @@ This view handles visualization of charging station power capacity,
 following DDD principles by keeping capacity-related UI concerns within Discovery.
 """
 
-import json
 import folium
 import streamlit
 
@@ -16,6 +15,7 @@ from src.shared.application.services import (
     PostalCodeResidentService,
     PowerCapacityService,
 )
+from src.shared.views.components import add_choropleth_layer, get_map_zoom
 
 logger = get_logger(__name__)
 
@@ -103,11 +103,11 @@ class PowerCapacityView:
     ):
         """Render specific postal code with capacity data."""
         postal_code_obj = PostalCode(selected_postal_code)
-        plz_geometry = self.geolocation_service.get_geolocation_data_for_postal_code(postal_code_obj)
+        boundary_geojson = self.geolocation_service.get_boundary_geojson(postal_code_obj, get_map_zoom(folium_map))
 
         plz_capacity_list = [dto for dto in capacity_dtos if dto.postal_code == selected_postal_code]
 
-        if plz_geometry is not None and plz_geometry.boundary is not None and plz_capacity_list:
+        if boundary_geojson is not None and plz_capacity_list:
             plz_capacity = plz_capacity_list[0]
             capacity_value = plz_capacity.total_capacity_kw
             station_count = plz_capacity.station_count
@@ -115,7 +115,6 @@ class PowerCapacityView:
 
             color = self.power_capacity_service.get_color_for_capacity(capacity_value, max_capacity)
 
-            boundary_geojson = json.loads(plz_geometry.boundary.to_json())
             folium.GeoJson(
                 boundary_geojson,
                 name=f"Postal Code {selected_postal_code}",
@@ -137,37 +136,29 @@ class PowerCapacityView:
 
     def _render_all_areas_capacity(self, folium_map: folium.Map, capacity_dtos: list, max_capacity: float):
         """Render all postal code areas with capacity data."""
-        areas_rendered = 0
-        for dto in capacity_dtos:
-            plz = dto.postal_code
-            capacity = dto.total_capacity_kw
-            station_count = dto.station_count
-            category = dto.capacity_category
-
-            postal_code_obj = PostalCode(plz)
-            plz_geometry = self.geolocation_service.get_geolocation_data_for_postal_code(postal_code_obj)
-
-            if plz_geometry is not None and plz_geometry.boundary is not None:
-                try:
-                    color = self.power_capacity_service.get_color_for_capacity(capacity, max_capacity)
-                    boundary_geojson = json.loads(plz_geometry.boundary.to_json())
-
-                    folium.GeoJson(
-                        boundary_geojson,
-                        name=f"PLZ {plz}",
-                        style_function=lambda x, color=color: {
-                            "fillColor": color,
-                            "color": "#666666",
-                            "weight": 1,
-                            "fillOpacity": 0.7,
-                        },
-                        tooltip=(
-                            f"Postal Code: {plz}<br>"
-                            f"Total Capacity: {capacity:.0f} kW<br>"
-                            f"Stations: {station_count}<br>"
-                            f"Category: {category or 'N/A'}"
-                        ),
-                    ).add_to(folium_map)
-                    areas_rendered += 1
-                except Exception as e:
-                    logger.warning("Could not render postal code %s: %s", plz, e)
+        colors = self.power_capacity_service.get_colors_for_capacities(
+            [dto.total_capacity_kw for dto in capacity_dtos], max_capacity
+        )
+
+        properties = {}
+        for dto, color in zip(capacity_dtos, colors):
+            properties[dto.postal_code] = {
+                "fill_color": color,
+                "capacity": f"{dto.total_capacity_kw:.0f} kW",
+                "stations": str(dto.station_count),
+                "category": dto.capacity_category or "N/A",
+            }
+
+        areas_rendered = add_choropleth_layer(
+            folium_map,
+            self.geolocation_service.get_boundaries_topology(get_map_zoom(folium_map)),
+            properties,
+            name="Power capacity by postal code",
+            tooltip_fields={
+                "PLZ": "Postal Code",
+                "capacity": "Total Capacity",
+                "stations": "Stations",
+                "category": "Category",
+            },
+        )
+        logger.info("✓ Rendered %d postal code areas by power capacity", areas_rendered)
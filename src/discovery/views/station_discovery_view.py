@@ -5,18 +5,19 @@ This view handles visualization of charging stations and postal code areas,
 following DDD principles by keeping UI concerns within the Discovery context.
 """
 
-import json
 import folium
 import streamlit
 import pandas as pd
 
 from src.shared.infrastructure import get_logger
+from src.shared.infrastructure.visualization import GREEN_RAMP, ORANGE_RAMP, PURPLE_RAMP
 from src.shared.domain.value_objects import PostalCode
 from src.shared.application.services import (
     ChargingStationService,
     GeoLocationService,
     PostalCodeResidentService,
 )
+from src.shared.views.components import add_choropleth_layer, add_station_cluster_layer, get_map_zoom
 
 logger = get_logger(__name__)
 
@@ -28,7 +29,7 @@ class StationDiscoveryView:
     Responsibilities:
     - Render charging station map markers
     - Display postal code boundaries
-    - Visualize resident distribution
+    - Visualize resident distribution and density
     - Handle map interactions for station discovery
     """
 
@@ -74,11 +75,10 @@ class StationDiscoveryView:
         postal_code_obj = PostalCode(selected_postal_code)
 
         # Render boundary
-        plz_geometry = self.geolocation_service.get_geolocation_data_for_postal_code(postal_code_obj)
+        boundary_geojson = self.geolocation_service.get_boundary_geojson(postal_code_obj, get_map_zoom(folium_map))
 
-        if plz_geometry is not None and plz_geometry.boundary is not None:
+        if boundary_geojson is not None:
             try:
-                boundary_geojson = json.loads(plz_geometry.boundary.to_json())
                 folium.GeoJson(
                     boundary_geojson,
                     name=f"Postal Code {selected_postal_code}",
@@ -100,39 +100,7 @@ class StationDiscoveryView:
         stations = self.charging_station_service.find_stations_by_postal_code(postal_code_obj)
         logger.info("Found %d charging stations", len(stations))
 
-        for station in stations:
-            # Create custom icon with electric charging symbol
-            icon_html = """
-            <div style="
-                background-color: #1bbc9b;
-                border: 3px solid #148f77;
-                border-radius: 50%;
-                width: 32px;
-                height: 32px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                font-size: 18px;
-                color: white;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.3);
-            ">⚡</div>
-            """
-
-            popup_content = f"""
-            <div style="font-family: Arial; min-width: 150px;">
-                <b>⚡ Charging Station</b><br>
-                <hr style="margin: 5px 0;">
-                📍 <b>PLZ:</b> {station.postal_code.value}<br>
-                🔋 <b>Power:</b> {station.power_capacity.kilowatts} kW
-            </div>
-            """
-
-            folium.Marker(
-                location=[station.latitude, station.longitude],
-                popup=folium.Popup(popup_content, max_width=250),
-                tooltip=f"⚡ {station.power_capacity.kilowatts} kW",
-                icon=folium.DivIcon(html=icon_html),
-            ).add_to(folium_map)
+        add_station_cluster_layer(folium_map, stations, name=f"Charging stations {selected_postal_code}")
 
     def _render_all_areas_by_station_count(self, folium_map: folium.Map):  # pylint: disable=too-many-locals
         """Render all postal codes colored by station count."""
@@ -140,14 +108,15 @@ class StationDiscoveryView:
 
         postal_codes = self.postal_code_residents_service.get_all_postal_codes(sort=True)
 
+        postal_code_areas = self.charging_station_service.get_area_statistics(postal_codes)
+
+        populations = self.postal_code_residents_service.get_residents_counts(postal_codes).tolist()
+
         station_data = []
-        for postal_code in postal_codes:
-            postal_code_area = self.charging_station_service.search_by_postal_code(postal_code)
+        for postal_code, population in zip(postal_codes, populations):
+            postal_code_area = postal_code_areas.get(postal_code.value)
             station_count = postal_code_area.station_count if postal_code_area else 0
 
-            resident_data = self.postal_code_residents_service.get_resident_data(postal_code)
-            population = resident_data.get_population() if resident_data else 0
-
             station_data.append(
                 {"postal_code": postal_code.value, "station_count": station_count, "population": population}
             )
@@ -157,54 +126,34 @@ class StationDiscoveryView:
             return
 
         stations_df = pd.DataFrame(station_data)
-        max_stations = stations_df["station_count"].max()
-        min_stations = stations_df["station_count"].min()
 
-        areas_rendered = 0
-
-        for _, row in stations_df.iterrows():
-            try:
-                plz = row["postal_code"]
-                station_count = row["station_count"]
-                population = row["population"]
-
-                postal_code_obj = PostalCode(plz)
-                plz_geometry = self.geolocation_service.get_geolocation_data_for_postal_code(postal_code_obj)
-
-                if plz_geometry is not None and plz_geometry.boundary is not None:
-                    # Calculate color based on station count (green gradient)
-                    if max_stations > min_stations:
-                        normalized = (station_count - min_stations) / (max_stations - min_stations)
-                    else:
-                        normalized = 0.5
-
-                    # Color gradient from light green to dark green
-                    r = int(200 - (200 - 27) * normalized)
-                    g = int(230 - (230 - 94) * normalized)
-                    b = int(201 - (201 - 32) * normalized)
-                    fill_color = f"#{r:02x}{g:02x}{b:02x}"
-
-                    boundary_geojson = json.loads(plz_geometry.boundary.to_json())
-
-                    folium.GeoJson(
-                        boundary_geojson,
-                        name=f"PLZ {plz}",
-                        style_function=lambda x, color=fill_color: {
-                            "fillColor": color,
-                            "color": "#666666",
-                            "weight": 1,
-                            "fillOpacity": 0.7,
-                        },
-                        tooltip=(
-                            f"Postal Code: {plz}<br>👥 Population: {population:,}<br>⚡ Stations: {station_count}"
-                        ),
-                    ).add_to(folium_map)
-                    areas_rendered += 1
-            except Exception as e:
-                logger.warning("Could not render postal code %s: %s", plz, e)
+        # Color by station count (light to dark green)
+        colors = GREEN_RAMP.colors(stations_df["station_count"].to_numpy())
+
+        properties = {}
+        for row, color in zip(stations_df.itertuples(index=False), colors):
+            properties[row.postal_code] = {
+                "fill_color": color,
+                "population": f"{row.population:,}",
+                "stations": str(row.station_count),
+            }
+
+        areas_rendered = add_choropleth_layer(
+            folium_map,
+            self.geolocation_service.get_boundaries_topology(get_map_zoom(folium_map)),
+            properties,
+            name="Charging stations by postal code",
+            tooltip_fields={"PLZ": "Postal Code", "population": "👥 Population", "stations": "⚡ Stations"},
+        )
 
         logger.info("✓ Rendered %d postal code areas by station count", areas_rendered)
 
+        stations_by_postal_code = self.charging_station_service.find_stations_by_postal_codes(postal_codes)
+        stations_rendered = add_station_cluster_layer(
+            folium_map, (station for stations in stations_by_postal_code.values() for station in stations)
+        )
+        logger.info("✓ Rendered %d charging stations", stations_rendered)
+
     def render_residents_layer(self, folium_map: folium.Map, selected_postal_code: str):
         """
         Render population density visualization on the map.
@@ -228,13 +177,12 @@ class StationDiscoveryView:
         logger.info("=== Rendering residents layer for PLZ: %s ===", selected_postal_code)
         postal_code_obj = PostalCode(selected_postal_code)
 
-        plz_geometry = self.geolocation_service.get_geolocation_data_for_postal_code(postal_code_obj)
+        boundary_geojson = self.geolocation_service.get_boundary_geojson(postal_code_obj, get_map_zoom(folium_map))
         resident_data = self.postal_code_residents_service.get_resident_data(postal_code_obj)
 
-        if plz_geometry is not None and plz_geometry.boundary is not None and resident_data:
+        if boundary_geojson is not None and resident_data:
             try:
                 population = resident_data.get_population()
-                boundary_geojson = json.loads(plz_geometry.boundary.to_json())
 
                 folium.GeoJson(
                     boundary_geojson,
@@ -261,64 +209,107 @@ class StationDiscoveryView:
 
         postal_codes = self.postal_code_residents_service.get_all_postal_codes(sort=True)
 
-        population_data = []
-        for postal_code in postal_codes:
-            resident_data = self.postal_code_residents_service.get_resident_data(postal_code)
-            if resident_data:
-                population_data.append({"postal_code": postal_code.value, "population": resident_data.get_population()})
+        postal_code_areas = self.charging_station_service.get_area_statistics(postal_codes)
+
+        populations = self.postal_code_residents_service.get_residents_counts(postal_codes).tolist()
+        population_data = [
+            {"postal_code": postal_code.value, "population": population}
+            for postal_code, population in zip(postal_codes, populations)
+        ]
 
         if not population_data:
             streamlit.warning("No population data available for visualization.")
             return
 
         pop_df = pd.DataFrame(population_data)
-        max_population = pop_df["population"].max()
-        min_population = pop_df["population"].min()
 
-        areas_rendered = 0
+        # Color by population (light to dark orange)
+        colors = ORANGE_RAMP.colors(pop_df["population"].to_numpy())
 
-        for _, row in pop_df.iterrows():
-            try:
-                plz = row["postal_code"]
-                population = row["population"]
-
-                postal_code_obj = PostalCode(plz)
-                plz_geometry = self.geolocation_service.get_geolocation_data_for_postal_code(postal_code_obj)
-
-                if plz_geometry is not None and plz_geometry.boundary is not None:
-                    postal_code_area = self.charging_station_service.search_by_postal_code(postal_code_obj)
-                    station_count = postal_code_area.station_count if postal_code_area else 0
-
-                    # Calculate color based on population (orange gradient)
-                    normalized = (
-                        (population - min_population) / (max_population - min_population)
-                        if max_population > min_population
-                        else 0.5
-                    )
-
-                    # Color gradient from light orange to dark orange
-                    r = int(255 - (255 - 230) * normalized)
-                    g = int(224 - (224 - 81) * normalized)
-                    b = int(178 - (178 - 0) * normalized)
-                    fill_color = f"#{r:02x}{g:02x}{b:02x}"
-
-                    boundary_geojson = json.loads(plz_geometry.boundary.to_json())
-
-                    folium.GeoJson(
-                        boundary_geojson,
-                        name=f"PLZ {plz}",
-                        style_function=lambda x, color=fill_color: {
-                            "fillColor": color,
-                            "color": "#666666",
-                            "weight": 1,
-                            "fillOpacity": 0.7,
-                        },
-                        tooltip=(
-                            f"Postal Code: {plz}<br>👥 Population: {population:,}<br>⚡ Stations: {station_count}"
-                        ),
-                    ).add_to(folium_map)
-                    areas_rendered += 1
-            except Exception as e:
-                logger.warning("Could not render postal code %s: %s", plz, e)
+        properties = {}
+        for row, color in zip(pop_df.itertuples(index=False), colors):
+            postal_code_area = postal_code_areas.get(row.postal_code)
+            station_count = postal_code_area.station_count if postal_code_area else 0
+
+            properties[row.postal_code] = {
+                "fill_color": color,
+                "population": f"{row.population:,}",
+                "stations": str(station_count),
+            }
+
+        areas_rendered = add_choropleth_layer(
+            folium_map,
+            self.geolocation_service.get_boundaries_topology(get_map_zoom(folium_map)),
+            properties,
+            name="Residents by postal code",
+            tooltip_fields={"PLZ": "Postal Code", "population": "👥 Population", "stations": "⚡ Stations"},
+        )
 
         logger.info("✓ Rendered %d postal code areas by population", areas_rendered)
+
+    def render_density_layer(self, folium_map: folium.Map, selected_postal_code: str):
+        """
+        Render residents, charging stations and charging power per km² of all postal code areas.
+
+        Args:
+            folium_map: The Folium map object to add layer to.
+            selected_postal_code: The selected postal code to highlight.
+        """
+        try:
+            self._render_all_areas_by_density(folium_map, selected_postal_code)
+
+        except Exception as e:
+            logger.error("Error loading density layer: %s", e, exc_info=True)
+            streamlit.error(f"Error loading density layer: {e}")
+
+    def _render_all_areas_by_density(self, folium_map: folium.Map, selected_postal_code: str):
+        """Render all postal codes colored by residents per km², highlighting the selected one."""
+        logger.info("=== Rendering all postal codes by population density ===")
+
+        postal_codes = self.postal_code_residents_service.get_all_postal_codes(sort=True)
+        if not postal_codes:
+            streamlit.warning("No population data available for visualization.")
+            return
+
+        postal_code_areas = self.charging_station_service.get_area_statistics(postal_codes)
+        area_stats = [postal_code_areas.get(postal_code.value) for postal_code in postal_codes]
+        densities = self.postal_code_residents_service.get_area_densities(
+            postal_codes,
+            station_counts=[area.station_count if area else 0 for area in area_stats],
+            total_capacity_kw=[area.total_capacity_kw if area else 0.0 for area in area_stats],
+        )
+
+        # Color by residents per km² (light to dark purple); areas of unknown size get the no-data color
+        colors = PURPLE_RAMP.colors(densities.residents_per_km2)
+
+        properties = {}
+        for postal_code, color, residents, stations, power in zip(
+            densities.postal_codes.tolist(),
+            colors,
+            densities.residents_per_km2.tolist(),
+            densities.stations_per_km2.tolist(),
+            densities.kw_per_km2.tolist(),
+        ):
+            properties[postal_code] = {
+                "fill_color": color,
+                "residents_per_km2": f"{residents:,.0f}",
+                "stations_per_km2": f"{stations:.1f}",
+                "kw_per_km2": f"{power:,.0f}",
+            }
+            if postal_code == selected_postal_code:
+                properties[postal_code].update(line_color="#000000", line_weight=3)
+
+        areas_rendered = add_choropleth_layer(
+            folium_map,
+            self.geolocation_service.get_boundaries_topology(get_map_zoom(folium_map)),
+            properties,
+            name="Population density by postal code",
+            tooltip_fields={
+                "PLZ": "Postal Code",
+                "residents_per_km2": "👥 Residents/km²",
+                "stations_per_km2": "⚡ Stations/km²",
+                "kw_per_km2": "🔋 kW/km²",
+            },
+        )
+
+        logger.info("✓ Rendered %d postal code areas by population density", areas_rendered)
@@ -9,6 +9,7 @@ from src.shared.domain.events import (
     StationSearchFailedEvent,
     NoStationsFoundEvent,
     StationsFoundEvent,
+    StationStatisticsQueriedEvent,
 )
 
 logger = get_logger(__name__)
@@ -22,6 +23,7 @@ class StationSearchEventHandler:
     - Log search operations for auditing
     - Log search failures for debugging and monitoring
     - Log searches with no results for coverage gap analysis
+    - Log bulk statistics queries for usage tracking
     """
 
     @staticmethod
@@ -79,3 +81,18 @@ class StationSearchEventHandler:
             event.postal_code.value,
             event.stations_found,
         )
+
+    @staticmethod
+    def handle_statistics_queried(event: StationStatisticsQueriedEvent) -> None:
+        """
+        Handle station statistics queried event.
+
+        Args:
+            event: The StationStatisticsQueriedEvent instance.
+        """
+        logger.info(
+            "[EVENT] Station statistics queried for %d postal codes (%d stations, %d areas without stations)",
+            event.postal_codes_queried,
+            event.stations_total,
+            event.areas_without_stations,
+        )
@@ -2,8 +2,14 @@
 Shared Application Base Service
 """
 
-from src.shared.domain.events import IDomainEventPublisher
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+from src.shared.domain.events import DomainEvent, IDomainEventPublisher
 from src.shared.domain.aggregates import BaseAggregate
+from src.shared.infrastructure.caching import CacheStats, LRUCache
+
+T = TypeVar("T")
 
 
 class BaseService:
@@ -11,9 +17,12 @@ class BaseService:
     Base Service class for Application Services.
     """
 
-    def __init__(self, repository, event_bus: IDomainEventPublisher | None = None):
+    def __init__(
+        self, repository, event_bus: IDomainEventPublisher | None = None, result_cache: LRUCache | None = None
+    ):
         self._repository = repository
         self._event_bus = event_bus
+        self._result_cache = result_cache
 
     @property
     def repository(self):
@@ -25,6 +34,41 @@ class BaseService:
         """Get the event bus instance."""
         return self._event_bus
 
+    @property
+    def result_cache_stats(self) -> CacheStats | None:
+        """Get the counters of the result cache, or None if results are not cached."""
+        return self._result_cache.stats if self._result_cache is not None else None
+
+    def _get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Serve a result from the result cache, computing it on a miss.
+
+        Without a result cache, the result is computed on every call.
+
+        Args:
+            key (Hashable): Cache key, e.g. a postal code value.
+            compute (Callable): Zero-argument callable computing the result.
+
+        Returns:
+            The cached or newly computed result.
+        """
+        if self._result_cache is None:
+            return compute()
+        return self._result_cache.get_or_compute(key, compute)
+
+    def publish_event(self, event: DomainEvent):
+        """
+        Publish a single domain event that is not raised by an aggregate.
+
+        Args:
+            event (DomainEvent): Event to publish
+        """
+
+        if self._event_bus is None:
+            return
+
+        self._event_bus.publish(event)
+
     def publish_events(self, aggregate: BaseAggregate):
         """
         Publish all domain events from the aggregate.
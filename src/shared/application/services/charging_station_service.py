@@ -2,9 +2,17 @@
 Shared Application Service for Charging Station operations.
 """
 
-from src.shared.domain.events import IDomainEventPublisher
+from collections.abc import Iterable
+
+from src.shared.domain.events import (
+    IDomainEventPublisher,
+    NoStationsFoundEvent,
+    StationsFoundEvent,
+    StationStatisticsQueriedEvent,
+)
 from src.shared.domain.entities import ChargingStation
 from src.shared.domain.value_objects import PostalCode
+from src.shared.infrastructure.caching import LRUCache
 from src.shared.infrastructure.repositories import ChargingStationRepository
 from src.discovery.application.dtos import PostalCodeAreaDTO
 from src.discovery.domain.aggregates import PostalCodeAreaAggregate
@@ -17,15 +25,22 @@ class ChargingStationService(BaseService):
     Application Service for charging station operations.
     """
 
-    def __init__(self, repository: ChargingStationRepository, event_bus: IDomainEventPublisher):
+    def __init__(
+        self,
+        repository: ChargingStationRepository,
+        event_bus: IDomainEventPublisher,
+        result_cache: LRUCache | None = None,
+    ):
         """
         Initialize the ChargingStationService.
         Args:
             repository: Repository for charging stations.
             event_bus: Domain event publisher interface.
+            result_cache: Cache of `search_by_postal_code` results keyed by postal code. Pass a cache
+                scoped to the dataset version of the station register; results are not cached when None.
         """
 
-        super().__init__(repository, event_bus)
+        super().__init__(repository, event_bus, result_cache)
 
     def search_by_postal_code(self, postal_code: PostalCode) -> PostalCodeAreaDTO:
         """
@@ -34,6 +49,9 @@ class ChargingStationService(BaseService):
         This is the main use case for station discovery.
         Returns a DTO with all station data and business metrics.
 
+        With a result cache, repeated searches return the cached DTO; the search events are
+        published on every call, cache hits included. Failed searches are not cached.
+
         Args:
             postal_code (PostalCode): Postal code to search for.
 
@@ -44,32 +62,166 @@ class ChargingStationService(BaseService):
             Exception: Re-raises any exception after emitting failure event.
         """
 
+        area = self._get_or_compute(postal_code.value, lambda: self._search_area(postal_code))
+        self._publish_search_result(postal_code, area)
+        return area
+
+    def _search_area(self, postal_code: PostalCode) -> PostalCodeAreaDTO:
+        """
+        Search a postal code area in the repository and build its DTO without publishing its result.
+
+        Args:
+            postal_code (PostalCode): Postal code to search for.
+
+        Returns:
+            PostalCodeAreaDTO: DTO containing stations and coverage information.
+        """
         aggregate = PostalCodeAreaAggregate(postal_code=postal_code)
 
         try:
             stations: list[ChargingStation] = self._repository.find_stations_by_postal_code(postal_code)
-            for station in stations:
-                aggregate.add_station(station)
+            return self._build_area(aggregate, stations)
 
-            # Emit appropriate event based on results
-            if len(stations) == 0:
-                aggregate.record_no_stations()
-            else:
-                aggregate.record_stations_found()
+        except Exception as e:
+            self._fail_search(aggregate, e)
 
-            self.publish_events(aggregate)
+            # Re-raise the exception for the caller to handle
+            raise
 
-            return PostalCodeAreaDTO.from_aggregate(aggregate)
+    def search_by_postal_codes(self, postal_codes: Iterable[PostalCode]) -> dict[str, PostalCodeAreaDTO]:
+        """
+        Search for charging stations in several postal code areas with a single repository query.
 
-        except Exception as e:
-            # Emit failure event
-            error_type = type(e).__name__
-            aggregate.fail_search(error_message=str(e), error_type=error_type)
-            self.publish_events(aggregate)
+        Emits the same per-area events as `search_by_postal_code`.
 
-            # Re-raise the exception for the caller to handle
+        Args:
+            postal_codes (Iterable[PostalCode]): Postal codes to search for.
+
+        Returns:
+            Dict mapping each postal code value to its PostalCodeAreaDTO.
+
+        Raises:
+            Exception: Re-raises any exception after emitting a failure event for every requested area.
+        """
+        postal_codes = list(postal_codes)
+
+        try:
+            stations_by_plz = self._repository.find_stations_by_postal_codes(postal_codes)
+        except Exception as e:
+            for postal_code in postal_codes:
+                self._fail_search(PostalCodeAreaAggregate(postal_code=postal_code), e)
             raise
 
+        areas: dict[str, PostalCodeAreaDTO] = {}
+        for postal_code in postal_codes:
+            aggregate = PostalCodeAreaAggregate(postal_code=postal_code)
+            try:
+                area = self._build_area(aggregate, stations_by_plz.get(postal_code.value, []))
+            except Exception as e:
+                self._fail_search(aggregate, e)
+                raise
+            self._publish_search_result(postal_code, area)
+            areas[postal_code.value] = area
+
+        return areas
+
+    def get_area_statistics(self, postal_codes: Iterable[PostalCode]) -> dict[str, PostalCodeAreaDTO]:
+        """
+        Get the metrics of several postal code areas without loading station entities.
+
+        Reads the repository's precomputed statistics, so no aggregates are built. Instead of
+        per-area search events, a single StationStatisticsQueriedEvent records the query.
+
+        Args:
+            postal_codes (Iterable[PostalCode]): Postal codes to get metrics for.
+
+        Returns:
+            Dict mapping each postal code value to its PostalCodeAreaDTO.
+        """
+        statistics = self._repository.get_station_statistics(postal_codes)
+
+        self.publish_event(
+            StationStatisticsQueriedEvent(
+                postal_codes_queried=len(statistics),
+                areas_without_stations=sum(1 for area in statistics.values() if area.station_count == 0),
+                stations_total=sum(area.station_count for area in statistics.values()),
+            )
+        )
+
+        return {plz: PostalCodeAreaDTO.from_statistics(plz, area) for plz, area in statistics.items()}
+
+    def get_area_stats(self, postal_code: PostalCode) -> PostalCodeAreaDTO:
+        """
+        Get the metrics of a single postal code area without loading station entities.
+
+        Unlike `search_by_postal_code`, no aggregate is built and no events are emitted.
+
+        Args:
+            postal_code (PostalCode): Postal code to get metrics for.
+
+        Returns:
+            PostalCodeAreaDTO: Metrics and coverage information of the area.
+        """
+        statistics = self._repository.get_station_statistics([postal_code])[postal_code.value]
+        return PostalCodeAreaDTO.from_statistics(postal_code.value, statistics)
+
+    def count_stations(self, postal_code: PostalCode) -> int:
+        """
+        Count the charging stations in a postal code area.
+
+        No aggregate is built and no events are emitted.
+
+        Args:
+            postal_code (PostalCode): Postal code to count stations for.
+
+        Returns:
+            int: Number of stations in the area.
+        """
+        return self._repository.get_station_statistics([postal_code])[postal_code.value].station_count
+
+    def _build_area(self, aggregate: PostalCodeAreaAggregate, stations: list[ChargingStation]) -> PostalCodeAreaDTO:
+        """
+        Populate an area aggregate with its stations and convert it to a DTO.
+
+        Args:
+            aggregate (PostalCodeAreaAggregate): Empty aggregate of the searched area.
+            stations (list[ChargingStation]): Stations found in the area.
+
+        Returns:
+            PostalCodeAreaDTO: DTO containing stations and coverage information.
+        """
+        for station in stations:
+            aggregate.add_station(station)
+
+        return PostalCodeAreaDTO.from_aggregate(aggregate)
+
+    def _publish_search_result(self, postal_code: PostalCode, area: PostalCodeAreaDTO) -> None:
+        """
+        Publish the outcome of a successful search.
+
+        Built from the DTO rather than the aggregate, so cached results publish the same events.
+
+        Args:
+            postal_code (PostalCode): Searched postal code.
+            area (PostalCodeAreaDTO): Search result of the area.
+        """
+        # Emit appropriate event based on results
+        if area.station_count == 0:
+            self.publish_event(NoStationsFoundEvent(postal_code=postal_code))
+        else:
+            self.publish_event(StationsFoundEvent(postal_code=postal_code, stations_found=area.station_count))
+
+    def _fail_search(self, aggregate: PostalCodeAreaAggregate, error: Exception) -> None:
+        """
+        Record and publish a failed search for an area.
+
+        Args:
+            aggregate (PostalCodeAreaAggregate): Aggregate of the searched area.
+            error (Exception): The error that aborted the search.
+        """
+        aggregate.fail_search(error_message=str(error), error_type=type(error).__name__)
+        self.publish_events(aggregate)
+
     def find_stations_by_postal_code(self, postal_code: PostalCode) -> list[ChargingStation]:
         """
         Retrieve all charging stations located within a specific postal code area.
@@ -85,3 +237,15 @@ class ChargingStationService(BaseService):
                                    Returns empty list if no stations found.
         """
         return self._repository.find_stations_by_postal_code(postal_code)
+
+    def find_stations_by_postal_codes(self, postal_codes: Iterable[PostalCode]) -> dict[str, list[ChargingStation]]:
+        """
+        Retrieve the charging stations of several postal code areas with a single repository query.
+
+        Args:
+            postal_codes (Iterable[PostalCode]): The postal code value objects to query.
+
+        Returns:
+            Dict mapping each postal code value to its charging station entities.
+        """
+        return self._repository.find_stations_by_postal_codes(postal_codes)
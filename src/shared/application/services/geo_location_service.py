@@ -3,7 +3,8 @@ Shared Application Service for Geographic Location Data.
 """
 
 from src.shared.domain.events import IDomainEventPublisher
-from src.shared.domain.value_objects import GeoLocation, PostalCode
+from src.shared.domain.value_objects import GeoLocation, PostalCode, PostalCodeRegistry
+from src.shared.infrastructure.caching import LRUCache
 from src.shared.infrastructure.repositories import GeoDataRepository
 
 from .base_service import BaseService
@@ -14,16 +15,24 @@ class GeoLocationService(BaseService):
     Application service for geographic location data.
     """
 
-    def __init__(self, repository: GeoDataRepository, event_bus: IDomainEventPublisher):
+    def __init__(
+        self,
+        repository: GeoDataRepository,
+        event_bus: IDomainEventPublisher,
+        result_cache: LRUCache | None = None,
+    ):
         """
         Initialize the GeoLocationService.
 
         Args:
             repository (GeoDataRepository): Repository for geographic data.
             event_bus (IDomainEventPublisher): Domain event publisher interface.
+            result_cache (LRUCache | None): Cache of `get_geolocation_data_for_postal_code` results keyed by
+                postal code. Pass a cache scoped to the dataset version of the geodata; results are not
+                cached when None.
         """
 
-        super().__init__(repository, event_bus)
+        super().__init__(repository, event_bus, result_cache)
 
     def get_geolocation_data_for_postal_code(self, postal_code: PostalCode) -> GeoLocation:
         """
@@ -36,7 +45,56 @@ class GeoLocationService(BaseService):
             GeoLocation: Geographic location data for the given postal code or None if not found.
         """
 
-        return self._repository.fetch_geolocation_data(postal_code)
+        return self._get_or_compute(postal_code.value, lambda: self._repository.fetch_geolocation_data(postal_code))
+
+    def get_boundary_geojson(self, postal_code: PostalCode, zoom: int | None = None) -> dict | None:
+        """
+        Fetch the boundary of a postal code as a cached GeoJSON Feature.
+
+        Args:
+            postal_code (PostalCode): The postal code to fetch the boundary for.
+            zoom (int | None): Map zoom level used to pick the level of detail; None for full detail.
+
+        Returns:
+            dict: Read-only GeoJSON Feature, or None if not found.
+        """
+        return self._repository.get_boundary_geojson(postal_code, zoom)
+
+    def get_boundaries_feature_collection(
+        self, postal_codes: list[PostalCode] | None = None, zoom: int | None = None
+    ) -> dict:
+        """
+        Fetch the boundaries of several postal codes as one GeoJSON FeatureCollection.
+
+        Args:
+            postal_codes (list[PostalCode] | None): Postal codes to include; None includes all.
+            zoom (int | None): Map zoom level used to pick the level of detail; None for full detail.
+
+        Returns:
+            dict: GeoJSON FeatureCollection of the postal codes with a known boundary.
+        """
+        return self._repository.get_boundaries_feature_collection(postal_codes, zoom)
+
+    def get_boundaries_topology(self, zoom: int | None = None) -> dict:
+        """
+        Fetch all postal code boundaries as one cached TopoJSON topology.
+
+        Args:
+            zoom (int | None): Map zoom level used to pick the level of detail; None for full detail.
+
+        Returns:
+            dict: Read-only TopoJSON topology with the postal codes in the `postal_codes` object.
+        """
+        return self._repository.get_boundaries_topology(zoom)
+
+    def get_postal_code_registry(self) -> PostalCodeRegistry:
+        """
+        Retrieve the registry of all valid postal codes in the geographic dataset.
+
+        Returns:
+            PostalCodeRegistry: Interned postal codes with set-based membership checks.
+        """
+        return self._repository.get_postal_code_registry()
 
     def get_all_plzs(self) -> list[int]:
         """
@@ -2,8 +2,12 @@
 Shared Application Service for Postal Code Resident Data.
 """
 
+import numpy as np
+
 from src.shared.domain.events import IDomainEventPublisher
+from src.shared.domain.services import AreaDensityCalculator, AreaDensityResult
 from src.shared.domain.value_objects import PostalCode, PopulationData
+from src.shared.infrastructure.caching import LRUCache
 from src.shared.infrastructure.repositories import PopulationRepository
 
 from .base_service import BaseService
@@ -14,8 +18,22 @@ class PostalCodeResidentService(BaseService):
     Application service for managing postal code resident data.
     """
 
-    def __init__(self, repository: PopulationRepository, event_bus: IDomainEventPublisher):
-        super().__init__(repository, event_bus)
+    def __init__(
+        self,
+        repository: PopulationRepository,
+        event_bus: IDomainEventPublisher,
+        result_cache: LRUCache | None = None,
+    ):
+        """
+        Initialize the PostalCodeResidentService.
+
+        Args:
+            repository (PopulationRepository): Repository for population data.
+            event_bus (IDomainEventPublisher): Domain event publisher interface.
+            result_cache (LRUCache | None): Cache of `get_resident_data` results keyed by postal code. Pass
+                a cache scoped to the dataset version of the population data; results are not cached when None.
+        """
+        super().__init__(repository, event_bus, result_cache)
 
     def get_all_postal_codes(self, sort: bool = False) -> list[PostalCode]:
         """
@@ -41,6 +59,18 @@ class PostalCodeResidentService(BaseService):
         Returns a PopulationData value object containing the population count
         along with helper methods for density categorization and demand calculations.
 
+        Args:
+            postal_code (PostalCode): The postal code to get resident data for.
+
+        Returns:
+            PopulationData: Immutable value object with population data and business logic.
+        """
+        return self._get_or_compute(postal_code.value, lambda: self._load_resident_data(postal_code))
+
+    def _load_resident_data(self, postal_code: PostalCode) -> PopulationData:
+        """
+        Read the population of a postal code area from the repository.
+
         Args:
             postal_code (PostalCode): The postal code to get resident data for.
 
@@ -52,3 +82,40 @@ class PostalCodeResidentService(BaseService):
         population_data = PopulationData(postal_code=postal_code, population=residents_count)
 
         return population_data
+
+    def get_residents_counts(self, postal_codes: list[PostalCode]) -> np.ndarray:
+        """
+        Retrieve the population of many postal code areas in one repository call.
+
+        Args:
+            postal_codes (list[PostalCode]): The postal codes to get population counts for.
+
+        Returns:
+            np.ndarray: Population per postal code, aligned with `postal_codes`.
+        """
+        return self._repository.get_residents_counts(postal_codes)
+
+    def get_area_densities(
+        self, postal_codes: list[PostalCode], station_counts=None, total_capacity_kw=None
+    ) -> AreaDensityResult:
+        """
+        Calculate residents, stations and charging power per km² for many postal code areas.
+
+        Population and area sizes are read with one bulk repository call each; the densities
+        are computed for all areas in one vectorized pass.
+
+        Args:
+            postal_codes (list[PostalCode]): The postal codes to calculate densities for.
+            station_counts: Charging stations per postal code, aligned with `postal_codes`.
+            total_capacity_kw: Charging power capacity (kW) per postal code, aligned with `postal_codes`.
+
+        Returns:
+            AreaDensityResult: Columnar density metrics, aligned with `postal_codes`.
+        """
+        return AreaDensityCalculator.calculate(
+            [postal_code.value for postal_code in postal_codes],
+            self._repository.get_residents_counts(postal_codes),
+            self._repository.get_area_sizes(postal_codes),
+            station_count=station_counts,
+            total_capacity_kw=total_capacity_kw,
+        )
@@ -2,10 +2,15 @@
 Shared Application Service for Power Capacity Analysis.
 """
 
+from collections.abc import Iterable
+
+import numpy as np
+
 from src.shared.application.dtos import PowerCapacityDTO
 from src.shared.domain.services import CapacityClassificationService
 from src.shared.domain.value_objects import PostalCode
 from src.shared.infrastructure.repositories import ChargingStationRepository
+from src.shared.infrastructure.visualization import BLUE_RAMP
 
 
 class PowerCapacityService:
@@ -22,38 +27,27 @@ class PowerCapacityService:
         """
         self._repository = charging_station_repository
 
-    def get_power_capacity_by_postal_code(self, postal_codes: list[PostalCode]) -> list[PowerCapacityDTO]:
+    def get_power_capacity_by_postal_code(self, postal_codes: Iterable[PostalCode]) -> list[PowerCapacityDTO]:
         """
         Calculate total power capacity (in kW) for each postal code.
 
         Args:
-            postal_codes: List of postal codes to analyze.
+            postal_codes: Postal codes to analyze.
 
         Returns:
             List of PowerCapacityDTO objects with postal_code, total_capacity_kw, and station_count.
         """
-        capacity_data = []
-
-        for postal_code in postal_codes:
-            stations = self._repository.find_stations_by_postal_code(postal_code)
-
-            if stations:
-                total_capacity = sum(station.power_capacity.kilowatts for station in stations)
-                capacity_data.append(
-                    PowerCapacityDTO(
-                        postal_code=postal_code.value,
-                        total_capacity_kw=total_capacity,
-                        station_count=len(stations),
-                    )
-                )
-            else:
-                capacity_data.append(
-                    PowerCapacityDTO(
-                        postal_code=postal_code.value,
-                        total_capacity_kw=0.0,
-                        station_count=0,
-                    )
-                )
+        postal_codes = list(postal_codes)
+        statistics = self._repository.get_station_statistics(postal_codes)
+
+        capacity_data = [
+            PowerCapacityDTO(
+                postal_code=postal_code.value,
+                total_capacity_kw=statistics[postal_code.value].total_capacity_kw,
+                station_count=statistics[postal_code.value].station_count,
+            )
+            for postal_code in postal_codes
+        ]
 
         return capacity_data
 
@@ -109,21 +103,30 @@ class PowerCapacityService:
         Returns:
             Hex color code.
         """
-        if max_capacity == 0 or capacity == 0:
-            return "#f0f0f0"  # Light gray for no capacity
+        return self.get_colors_for_capacities([capacity], max_capacity)[0]
 
-        # Normalize capacity to 0-1 range
-        normalized = min(capacity / max_capacity, 1.0)
+    def get_colors_for_capacities(self, capacities: list[float], max_capacity: float | None = None) -> list[str]:
+        """
+        Generate colors from light to dark blue for many capacities in one vectorized call.
 
-        # Color gradient from light blue to dark blue
-        # Light: #e3f2fd (RGB: 227, 242, 253)
-        # Dark: #0d47a1 (RGB: 13, 71, 161)
+        Zero capacity is light gray; capacities above `max_capacity` get the darkest blue.
 
-        r = int(227 - (227 - 13) * normalized)
-        g = int(242 - (242 - 71) * normalized)
-        b = int(253 - (253 - 161) * normalized)
+        Args:
+            capacities: The capacity values to colorize.
+            max_capacity: The maximum capacity for normalization (defaults to the largest capacity).
 
-        return f"#{r:02x}{g:02x}{b:02x}"
+        Returns:
+            List of hex color codes, one per capacity.
+        """
+        values = np.asarray(capacities, dtype=np.float64)
+        if max_capacity is None:
+            max_capacity = float(values.max()) if values.size else 0.0
+        if max_capacity == 0:
+            return [BLUE_RAMP.no_data_color] * values.size
+
+        # Zero capacity has no color on the ramp
+        values = np.where(values == 0, np.nan, values)
+        return BLUE_RAMP.colors(values, vmin=0.0, vmax=max_capacity)
 
     def filter_by_capacity_category(
         self, capacity_dtos: list[PowerCapacityDTO], category: str
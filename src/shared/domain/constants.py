@@ -49,6 +49,11 @@ class PopulationThresholds:
     - Low density: < 10,000 residents (rural/suburban)
     - Medium density: 10,000-20,000 residents (suburban)
     - High density: > 20,000 residents (urban core)
+
+    Area density categories (residents per km², Berlin average about 4,100):
+    - Low density: <= 4,000 residents/km² (outskirts)
+    - Medium density: 4,000-10,000 residents/km² (residential districts)
+    - High density: > 10,000 residents/km² (inner city)
     """
 
     # Population density categories
@@ -58,6 +63,10 @@ class PopulationThresholds:
     # High density determination for demand analysis
     HIGH_DENSITY_DEMAND_THRESHOLD = 15000
 
+    # Area density categories (residents per km²)
+    HIGH_AREA_DENSITY_THRESHOLD = 10000
+    MEDIUM_AREA_DENSITY_THRESHOLD = 4000
+
 
 class PostalCodeThresholds:
     """
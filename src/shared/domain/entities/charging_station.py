@@ -12,7 +12,16 @@ from src.shared.domain.value_objects import PostalCode, PowerCapacity
 
 
 class ChargingStation:
-    """Entity representing a single charging station."""
+    """
+    Entity representing a single charging station.
+
+    Instances are slotted (no per-instance `__dict__`), since thousands are created per
+    query. Repositories should pass the register identity as `station_id` together with
+    ready-made `PostalCode` and `PowerCapacity` value objects, which skips identity
+    hashing and re-validation.
+    """
+
+    __slots__ = ("id", "postal_code", "latitude", "longitude", "power_capacity")
 
     def __init__(
         self,
@@ -9,6 +9,7 @@ from .station_search_failed_event import StationSearchFailedEvent
 from .no_stations_found_event import NoStationsFoundEvent
 from .stations_found_event import StationsFoundEvent
 from .postal_code_validated_event import PostalCodeValidatedEvent
+from .station_statistics_queried_event import StationStatisticsQueriedEvent
 
 __all__ = [
     "DomainEvent",
@@ -17,5 +18,6 @@ __all__ = [
     "PostalCodeValidatedEvent",
     "StationSearchFailedEvent",
     "StationSearchPerformedEvent",
+    "StationStatisticsQueriedEvent",
     "StationsFoundEvent",
 ]
@@ -0,0 +1,26 @@
+"""
+Shared Domain Event - Station Statistics Queried Event
+"""
+
+from dataclasses import dataclass
+
+from .domain_event import DomainEvent
+
+
+@dataclass(frozen=True)
+class StationStatisticsQueriedEvent(DomainEvent):
+    """
+    Domain Event: Station metrics were read for a batch of postal code areas.
+
+    Emitted by: ChargingStationService (Application Layer)
+    Consumed by:
+        - StationSearchEventHandler (logging/tracking)
+        - Analytics service (usage tracking)
+
+    One event summarizes a whole bulk query, so usage can be tracked without
+    emitting a search event per postal code.
+    """
+
+    postal_codes_queried: int
+    areas_without_stations: int
+    stations_total: int
@@ -2,10 +2,13 @@
 src.shared.domain.services - Shared Domain Services package.
 """
 
+from .area_density_calculator import AreaDensityCalculator, AreaDensityResult
 from .capacity_classification_service import CapacityClassificationService
 from .population_analysis_service import PopulationAnalysisService
 
 __all__ = [
+    "AreaDensityCalculator",
+    "AreaDensityResult",
     "CapacityClassificationService",
     "PopulationAnalysisService",
 ]
@@ -0,0 +1,118 @@
+"""
+Shared Domain Service - Area Density Calculator Module.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.shared.domain.constants import PopulationThresholds
+from src.shared.domain.enums import PopulationDensityCategory
+
+
+@dataclass(frozen=True)
+class AreaDensityResult:
+    """
+    Value object holding columnar density metrics of postal code areas.
+
+    Every attribute is a NumPy array with one entry per area, in input order. Areas without
+    a known positive size have NaN densities.
+
+    Attributes:
+        postal_codes: Postal code values
+        area_km2: Area sizes in km²
+        residents_per_km2: Residents per km²
+        stations_per_km2: Charging stations per km²
+        kw_per_km2: Charging power capacity (kW) per km²
+        density_category: Population density category values ("LOW", "MEDIUM", "HIGH")
+    """
+
+    postal_codes: np.ndarray
+    area_km2: np.ndarray
+    residents_per_km2: np.ndarray
+    stations_per_km2: np.ndarray
+    kw_per_km2: np.ndarray
+    density_category: np.ndarray
+
+    def __len__(self) -> int:
+        """Return the number of areas."""
+        return len(self.postal_codes)
+
+    def to_dict(self) -> dict[str, np.ndarray]:
+        """
+        Convert the result to a dictionary of columns, e.g. for `pandas.DataFrame`.
+
+        Returns:
+            dict: Column name to array mapping.
+        """
+        return {
+            "postal_code": self.postal_codes,
+            "area_km2": self.area_km2,
+            "residents_per_km2": self.residents_per_km2,
+            "stations_per_km2": self.stations_per_km2,
+            "kw_per_km2": self.kw_per_km2,
+            "density_category": self.density_category,
+        }
+
+
+class AreaDensityCalculator:
+    """
+    Domain Service: Calculates area-based densities for many postal code areas at once.
+
+    Relates residents, charging stations and charging power to the size of each area, so
+    that large outskirt areas and small inner-city areas with the same head count are told
+    apart. Categories follow `PopulationAnalysisService.get_area_density_category`.
+    """
+
+    @staticmethod
+    def calculate(postal_codes, population, area_km2, station_count=None, total_capacity_kw=None) -> AreaDensityResult:
+        """
+        Calculate density metrics for all areas at once.
+
+        Args:
+            postal_codes: Sequence of postal code values
+            population: Sequence of non-negative population counts
+            area_km2: Sequence of area sizes in km²; NaN or non-positive for unknown sizes
+            station_count: Sequence of charging station counts (defaults to zeros)
+            total_capacity_kw: Sequence of charging power capacities in kW (defaults to zeros)
+
+        Returns:
+            AreaDensityResult: Columnar results in input order
+
+        Raises:
+            ValueError: If the inputs differ in length or population is negative
+        """
+        postal_codes = np.asarray(postal_codes, dtype=str)
+        population = np.asarray(population, dtype=np.float64)
+        area_km2 = np.asarray(area_km2, dtype=np.float64)
+        station_count = np.zeros(len(postal_codes)) if station_count is None else np.asarray(station_count, np.float64)
+        total_capacity_kw = (
+            np.zeros(len(postal_codes)) if total_capacity_kw is None else np.asarray(total_capacity_kw, np.float64)
+        )
+
+        if not len(postal_codes) == len(population) == len(area_km2) == len(station_count) == len(total_capacity_kw):
+            raise ValueError("All inputs must have the same length")
+        if (population < 0).any():
+            raise ValueError("Population cannot be negative")
+
+        # Unknown or degenerate sizes yield NaN instead of infinite densities.
+        area = np.where(area_km2 > 0, area_km2, np.nan)
+        residents_per_km2 = population / area
+
+        density_category = np.select(
+            [
+                residents_per_km2 > PopulationThresholds.HIGH_AREA_DENSITY_THRESHOLD,
+                residents_per_km2 > PopulationThresholds.MEDIUM_AREA_DENSITY_THRESHOLD,
+            ],
+            [PopulationDensityCategory.HIGH.value, PopulationDensityCategory.MEDIUM.value],
+            default=PopulationDensityCategory.LOW.value,
+        )
+
+        return AreaDensityResult(
+            postal_codes=postal_codes,
+            area_km2=area_km2,
+            residents_per_km2=residents_per_km2,
+            stations_per_km2=station_count / area,
+            kw_per_km2=total_capacity_kw / area,
+            density_category=density_category,
+        )
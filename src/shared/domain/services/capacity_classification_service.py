@@ -5,8 +5,15 @@ This service encapsulates business logic for classifying power capacities
 into categories (Low, Medium, High, None) based on quantile analysis.
 """
 
+from collections.abc import Sequence
+
+import numpy as np
+
 from src.shared.domain.enums import CapacityCategory
 
+# Quantiles separating Low, Medium and High capacities.
+DEFAULT_QUANTILES: tuple[float, ...] = (0.33, 0.66)
+
 
 class CapacityClassificationService:
     """
@@ -20,8 +27,20 @@ class CapacityClassificationService:
     - Capacities are classified using 33rd and 66th percentiles
     - Zero capacity is always classified as "None"
     - Classification is based on non-zero capacities only
+
+    Classification is vectorized: breakpoints are taken from the sorted non-zero
+    capacities and every value is binned with `numpy.searchsorted` into a compact
+    category code (0 for "None", then 1, 2, ... from the lowest class upwards).
     """
 
+    # Capacity categories indexed by category code for the default quantiles.
+    CATEGORIES: tuple[CapacityCategory, ...] = (
+        CapacityCategory.NONE,
+        CapacityCategory.LOW,
+        CapacityCategory.MEDIUM,
+        CapacityCategory.HIGH,
+    )
+
     @staticmethod
     def calculate_quantiles(capacities: list[float]) -> tuple[float, float]:
         """
@@ -36,17 +55,38 @@ class CapacityClassificationService:
         Raises:
             ValueError: If capacities list is empty
         """
-        if not capacities:
-            raise ValueError("Cannot calculate quantiles from empty list")
+        q33, q66 = CapacityClassificationService.calculate_breakpoints(capacities).tolist()
+        return q33, q66
 
-        sorted_capacities = sorted(capacities)
-        q33_index = int(len(sorted_capacities) * 0.33)
-        q66_index = int(len(sorted_capacities) * 0.66)
+    @staticmethod
+    def calculate_breakpoints(capacities, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> np.ndarray:
+        """
+        Calculate the breakpoints of arbitrary quantiles (e.g. quintiles or deciles).
 
-        q33 = sorted_capacities[q33_index] if q33_index < len(sorted_capacities) else sorted_capacities[-1]
-        q66 = sorted_capacities[q66_index] if q66_index < len(sorted_capacities) else sorted_capacities[-1]
+        Each breakpoint is the sorted value at index `int(len(capacities) * quantile)`,
+        clamped to the last value.
 
-        return q33, q66
+        Args:
+            capacities: Capacity values (should be non-zero)
+            quantiles: Ascending quantiles between 0 and 1
+
+        Returns:
+            np.ndarray: One breakpoint per quantile, in ascending order
+
+        Raises:
+            ValueError: If capacities are empty or quantiles are not ascending within [0, 1]
+        """
+        values = np.asarray(capacities, dtype=np.float64)
+        if values.size == 0:
+            raise ValueError("Cannot calculate quantiles from empty list")
+
+        quantiles = np.asarray(quantiles, dtype=np.float64)
+        if quantiles.size == 0 or (quantiles < 0).any() or (quantiles > 1).any() or (np.diff(quantiles) < 0).any():
+            raise ValueError("Quantiles must be ascending values between 0 and 1")
+
+        indices = np.minimum((values.size * quantiles).astype(np.int64), values.size - 1)
+        # Partial sort: only the values at the breakpoint indices need to be in place.
+        return np.partition(values, np.unique(indices))[indices]
 
     @staticmethod
     def classify_capacity(capacity: float, q33: float, q66: float) -> CapacityCategory:
@@ -69,6 +109,51 @@ class CapacityClassificationService:
             return CapacityCategory.MEDIUM
         return CapacityCategory.HIGH
 
+    @staticmethod
+    def classify_codes(capacities, breakpoints: np.ndarray) -> np.ndarray:
+        """
+        Classify capacity values into category codes.
+
+        Zero capacity gets code 0; other values get `1 + number of breakpoints below the
+        value`, so a value equal to a breakpoint falls into the lower class.
+
+        Args:
+            capacities: Capacity values to classify
+            breakpoints: Ascending breakpoints, e.g. from `calculate_breakpoints`
+
+        Returns:
+            np.ndarray: int8 category code per capacity
+        """
+        values = np.asarray(capacities, dtype=np.float64)
+        codes = np.searchsorted(breakpoints, values, side="left").astype(np.int8) + 1
+        codes[values == 0] = 0
+        return codes
+
+    @staticmethod
+    def classify_capacity_codes(
+        capacities, quantiles: Sequence[float] = DEFAULT_QUANTILES
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Classify capacities into quantile classes computed from their non-zero values.
+
+        Args:
+            capacities: Capacity values to classify
+            quantiles: Ascending quantiles between 0 and 1
+
+        Returns:
+            Tuple of:
+            - breakpoints: One breakpoint per quantile (zeros if no capacity is positive)
+            - codes: int8 category code per capacity (all 0 if no capacity is positive)
+        """
+        values = np.asarray(capacities, dtype=np.float64)
+        non_zero_capacities = values[values > 0]
+
+        if non_zero_capacities.size == 0:
+            return np.zeros(len(quantiles)), np.zeros(values.size, dtype=np.int8)
+
+        breakpoints = CapacityClassificationService.calculate_breakpoints(non_zero_capacities, quantiles)
+        return breakpoints, CapacityClassificationService.classify_codes(values, breakpoints)
+
     @staticmethod
     def classify_capacities(capacities: list[float]) -> tuple[dict[str, tuple[float, float]], list[str]]:
         """
@@ -82,29 +167,22 @@ class CapacityClassificationService:
             - range_definitions: Dict mapping category to (min, max) capacity range
             - categories: List of category strings corresponding to input capacities
         """
-        if not capacities:
+        if len(capacities) == 0:
             return {"Low": (0, 0), "Medium": (0, 0), "High": (0, 0)}, []
 
-        max_capacity = max(capacities) if capacities else 0.0
-
-        if max_capacity == 0:
-            # All capacities are zero
-            return {"Low": (0, 0), "Medium": (0, 0), "High": (0, 0)}, ["None"] * len(capacities)
-
-        # Filter out zero capacity areas for classification
-        non_zero_capacities = [cap for cap in capacities if cap > 0]
+        values = np.asarray(capacities, dtype=np.float64)
 
-        if len(non_zero_capacities) == 0:
+        if not (values > 0).any():
             # All capacities are zero
             return {"Low": (0, 0), "Medium": (0, 0), "High": (0, 0)}, ["None"] * len(capacities)
 
-        # Calculate quantiles from non-zero capacities
-        q33, q66 = CapacityClassificationService.calculate_quantiles(non_zero_capacities)
+        breakpoints, codes = CapacityClassificationService.classify_capacity_codes(values)
+        q33, q66 = breakpoints.tolist()
 
         # Define ranges
-        range_definitions = {"Low": (0, q33), "Medium": (q33, q66), "High": (q66, max_capacity)}
+        range_definitions = {"Low": (0, q33), "Medium": (q33, q66), "High": (q66, float(values.max()))}
 
-        # Classify each capacity
-        categories = [CapacityClassificationService.classify_capacity(capacity, q33, q66) for capacity in capacities]
+        # Map category codes back to enum members
+        categories = [CapacityClassificationService.CATEGORIES[code] for code in codes.tolist()]
 
         return range_definitions, categories
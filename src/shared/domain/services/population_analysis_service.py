@@ -36,6 +36,28 @@ class PopulationAnalysisService:
             return PopulationDensityCategory.MEDIUM
         return PopulationDensityCategory.LOW
 
+    @staticmethod
+    def get_area_density_category(residents_per_km2: float) -> PopulationDensityCategory:
+        """
+        Business logic: Categorize residents per km² into standard ranges.
+
+        Unlike `get_density_category`, this accounts for the size of the area:
+        - HIGH: > 10,000 residents/km² (inner city)
+        - MEDIUM: 4,000-10,000 residents/km² (residential districts)
+        - LOW: <= 4,000 residents/km² (outskirts)
+
+        Args:
+            residents_per_km2 (float): Residents per square kilometer.
+
+        Returns:
+            PopulationDensityCategory: Population density category.
+        """
+        if residents_per_km2 > PopulationThresholds.HIGH_AREA_DENSITY_THRESHOLD:
+            return PopulationDensityCategory.HIGH
+        if residents_per_km2 > PopulationThresholds.MEDIUM_AREA_DENSITY_THRESHOLD:
+            return PopulationDensityCategory.MEDIUM
+        return PopulationDensityCategory.LOW
+
     @staticmethod
     def is_high_density(population: int) -> bool:
         """
@@ -3,15 +3,19 @@ src.shared.domain.value_objects - Shared Kernel Value Objects module.
 """
 
 from .postal_code import PostalCode
+from .postal_code_registry import PostalCodeRegistry
 from .boundary import Boundary
 from .geo_location import GeoLocation
 from .population_data import PopulationData
 from .power_capacity import PowerCapacity
+from .station_statistics import StationStatistics
 
 __all__ = [
     "Boundary",
     "GeoLocation",
     "PopulationData",
     "PostalCode",
+    "PostalCodeRegistry",
     "PowerCapacity",
+    "StationStatistics",
 ]
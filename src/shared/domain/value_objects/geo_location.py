@@ -28,7 +28,7 @@ class GeoLocation:
 
     def __post_init__(self):
         """Validate the boundary abstraction on creation."""
-        logger.info("GeoLocation __post_init__ called for postal_code: %s", self.postal_code)
+        logger.debug("GeoLocation __post_init__ called for postal_code: %s", self.postal_code)
         logger.debug("Boundary type received: %s", type(self.boundary))
 
         if self.boundary is None:
@@ -43,7 +43,7 @@ class GeoLocation:
             logger.error("GeoLocation validation failed - boundary is empty")
             raise InvalidGeoLocationError("Geo Location boundary cannot be None or empty.")
 
-        logger.info("GeoLocation created successfully for %s", self.postal_code)
+        logger.debug("GeoLocation created successfully for %s", self.postal_code)
 
     @property
     def empty(self) -> bool:
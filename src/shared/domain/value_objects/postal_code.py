@@ -39,16 +39,42 @@ class PostalCode:
         cleaned = str(self.value).strip()
         object.__setattr__(self, "value", cleaned)
 
+        error = self._validation_error(cleaned)
+        if error is not None:
+            raise InvalidPostalCodeError(error)
+
+    @classmethod
+    def is_valid(cls, value) -> bool:
+        """
+        Check whether a value is a valid Berlin postal code without raising.
+
+        Args:
+            value: Candidate postal code (surrounding whitespace is ignored).
+
+        Returns:
+            bool: True if `PostalCode(value)` would succeed.
+        """
+        if value is None:
+            return False
+        cleaned = str(value).strip()
+        return bool(cleaned) and cls._validation_error(cleaned) is None
+
+    @classmethod
+    def _validation_error(cls, cleaned: str) -> str | None:
+        """Return the violated rule for a cleaned value, or None if it is a valid postal code."""
+
         # Validation rules.
         if not cleaned.isdigit():
-            raise InvalidPostalCodeError(f"Postal code must be numeric: '{cleaned}'.")
+            return f"Postal code must be numeric: '{cleaned}'."
 
         if len(cleaned) != 5:
-            raise InvalidPostalCodeError(f"Postal code must be exactly 5 digits: '{cleaned}'.")
+            return f"Postal code must be exactly 5 digits: '{cleaned}'."
 
         # Berlin-specific rule.
-        if not cleaned.startswith(("10", "12", "13", "14")) or not self._is_berlin_postal_code(cleaned):
-            raise InvalidPostalCodeError(f"Berlin postal code must start with 10, 12, 13, or 14: '{cleaned}'.")
+        if not cleaned.startswith(("10", "12", "13", "14")) or not cls._is_berlin_postal_code(cleaned):
+            return f"Berlin postal code must start with 10, 12, 13, or 14: '{cleaned}'."
+
+        return None
 
     @staticmethod
     def get_values(postal_codes: list["PostalCode"]) -> list[str]:
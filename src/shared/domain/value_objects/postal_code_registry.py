@@ -0,0 +1,87 @@
+"""
+Shared Domain Value Object - Postal Code Registry
+"""
+
+from collections.abc import Iterable, Iterator
+
+from .postal_code import PostalCode
+
+
+class PostalCodeRegistry:
+    """
+    Immutable set of the valid postal codes of a dataset.
+
+    Each postal code is validated once when the registry is built; lookups return the
+    interned `PostalCode` instance instead of constructing and re-validating a new one.
+    Membership checks are set lookups and accept postal codes as `PostalCode`, string or
+    integer.
+    """
+
+    def __init__(self, values: Iterable[str | int]):
+        """
+        Initialize `PostalCodeRegistry`.
+
+        Args:
+            values: Candidate postal code values; invalid and duplicate values are skipped.
+        """
+        cleaned = {str(value).strip() for value in values if value is not None}
+        self._postal_codes: dict[str, PostalCode] = {
+            value: PostalCode(value) for value in sorted(cleaned) if PostalCode.is_valid(value)
+        }
+        self._ints: frozenset[int] = frozenset(int(value) for value in self._postal_codes)
+        self._skipped = len(cleaned) - len(self._postal_codes)
+
+    @property
+    def skipped_count(self) -> int:
+        """Number of distinct input values that are not valid postal codes."""
+        return self._skipped
+
+    def get(self, value: str | int | PostalCode) -> PostalCode | None:
+        """
+        Get the interned postal code for a value.
+
+        Args:
+            value: Postal code as `PostalCode`, string or integer.
+
+        Returns:
+            PostalCode or None if the value is not in the registry.
+        """
+        if isinstance(value, PostalCode):
+            value = value.value
+        elif isinstance(value, int):
+            value = str(value)
+        return self._postal_codes.get(value.strip()) if isinstance(value, str) else None
+
+    def __contains__(self, value: object) -> bool:
+        """Check membership of a `PostalCode`, string or integer postal code."""
+        if isinstance(value, int):
+            return value in self._ints
+        if isinstance(value, (str, PostalCode)):
+            return self.get(value) is not None
+        return False
+
+    def __iter__(self) -> Iterator[PostalCode]:
+        """Iterate over the postal codes in ascending order."""
+        return iter(self._postal_codes.values())
+
+    def __len__(self) -> int:
+        """Return the number of postal codes."""
+        return len(self._postal_codes)
+
+    def to_list(self) -> list[PostalCode]:
+        """
+        Get all postal codes.
+
+        Returns:
+            list[PostalCode]: Interned postal codes in ascending order.
+        """
+        return list(self._postal_codes.values())
+
+    def to_ints(self) -> list[int]:
+        """
+        Get all postal codes as integers.
+
+        Returns:
+            list[int]: Postal codes in ascending order.
+        """
+        return [int(value) for value in self._postal_codes]
@@ -0,0 +1,104 @@
+"""
+Shared Domain Value Object - Station Statistics Module.
+"""
+
+from dataclasses import dataclass
+
+from src.shared.domain.constants import InfrastructureThresholds
+from src.shared.domain.enums import CoverageLevel
+
+
+@dataclass(frozen=True)
+class StationStatistics:
+    """
+    Value Object: Aggregated charging infrastructure metrics of one postal code area.
+
+    Carries the counts and sums that coverage assessments are based on, so metrics can be
+    evaluated without loading individual ChargingStation entities.
+
+    Business Rules:
+    - Counts and capacity must be non-negative
+    - Fast chargers are a subset of all stations
+    """
+
+    station_count: int = 0
+    fast_charger_count: int = 0
+    total_capacity_kw: float = 0.0
+
+    def __post_init__(self):
+        """Validate metrics on creation."""
+        if self.station_count < 0 or self.fast_charger_count < 0 or self.total_capacity_kw < 0:
+            raise ValueError("Station statistics cannot be negative")
+        if self.fast_charger_count > self.station_count:
+            raise ValueError("Fast charger count cannot exceed station count")
+
+    def get_average_power_kw(self) -> float:
+        """
+        Query: Average power per station.
+
+        Returns:
+            float: Average power in kW, or 0.0 if there are no stations.
+        """
+        if self.station_count == 0:
+            return 0.0
+        return self.total_capacity_kw / self.station_count
+
+    def has_fast_charging(self) -> bool:
+        """
+        Business rule: Check if the area has fast charging capability.
+
+        Returns:
+            bool: True if at least one fast charger exists.
+        """
+        return self.fast_charger_count > 0
+
+    def is_well_equipped(self) -> bool:
+        """
+        Business rule: Determine if the area is well-equipped with charging infrastructure.
+
+        Well-equipped is defined as having either:
+        - At least 5 stations (quantity), OR
+        - At least 2 fast chargers (quality)
+
+        Returns:
+            bool: True if the area meets well-equipped criteria.
+        """
+        return (
+            self.station_count >= InfrastructureThresholds.WELL_EQUIPPED_STATION_COUNT
+            or self.fast_charger_count >= InfrastructureThresholds.WELL_EQUIPPED_FAST_CHARGER_COUNT
+        )
+
+    def get_coverage_level(self) -> CoverageLevel:
+        """
+        Business logic: Assess infrastructure coverage level.
+
+        Coverage levels:
+        - NO_COVERAGE: No stations available
+        - POOR: < 5 stations
+        - ADEQUATE: 5+ stations
+        - GOOD: 10+ stations with 2+ fast chargers
+        - EXCELLENT: 20+ stations with 5+ fast chargers
+
+        Returns:
+            CoverageLevel: Coverage level assessment.
+        """
+        count = self.station_count
+        fast_count = self.fast_charger_count
+
+        if count == 0:
+            return CoverageLevel.NO_COVERAGE
+
+        if (
+            count >= InfrastructureThresholds.EXCELLENT_COVERAGE_STATION_COUNT
+            and fast_count >= InfrastructureThresholds.EXCELLENT_COVERAGE_FAST_CHARGER_COUNT
+        ):
+            return CoverageLevel.EXCELLENT
+        if (
+            count >= InfrastructureThresholds.GOOD_COVERAGE_STATION_COUNT
+            and fast_count >= InfrastructureThresholds.GOOD_COVERAGE_FAST_CHARGER_COUNT
+        ):
+            return CoverageLevel.GOOD
+        if count >= InfrastructureThresholds.ADEQUATE_COVERAGE_THRESHOLD:
+            return CoverageLevel.ADEQUATE
+
+        return CoverageLevel.POOR
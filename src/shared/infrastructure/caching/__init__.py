@@ -0,0 +1,20 @@
+"""
+src.shared.infrastructure.caching - Shared Infrastructure Caching module.
+"""
+
+from .caching_repository import CachingRepository
+from .dataframe_snapshot import DataFrameSnapshot
+from .dataset_version import DatasetVersion
+from .lru_cache import CacheStats, LRUCache, estimate_size
+from .repository_registry import RepositoryRegistry, get_repository_registry
+
+__all__ = [
+    "CacheStats",
+    "CachingRepository",
+    "DataFrameSnapshot",
+    "DatasetVersion",
+    "LRUCache",
+    "RepositoryRegistry",
+    "estimate_size",
+    "get_repository_registry",
+]
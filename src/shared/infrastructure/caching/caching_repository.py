@@ -0,0 +1,181 @@
+"""
+Shared Infrastructure - Read-through Caching Repository Module.
+"""
+
+import copy
+import threading
+
+from collections.abc import Callable, Iterable, Iterator
+
+from src.shared.infrastructure.logging_config import get_logger
+
+from .lru_cache import CacheStats, LRUCache
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+class CachingRepository:
+    """
+    Read-through cache in front of any repository implementation.
+
+    Calls of the configured query methods are answered from an `LRUCache`, keyed by method
+    name and arguments; all other attributes are delegated to the wrapped repository, so the
+    wrapper can stand in for a `ChargingStationRepository`, `GeoDataRepository` or
+    `PopulationRepository` without changing it.
+
+    Empty results (None or an empty container, e.g. a postal code without stations) are
+    cached as negative entries, optionally with their own TTL, or not at all. Lists, dicts
+    and sets are returned as copies, including the containers directly inside them (e.g. the
+    station lists of `find_stations_by_postal_codes`), so callers cannot modify cached results.
+    """
+
+    def __init__(
+        self,
+        repository,
+        cache: LRUCache,
+        methods: Iterable[str],
+        negative_caching: bool = True,
+        negative_ttl_seconds: float | None = None,
+    ):
+        """
+        Initialize `CachingRepository`.
+
+        Args:
+            repository: Repository to wrap.
+            cache: Cache holding the results; its size, byte and TTL bounds define the eviction.
+            methods: Names of the repository methods whose results are cached.
+            negative_caching: Whether empty results are cached.
+            negative_ttl_seconds: Lifetime of empty results; defaults to the cache TTL.
+
+        Raises:
+            AttributeError: If the repository has no method of one of the given names.
+        """
+        self._repository = repository
+        self._cache = cache
+        self._negative_caching = negative_caching
+        self._negative_ttl = negative_ttl_seconds
+        self._negative_hits = 0
+        self._lock = threading.Lock()
+
+        self._cached_methods: dict[str, Callable] = {}
+        for name in methods:
+            method = getattr(repository, name)
+            if not callable(method):
+                raise AttributeError(f"'{type(repository).__name__}.{name}' is not a method.")
+            self._cached_methods[name] = self._read_through(name, method)
+
+        logger.info("Caching %s of %s", ", ".join(sorted(self._cached_methods)), type(repository).__name__)
+
+    @property
+    def repository(self):
+        """Get the wrapped repository."""
+        return self._repository
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Counters and size of the result cache."""
+        return self._cache.stats
+
+    @property
+    def negative_hits(self) -> int:
+        """Number of cache hits that returned an empty result."""
+        return self._negative_hits
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+
+    def _read_through(self, name: str, method: Callable) -> Callable:
+        """
+        Wrap a repository method with the result cache.
+
+        Args:
+            name: Method name, part of the cache key.
+            method: Bound repository method.
+
+        Returns:
+            Callable with the signature of `method`.
+        """
+
+        def cached_method(*args, **kwargs):
+            # One-shot iterators are materialized so they can be both hashed and passed on.
+            args = tuple(tuple(arg) if isinstance(arg, Iterator) else arg for arg in args)
+            kwargs = {key: tuple(value) if isinstance(value, Iterator) else value for key, value in kwargs.items()}
+
+            try:
+                key = (name, _freeze(args), _freeze(kwargs))
+                hash(key)
+            except TypeError:
+                return method(*args, **kwargs)
+
+            result = self._cache.get(key, _MISSING)
+            if result is not _MISSING:
+                if _is_empty(result):
+                    with self._lock:
+                        self._negative_hits += 1
+                return _copy(result)
+
+            result = method(*args, **kwargs)
+            if not _is_empty(result):
+                self._cache.put(key, result)
+            elif self._negative_caching:
+                self._cache.put(key, result, ttl_seconds=self._negative_ttl)
+            return _copy(result)
+
+        cached_method.__name__ = name
+        cached_method.__doc__ = method.__doc__
+        return cached_method
+
+    def __getattr__(self, name: str):
+        """Serve cached methods from the cache and delegate everything else to the repository."""
+        if name in ("_repository", "_cached_methods"):
+            raise AttributeError(name)
+        cached = self._cached_methods.get(name)
+        if cached is not None:
+            return cached
+        return getattr(self._repository, name)
+
+
+def _freeze(value):
+    """Turn arguments into a hashable cache key; lists, sets and dicts become tuples."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def _is_empty(result) -> bool:
+    """Check whether a result means "no data", e.g. for a postal code without stations."""
+    if result is None:
+        return True
+    if isinstance(result, (list, tuple, dict, set, frozenset)):
+        return len(result) == 0
+    return False
+
+
+def _copy(result):
+    """
+    Copy mutable containers so callers cannot modify cached results.
+
+    Containers directly inside the result (e.g. the lists of a dict of lists) are copied as
+    well; the entities in them are shared with the cache.
+    """
+    if isinstance(result, dict):
+        return {key: _copy_container(value) for key, value in result.items()}
+    if isinstance(result, list):
+        return [_copy_container(item) for item in result]
+    if isinstance(result, set):
+        return set(result)
+    return result
+
+
+def _copy_container(value):
+    """Return a list, dict or set as a shallow copy and anything else unchanged."""
+    if isinstance(value, (list, dict, set)):
+        return copy.copy(value)
+    return value
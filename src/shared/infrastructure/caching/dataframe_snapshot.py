@@ -0,0 +1,154 @@
+"""
+Shared Infrastructure - DataFrame Snapshot Module.
+"""
+
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from src.shared.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the on-disk layout of snapshots changes so stale files are ignored.
+SNAPSHOT_FORMAT_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _file_sha256(path: str) -> str:
+    """Compute the SHA-256 digest of a file in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DataFrameSnapshot:
+    """
+    Columnar (Parquet) snapshot of a DataFrame derived from a source file.
+
+    A JSON sidecar records the size, modification time and SHA-256 of the source file
+    the snapshot was built from. The snapshot is reused while size and mtime match;
+    if only the mtime changed the content hash decides, so a touched but unchanged
+    file does not force a re-parse. The `schema` tag lets producers invalidate snapshots
+    whenever the way they derive the DataFrame changes.
+    """
+
+    def __init__(self, source_path: str | os.PathLike, snapshot_dir: str | os.PathLike, name: str, schema: str = ""):
+        """
+        Initialize `DataFrameSnapshot`.
+
+        Args:
+            source_path: File the snapshotted DataFrame is derived from.
+            snapshot_dir: Directory holding snapshot and sidecar files.
+            name: Base file name of the snapshot (e.g. "charging_stations").
+            schema: Tag describing how the DataFrame is derived from the source.
+        """
+        self._source_path = os.fspath(source_path)
+        self._schema = schema
+        self._data_path = os.path.join(snapshot_dir, f"{name}.parquet")
+        self._meta_path = os.path.join(snapshot_dir, f"{name}.meta.json")
+
+    @property
+    def data_path(self) -> str:
+        """Path of the Parquet snapshot file."""
+        return self._data_path
+
+    def load(self) -> pd.DataFrame | None:
+        """
+        Load the snapshot if it is still valid for the current source file.
+
+        Returns:
+            pd.DataFrame or None if there is no usable snapshot.
+        """
+        meta = self._read_meta()
+        if meta is None or not os.path.exists(self._data_path) or not os.path.exists(self._source_path):
+            return None
+
+        if meta.get("schema") != self._schema:
+            return None
+
+        stat = os.stat(self._source_path)
+        if meta.get("source_size") != stat.st_size:
+            return None
+
+        if meta.get("source_mtime_ns") != stat.st_mtime_ns:
+            if meta.get("source_sha256") != _file_sha256(self._source_path):
+                return None
+            # Same content, new mtime: remember it so the next check skips hashing.
+            meta["source_mtime_ns"] = stat.st_mtime_ns
+            try:
+                self._write_meta(meta)
+            except OSError:
+                pass
+
+        try:
+            df = pd.read_parquet(self._data_path)
+        except (ImportError, OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable snapshot %s: %s", self._data_path, e)
+            return None
+
+        logger.info("Loaded snapshot %s (%d rows)", self._data_path, len(df))
+        return df
+
+    def save(self, df: pd.DataFrame) -> bool:
+        """
+        Write the DataFrame as the snapshot of the current source file.
+
+        Failures are logged and swallowed; the caller simply keeps parsing the source.
+
+        Args:
+            df: DataFrame to persist.
+
+        Returns:
+            bool: True if the snapshot was written.
+        """
+        if not os.path.exists(self._source_path):
+            return False
+
+        stat = os.stat(self._source_path)
+        meta = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "schema": self._schema,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_sha256": _file_sha256(self._source_path),
+        }
+
+        tmp_path = f"{self._data_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._data_path), exist_ok=True)
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self._data_path)
+            self._write_meta(meta)
+        except (ImportError, OSError, ValueError) as e:
+            logger.warning("Could not write snapshot %s: %s", self._data_path, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        logger.info("Wrote snapshot %s (%d rows)", self._data_path, len(df))
+        return True
+
+    def _read_meta(self) -> dict | None:
+        """Read the sidecar metadata, ignoring missing or foreign files."""
+        try:
+            with open(self._meta_path, encoding="utf-8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(meta, dict) or meta.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            return None
+        return meta
+
+    def _write_meta(self, meta: dict) -> None:
+        """Atomically write the sidecar metadata."""
+        tmp_path = f"{self._meta_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+        os.replace(tmp_path, self._meta_path)
@@ -0,0 +1,46 @@
+"""
+Shared Infrastructure - Dataset Version Module.
+"""
+
+import hashlib
+import os
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DatasetVersion:
+    """
+    Identifies one revision of a set of dataset files.
+
+    Two versions are equal when every source file has the same path, size and
+    modification time, so replacing a file on disk yields a new version.
+    """
+
+    fingerprint: tuple[tuple[str, int, int], ...] = ()
+
+    @classmethod
+    def from_paths(cls, *paths: str | os.PathLike) -> "DatasetVersion":
+        """
+        Build a version from the current state of the given files.
+
+        Args:
+            *paths: Paths of the dataset files backing a repository.
+
+        Returns:
+            DatasetVersion: Version describing the files as they are on disk now.
+
+        Raises:
+            FileNotFoundError: If one of the files does not exist.
+        """
+        entries = []
+        for path in paths:
+            stat = os.stat(path)
+            entries.append((os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+
+        return cls(fingerprint=tuple(entries))
+
+    @property
+    def token(self) -> str:
+        """Short, stable identifier of this version for logs and cache keys."""
+        return hashlib.sha1(repr(self.fingerprint).encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
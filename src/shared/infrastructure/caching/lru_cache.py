@@ -0,0 +1,304 @@
+"""
+Shared Infrastructure - LRU Result Cache Module.
+"""
+
+import dataclasses
+import sys
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import TypeVar
+
+import numpy as np
+import pandas as pd
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+def estimate_size(value, _seen: set[int] | None = None) -> int:  # pylint: disable=too-many-return-statements
+    """
+    Estimate the memory footprint of a value in bytes.
+
+    Follows containers, dataclasses and `__slots__` / `__dict__` attributes; NumPy arrays and
+    pandas objects report their buffers. Objects shared within the value are counted once.
+
+    Args:
+        value: Value to measure.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, np.ndarray):
+        return sys.getsizeof(value) + (0 if value.base is None else value.nbytes)
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return sys.getsizeof(value)
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, seen) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return size + sum(estimate_size(getattr(value, f.name, None), seen) for f in dataclasses.fields(value))
+
+    for cls in type(value).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            size += estimate_size(getattr(value, slot, None), seen)
+    if hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), seen)
+    return size
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Counters of a result cache.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no (live) entry.
+        evictions: Entries dropped to stay within the size or byte bound.
+        expirations: Entries dropped because they outlived their TTL.
+        size: Current number of entries.
+        max_size: Maximum number of entries.
+        size_bytes: Estimated size of the cached values (0 without a byte bound).
+        max_bytes: Maximum estimated size of the cached values, or None if unbounded.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_size: int
+    size_bytes: int = 0
+    max_bytes: int | None = None
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache (0.0 when there were none)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe, bounded least-recently-used cache with an optional time-to-live.
+
+    Services keep their results for frequently requested keys (e.g. postal codes) here.
+    Scope an instance to a dataset version (e.g. through `RepositoryRegistry`) so that
+    results are never served across dataset revisions. `None` results are cached as well.
+
+    Besides the number of entries, the cache can be bounded by the estimated size of its
+    values in bytes; least recently used entries are evicted until both bounds hold.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_bytes: int | None = None,
+        sizeof: Callable[[object], int] = estimate_size,
+    ):
+        """
+        Initialize `LRUCache`.
+
+        Args:
+            max_size: Maximum number of entries; the least recently used entry is evicted beyond it.
+            ttl_seconds: Seconds an entry stays valid after it was stored; None keeps entries until evicted.
+            clock: Monotonic time source, replaceable for testing.
+            max_bytes: Maximum estimated size of all values; None for no byte bound. Values larger
+                than the bound are not stored.
+            sizeof: Size estimate of a value in bytes, used only with `max_bytes`.
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1.")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("Cache TTL must be positive.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Cache byte bound must be positive.")
+
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        # Entries are (expiry time, estimated size, value), least recently used first.
+        self._entries: OrderedDict[Hashable, tuple[float, int, object]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable, default=None):
+        """
+        Look up a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the key is missing or expired.
+
+        Returns:
+            The cached value or `default`.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value, ttl_seconds: float | None = None) -> None:
+        """
+        Store a value, evicting least recently used entries if the cache is full.
+
+        Args:
+            key: Cache key.
+            value: Value to store (may be None).
+            ttl_seconds: Lifetime of this entry, overriding the cache TTL.
+        """
+        ttl = self._ttl if ttl_seconds is None else ttl_seconds
+        size = self._sizeof(value) if self._max_bytes is not None else 0
+
+        with self._lock:
+            self._remove(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                return
+
+            expires_at = self._clock() + ttl if ttl is not None else float("inf")
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+            while len(self._entries) > self._max_size or (
+                self._max_bytes is not None and self._bytes > self._max_bytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Return the cached value for `key`, computing and storing it on a miss.
+
+        `compute` runs outside the lock, so concurrent misses of the same key may compute it
+        more than once; exceptions propagate and nothing is cached.
+
+        Args:
+            key: Cache key.
+            compute: Zero-argument callable producing the value.
+
+        Returns:
+            The cached or newly computed value.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Drop a single entry.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            bool: True if an entry was dropped.
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all entries; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current counters and size of the cache."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_size=self._max_size,
+                size_bytes=self._bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def _remove(self, key: Hashable) -> bool:
+        """
+        Drop an entry and release its size; must be called with the lock held.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            bool: True if an entry was dropped.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def _lookup(self, key: Hashable):
+        """
+        Find a live entry and mark it as recently used; must be called with the lock held.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value or `_MISSING`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+
+        expires_at, _, value = entry
+        if self._clock() >= expires_at:
+            self._remove(key)
+            self._expirations += 1
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check for a live entry without touching the counters or the recency order."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and self._clock() < entry[0]
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet dropped."""
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,108 @@
+"""
+Shared Infrastructure - Process-wide Repository Registry Module.
+"""
+
+import os
+import threading
+
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+from src.shared.infrastructure.logging_config import get_logger
+
+from .dataset_version import DatasetVersion
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class RepositoryRegistry:
+    """
+    Process-wide registry of repository instances.
+
+    Streamlit re-executes the entry script on every widget interaction. The registry
+    lives in an imported module, so it survives those reruns and hands the same
+    repository instances to every session until the backing dataset files change.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._entries: dict[str, tuple[DatasetVersion, object]] = {}
+        # Re-entrant so factories may themselves resolve other registry entries.
+        self._lock = threading.RLock()
+
+    def get_or_create(self, name: str, factory: Callable[[], T], sources: Sequence[str | os.PathLike] = ()) -> T:
+        """
+        Return the instance registered under `name`, building it if needed.
+
+        The instance is rebuilt when any of the source files changed on disk since it was built.
+
+        Args:
+            name: Unique registry key (e.g. "charging_stations").
+            factory: Zero-argument callable building a new instance.
+            sources: Dataset files the instance is built from.
+
+        Returns:
+            The cached or newly built instance.
+        """
+        version = DatasetVersion.from_paths(*sources)
+
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+
+            logger.info("Building '%s' for dataset version %s", name, version.token)
+            instance = factory()
+            self._entries[name] = (version, instance)
+            return instance
+
+    def get_version(self, name: str) -> DatasetVersion | None:
+        """
+        Get the dataset version the registered instance was built from.
+
+        Args:
+            name: Registry key.
+
+        Returns:
+            DatasetVersion or None if nothing is registered under `name`.
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            return entry[0] if entry is not None else None
+
+    def invalidate(self, name: str | None = None) -> None:
+        """
+        Drop registered instances so the next lookup rebuilds them.
+
+        Args:
+            name: Registry key to drop, or None to drop every entry.
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+                logger.info("Invalidated all registry entries")
+            elif self._entries.pop(name, None) is not None:
+                logger.info("Invalidated registry entry '%s'", name)
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_REGISTRY = RepositoryRegistry()
+
+
+def get_repository_registry() -> RepositoryRegistry:
+    """
+    Get the process-wide repository registry.
+
+    Returns:
+        RepositoryRegistry: The registry shared by all sessions and reruns.
+    """
+    return _REGISTRY
@@ -3,7 +3,9 @@ Shared Infrastructure Geospatial components.
 """
 
 from .geopandas_boundary import GeopandasBoundary
+from .topojson_encoder import TopoJSONEncoder
 
 __all__ = [
     "GeopandasBoundary",
+    "TopoJSONEncoder",
 ]
@@ -0,0 +1,224 @@
+"""
+Shared Infrastructure - TopoJSON Encoder Module.
+"""
+
+import numpy as np
+import shapely
+from shapely.geometry import LinearRing, LineString
+from shapely.geometry.base import BaseGeometry
+
+Point = tuple[int, int]
+
+
+class TopoJSONEncoder:
+    """
+    Encode polygon boundaries as a quantized, delta-encoded TopoJSON topology.
+
+    Rings are cut at junctions into arcs so that a border shared by two areas is stored once
+    and referenced by both (reversed for one of them). Coordinates are snapped to an integer
+    grid of `quantization` steps across the bounding box and stored as deltas, which keeps the
+    serialized topology much smaller than the equivalent GeoJSON.
+
+    Only (multi)polygons are encoded; other geometry types are skipped.
+    """
+
+    def __init__(self, quantization: int = 100_000):
+        """
+        Initialize `TopoJSONEncoder`.
+
+        Args:
+            quantization: Number of grid steps per axis across the bounding box.
+        """
+        if quantization < 2:
+            raise ValueError("Quantization must be at least 2.")
+        self._quantization = quantization
+
+    def encode(  # pylint: disable=too-many-locals
+        self, geometries: dict[str, BaseGeometry], object_name: str, tolerance: float = 0.0
+    ) -> dict:
+        """
+        Build a TopoJSON topology from polygon geometries.
+
+        Args:
+            geometries: Polygon or MultiPolygon geometries keyed by feature id.
+            object_name: Name of the GeometryCollection in `objects`.
+            tolerance: Simplification tolerance in coordinate units applied to the shared arcs;
+                shared borders are simplified identically, so neighbors stay gap-free.
+
+        Returns:
+            dict: TopoJSON topology with one GeometryCollection; each geometry carries its key as `id`.
+        """
+        polygons = {
+            key: shapely.get_parts(geometry)
+            for key, geometry in geometries.items()
+            if geometry is not None and not geometry.is_empty and geometry.geom_type in ("Polygon", "MultiPolygon")
+        }
+        topology = {
+            "type": "Topology",
+            "objects": {object_name: {"type": "GeometryCollection", "geometries": []}},
+            "arcs": [],
+        }
+        if not polygons:
+            return topology
+
+        x0, y0, x1, y1 = shapely.total_bounds(list(geometries[key] for key in polygons))
+        scale = np.array([(x1 - x0) / (self._quantization - 1) or 1.0, (y1 - y0) / (self._quantization - 1) or 1.0])
+        translate = np.array([x0, y0])
+
+        quantized = {
+            key: [[self._quantize_ring(ring, translate, scale) for ring in self._rings(part)] for part in parts]
+            for key, parts in polygons.items()
+        }
+        junctions = self._find_junctions(
+            ring for parts in quantized.values() for rings in parts for ring in rings if ring is not None
+        )
+
+        arcs: list[list[Point]] = []
+        arc_index: dict[tuple[Point, ...], int] = {}
+        encoded_geometries = []
+        for key, parts in quantized.items():
+            encoded = self._encode_polygon(parts, junctions, arcs, arc_index)
+            if encoded is not None:
+                encoded_geometries.append({**encoded, "id": key})
+
+        if tolerance > 0:
+            arcs = [self._simplify_arc(arc, tolerance / scale.min()) for arc in arcs]
+
+        topology["transform"] = {"scale": scale.tolist(), "translate": translate.tolist()}
+        topology["bbox"] = [float(x0), float(y0), float(x1), float(y1)]
+        topology["objects"][object_name]["geometries"] = encoded_geometries
+        topology["arcs"] = [self._delta_encode(arc) for arc in arcs]
+        return topology
+
+    @staticmethod
+    def with_properties(topology: dict, properties: dict[str, dict]) -> dict:
+        """
+        Create a view of a topology restricted to the given ids, with properties attached.
+
+        Arcs and transform are shared with the source topology, which is left untouched.
+
+        Args:
+            topology: Topology built by `encode`.
+            properties: Feature properties keyed by id; ids missing here are omitted.
+
+        Returns:
+            dict: New topology whose geometries carry the given properties.
+        """
+        objects = {
+            name: {
+                **collection,
+                "geometries": [
+                    {**geometry, "properties": {**geometry.get("properties", {}), **properties[geometry["id"]]}}
+                    for geometry in collection["geometries"]
+                    if geometry["id"] in properties
+                ],
+            }
+            for name, collection in topology["objects"].items()
+        }
+        return {**topology, "objects": objects}
+
+    def _encode_polygon(
+        self,
+        parts: list[list[list[Point] | None]],
+        junctions: set[Point],
+        arcs: list[list[Point]],
+        arc_index: dict[tuple[Point, ...], int],
+    ) -> dict | None:
+        """Encode the quantized rings of a (multi)polygon as a TopoJSON geometry."""
+        encoded_parts = []
+        for rings in parts:
+            if rings[0] is None:
+                # Exterior collapsed to fewer than three grid points: drop the polygon part.
+                continue
+            encoded_parts.append(
+                [self._index_arcs(ring, junctions, arcs, arc_index) for ring in rings if ring is not None]
+            )
+
+        if not encoded_parts:
+            return None
+        if len(encoded_parts) == 1:
+            return {"type": "Polygon", "arcs": encoded_parts[0]}
+        return {"type": "MultiPolygon", "arcs": encoded_parts}
+
+    @staticmethod
+    def _rings(polygon) -> list:
+        """Return the exterior followed by the interior rings of a polygon."""
+        return [polygon.exterior, *polygon.interiors]
+
+    @staticmethod
+    def _quantize_ring(ring, translate: np.ndarray, scale: np.ndarray) -> list[Point] | None:
+        """Snap a ring to the integer grid, dropping repeated points and the closing point."""
+        points = np.round((np.asarray(ring.coords) - translate) / scale).astype(np.int64)
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+        points = points[keep]
+        if len(points) > 1 and np.array_equal(points[0], points[-1]):
+            points = points[:-1]
+        if len(points) < 3:
+            return None
+        return [(int(x), int(y)) for x, y in points]
+
+    @staticmethod
+    def _find_junctions(rings) -> set[Point]:
+        """Find points where rings meet with different neighbors, i.e. where shared borders start or end."""
+        neighbors: dict[Point, tuple[Point, Point]] = {}
+        junctions: set[Point] = set()
+        for ring in rings:
+            count = len(ring)
+            for i, point in enumerate(ring):
+                previous_point, next_point = ring[i - 1], ring[(i + 1) % count]
+                pair = (previous_point, next_point) if previous_point < next_point else (next_point, previous_point)
+                seen = neighbors.setdefault(point, pair)
+                if seen != pair:
+                    junctions.add(point)
+        return junctions
+
+    @staticmethod
+    def _index_arcs(
+        ring: list[Point], junctions: set[Point], arcs: list[list[Point]], arc_index: dict[tuple[Point, ...], int]
+    ) -> list[int]:
+        """Cut a ring into arcs at junctions and return their (possibly reversed) arc indices."""
+        cuts = [i for i, point in enumerate(ring) if point in junctions]
+        if cuts:
+            start = cuts[0]
+            ring = ring[start:] + ring[:start]
+            cuts = [i - start for i in cuts] + [len(ring)]
+            closed = ring + [ring[0]]
+            pieces = [closed[begin : end + 1] for begin, end in zip(cuts, cuts[1:])]
+        else:
+            # Closed arc without junctions: rotate to the smallest point so equal rings match.
+            start = ring.index(min(ring))
+            pieces = [ring[start:] + ring[:start] + [ring[start]]]
+
+        indices = []
+        for piece in pieces:
+            key = tuple(piece)
+            if key in arc_index:
+                indices.append(arc_index[key])
+            elif key[::-1] in arc_index:
+                indices.append(~arc_index[key[::-1]])
+            else:
+                arc_index[key] = len(arcs)
+                indices.append(len(arcs))
+                arcs.append(piece)
+        return indices
+
+    @staticmethod
+    def _simplify_arc(arc: list[Point], tolerance: float) -> list[Point]:
+        """Simplify an arc on the integer grid, keeping its end points."""
+        if len(arc) <= 2:
+            return arc
+        closed = arc[0] == arc[-1]
+        line = LinearRing(arc) if closed else LineString(arc)
+        points = np.round(shapely.get_coordinates(shapely.simplify(line, tolerance))).astype(np.int64)
+        if closed and len(points) < 4:
+            return arc
+        return [(int(x), int(y)) for x, y in points]
+
+    @staticmethod
+    def _delta_encode(arc: list[Point]) -> list[list[int]]:
+        """Encode an arc as its first point followed by coordinate deltas."""
+        encoded = [[arc[0][0], arc[0][1]]]
+        for (previous_x, previous_y), (x, y) in zip(arc, arc[1:]):
+            encoded.append([x - previous_x, y - previous_y])
+        return encoded
@@ -2,7 +2,8 @@
 src.shared.infrastructure.repositories - Shared Infrastructure Repositories module.
 """
 
-from .csv_repository import CSVRepository
+from .csv_schema import CSVColumn, CSVSchema
+from .csv_repository import CSVRepository, IngestReport
 from .charging_station_repository import ChargingStationRepository
 from .population_repository import PopulationRepository
 from .csv_geo_data_repository import CSVGeoDataRepository
@@ -11,11 +12,14 @@ from .csv_population_repository import CSVPopulationRepository
 from .geo_data_repository import GeoDataRepository
 
 __all__ = [
+    "CSVColumn",
     "CSVChargingStationRepository",
     "CSVGeoDataRepository",
     "CSVPopulationRepository",
     "CSVRepository",
+    "CSVSchema",
     "ChargingStationRepository",
     "GeoDataRepository",
+    "IngestReport",
     "PopulationRepository",
 ]
@@ -3,9 +3,10 @@ Shared Infrastructure Abstract Charging Station Repository Module.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from src.shared.domain.entities import ChargingStation
-from src.shared.domain.value_objects import PostalCode
+from src.shared.domain.value_objects import PostalCode, StationStatistics
 
 
 class ChargingStationRepository(ABC):
@@ -24,3 +25,40 @@ class ChargingStationRepository(ABC):
         Returns:
             List of ChargingStation entities found.
         """
+
+    def find_stations_by_postal_codes(self, postal_codes: Iterable[PostalCode]) -> dict[str, list[ChargingStation]]:
+        """
+        Find charging stations for several postal codes at once.
+
+        The default implementation queries each postal code separately; implementations
+        that can answer in a single pass should override it.
+
+        Args:
+            postal_codes (Iterable[PostalCode]): Postal codes to search for.
+        Returns:
+            Dict mapping each requested postal code value to its ChargingStation entities
+            (an empty list if it has none).
+        """
+        return {postal_code.value: self.find_stations_by_postal_code(postal_code) for postal_code in postal_codes}
+
+    def get_station_statistics(self, postal_codes: Iterable[PostalCode]) -> dict[str, StationStatistics]:
+        """
+        Get aggregated station metrics for several postal codes.
+
+        The default implementation derives the metrics from the station entities; implementations
+        that can precompute them should override it.
+
+        Args:
+            postal_codes (Iterable[PostalCode]): Postal codes to get metrics for.
+        Returns:
+            Dict mapping each requested postal code value to its StationStatistics
+            (all zero if it has no stations).
+        """
+        return {
+            plz: StationStatistics(
+                station_count=len(stations),
+                fast_charger_count=sum(1 for station in stations if station.is_fast_charger()),
+                total_capacity_kw=sum(station.power_capacity.kilowatts for station in stations),
+            )
+            for plz, stations in self.find_stations_by_postal_codes(postal_codes).items()
+        }
@@ -2,58 +2,177 @@
 Shared Infratructure - CSV Charging Station Repository Implementation
 """
 
+import os
+
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from src.shared.domain.constants import PostalCodeThresholds, PowerThresholds
 from src.shared.domain.entities import ChargingStation
-from src.shared.domain.value_objects import PostalCode, PowerCapacity
+from src.shared.domain.value_objects import PostalCode, PowerCapacity, StationStatistics
+from src.shared.infrastructure import get_logger
 
 from .csv_repository import CSVRepository
+from .csv_schema import CSVColumn, CSVSchema
 from .charging_station_repository import ChargingStationRepository
 
-
-class CSVChargingStationRepository(ChargingStationRepository, CSVRepository):
+logger = get_logger(__name__)
+
+BERLIN_STATE = "Berlin"
+
+# Only the columns needed for station lookups are parsed; German decimal commas are handled natively.
+REGISTER_SCHEMA = CSVSchema(
+    columns=(
+        CSVColumn("Ladeeinrichtungs-ID", "str", name="ID"),
+        CSVColumn("Postleitzahl", "str", name="PLZ"),
+        CSVColumn("Bundesland", "category"),
+        CSVColumn("Breitengrad", "float64"),
+        CSVColumn("Längengrad", "float64"),
+        CSVColumn("Nennleistung Ladeeinrichtung [kW]", "float64", name="KW"),
+    ),
+    sep=";",
+    decimal=",",
+    encoding="Windows-1252",
+    read_options={"skiprows": 10},
+)
+
+
+class CSVChargingStationRepository(
+    ChargingStationRepository, CSVRepository
+):  # pylint: disable=too-many-instance-attributes
     """
     CSV-based implementation of `ChargingStationRepository`.
 
     This repository provides charging station data for postal codes.
+    Only Berlin stations of the nationwide register are kept in memory.
     """
 
-    def __init__(self, file_path: str):
+    snapshot_schema = "berlin-v5"
+    schema = REGISTER_SCHEMA
+
+    def __init__(self, file_path: str, snapshot_dir: str | os.PathLike | None = None):
         """
         Initialize `CSVChargingStationRepository` with CSV file path.
 
         Args:
             file_path (str): Path to the charging station CSV file.
+            snapshot_dir (str | os.PathLike | None): Directory for the columnar snapshot of the
+                transformed register. When given, the CSV is only parsed if the snapshot is stale.
         """
-        super().__init__(file_path)
+        super().__init__(file_path, snapshot_dir)
+
+        self._df = self._read_snapshot()
+        from_csv = self._df is None
+        if from_csv:
+            self._df = self._drop_invalid_power_rows(self._load_typed_csv(row_filter=self._is_berlin_row))
+            missing_ids = int(self._df["ID"].isna().sum())
+            if missing_ids:
+                logger.warning(
+                    "%d stations have no register ID; their identity is derived from their data", missing_ids
+                )
+
+        # Power values repeat across stations, so their value objects are shared.
+        self._power_capacities: dict[float, PowerCapacity] = {}
+
+        self._build_postal_code_index()
+        self._build_statistics_table()
+
+        # Written after indexing, so the snapshot holds the rows already sorted by PLZ.
+        if from_csv:
+            self._write_snapshot(self._df)
+
+    @staticmethod
+    def _is_berlin_row(chunk: pd.DataFrame) -> pd.Series:
+        """
+        Select register rows that can belong to a Berlin postal code.
+
+        A row is kept if its state is Berlin or its postal code lies in the Berlin range, so
+        stations with an inconsistent state entry are not lost.
 
-        self._df = self._load_csv(sep=";", encoding="Windows-1252", low_memory=False, skiprows=10)
-        self._transform()
+        Args:
+            chunk (pd.DataFrame): A chunk of raw register rows.
 
-    def _transform(self):
+        Returns:
+            pd.Series: Boolean mask of rows to keep.
         """
-        Transform the loaded DataFrame for consistent data types.
+        postal_codes = pd.to_numeric(chunk["Postleitzahl"], errors="coerce")
+        in_berlin_range = (postal_codes >= PostalCodeThresholds.MIN_BERLIN_POSTAL_CODE) & (
+            postal_codes < PostalCodeThresholds.MAX_BERLIN_POSTAL_CODE
+        )
+        return in_berlin_range | (chunk["Bundesland"] == BERLIN_STATE)
+
+    @staticmethod
+    def _drop_invalid_power_rows(df: pd.DataFrame) -> pd.DataFrame:
         """
+        Drop stations whose power `PowerCapacity` would reject: missing, negative or above the maximum.
 
-        self._df = self._df.loc[
-            :,
-            [
-                "Postleitzahl",
-                "Bundesland",
-                "Breitengrad",
-                "Längengrad",
-                "Nennleistung Ladeeinrichtung [kW]",
-            ],
-        ]
-        self._df.rename(
-            columns={"Nennleistung Ladeeinrichtung [kW]": "KW", "Postleitzahl": "PLZ"},
-            inplace=True,  # In-place and hence no reassignment needed.
-        )
+        Station lookups and the precomputed statistics both read the cleaned rows, so totals
+        agree whichever path computes them.
+
+        Args:
+            df (pd.DataFrame): Typed register rows.
+
+        Returns:
+            pd.DataFrame: Rows with a valid power value.
+        """
+        valid = df["KW"].between(0, PowerThresholds.MAX_REASONABLE_POWER_KW)
+        if not valid.all():
+            logger.warning("Dropping %d stations with missing or out-of-range power", int((~valid).sum()))
+        return df[valid].reset_index(drop=True)
 
-        # Normalize data types and decimal separators for consistent processing.
-        # German CSV format uses comma as decimal separator; convert to period for Python float parsing.
-        self._df["PLZ"] = self._df["PLZ"].astype(str)
-        self._df["Breitengrad"] = self._df["Breitengrad"].astype(str).str.replace(",", ".")
-        self._df["Längengrad"] = self._df["Längengrad"].astype(str).str.replace(",", ".")
-        self._df["KW"] = self._df["KW"].astype(str).str.replace(",", ".")
+    def _build_postal_code_index(self):
+        """
+        Index the DataFrame by postal code.
+
+        Sorts the rows by PLZ (stable, so stations keep their register order within a postal code),
+        maps each postal code to the `(start, stop)` row range of its stations and keeps the numeric
+        columns and register IDs as Python lists, so a lookup is a dictionary access plus list slices.
+        """
+        if not self._df["PLZ"].is_monotonic_increasing:
+            self._df = self._df.sort_values("PLZ", kind="stable", ignore_index=True)
+
+        self._latitudes: list[float] = self._df["Breitengrad"].tolist()
+        self._longitudes: list[float] = self._df["Längengrad"].tolist()
+        self._kilowatts: list[float] = self._df["KW"].tolist()
+        # Stations without a register ID get None and fall back to the entity's derived identity.
+        ids = self._df["ID"]
+        self._station_ids: list[str | None] = ids.astype(object).where(ids.notna(), None).tolist()
+
+        codes = self._df["PLZ"].to_numpy()
+        if len(codes) == 0:
+            self._postal_code_index: dict[str, tuple[int, int]] = {}
+            return
+
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        stops = np.r_[starts[1:], len(codes)]
+        self._postal_code_index = {
+            codes[start]: (int(start), int(stop)) for start, stop in zip(starts.tolist(), stops.tolist())
+        }
+
+    def _build_statistics_table(self):
+        """
+        Precompute the per-PLZ station metrics with a single vectorized groupby.
+        """
+        grouped = (
+            self._df.assign(fast=self._df["KW"] >= PowerThresholds.FAST_CHARGING_THRESHOLD_KW)
+            .groupby("PLZ", sort=False)
+            .agg(station_count=("KW", "size"), fast_charger_count=("fast", "sum"), total_capacity_kw=("KW", "sum"))
+        )
+        self._statistics: dict[str, StationStatistics] = {
+            plz: StationStatistics(
+                station_count=station_count,
+                fast_charger_count=fast_charger_count,
+                total_capacity_kw=total_capacity_kw,
+            )
+            for plz, station_count, fast_charger_count, total_capacity_kw in zip(
+                grouped.index.tolist(),
+                grouped["station_count"].tolist(),
+                grouped["fast_charger_count"].tolist(),
+                grouped["total_capacity_kw"].tolist(),
+            )
+        }
 
     def find_stations_by_postal_code(self, postal_code: PostalCode) -> list[ChargingStation]:
         """
@@ -65,18 +184,45 @@ class CSVChargingStationRepository(ChargingStationRepository, CSVRepository):
             List of ChargingStation entities found.
         """
 
-        charging_stations = self._df[self._df["PLZ"] == postal_code.value]
-        stations: list[ChargingStation] = []
-        for _, row in charging_stations.iterrows():
-            station = ChargingStation(
+        start, stop = self._postal_code_index.get(postal_code.value, (0, 0))
+
+        return [
+            ChargingStation(
                 postal_code=postal_code,
-                latitude=float(row["Breitengrad"]),
-                longitude=float(row["Längengrad"]),
-                power_capacity=PowerCapacity(float(row["KW"])),
+                latitude=latitude,
+                longitude=longitude,
+                power_capacity=self._get_power_capacity(kilowatts),
+                station_id=station_id,
             )
-            stations.append(station)
+            for station_id, latitude, longitude, kilowatts in zip(
+                self._station_ids[start:stop],
+                self._latitudes[start:stop],
+                self._longitudes[start:stop],
+                self._kilowatts[start:stop],
+            )
+        ]
+
+    def _get_power_capacity(self, kilowatts: float) -> PowerCapacity:
+        """Return the shared PowerCapacity value object for a power value, creating it on first use."""
+        power_capacity = self._power_capacities.get(kilowatts)
+        if power_capacity is None:
+            power_capacity = self._power_capacities[kilowatts] = PowerCapacity(kilowatts)
+        return power_capacity
+
+    def get_station_statistics(self, postal_codes: Iterable[PostalCode]) -> dict[str, StationStatistics]:
+        """
+        Get aggregated station metrics for several postal codes from the precomputed table.
 
-        return stations
+        No ChargingStation entities are created.
+
+        Args:
+            postal_codes (Iterable[PostalCode]): Postal codes to get metrics for.
+        Returns:
+            Dict mapping each requested postal code value to its StationStatistics
+            (all zero if it has no stations).
+        """
+        empty = StationStatistics()
+        return {postal_code.value: self._statistics.get(postal_code.value, empty) for postal_code in postal_codes}
 
     def get_dataframe_columns(self) -> list:
         """Public method to inspect DataFrame columns for testing."""
@@ -2,10 +2,14 @@
 CSV-based implementation of GeoDataRepository.
 """
 
+import json
+
 import geopandas as gpd
+import numpy as np
+import shapely
 
-from src.shared.domain.value_objects import GeoLocation, PostalCode
-from src.shared.infrastructure.geospatial import GeopandasBoundary
+from src.shared.domain.value_objects import GeoLocation, PostalCode, PostalCodeRegistry
+from src.shared.infrastructure.geospatial import GeopandasBoundary, TopoJSONEncoder
 from src.shared.infrastructure import get_logger
 
 from .csv_repository import CSVRepository
@@ -13,23 +17,53 @@ from .geo_data_repository import GeoDataRepository
 
 logger = get_logger(__name__)
 
+# Levels of detail as (max zoom, tolerance in degrees) pairs, coarsest first. Each tolerance is
+# about half a screen pixel at Berlin's latitude; zoom levels above the last pair use full detail.
+SIMPLIFICATION_LEVELS: tuple[tuple[int, float], ...] = ((10, 0.0005), (12, 0.0002), (13, 0.0001))
+
+# Name of the postal code GeometryCollection in the boundaries topology.
+TOPOLOGY_OBJECT_NAME = "postal_codes"
 
-class CSVGeoDataRepository(GeoDataRepository, CSVRepository):
+
+class CSVGeoDataRepository(GeoDataRepository, CSVRepository):  # pylint: disable=too-many-instance-attributes
     """
     CSV-based implementation of `GeoDataRepository`.
 
     This repository provides geographic boundary data for postal codes.
+    Boundaries are parsed once at load, together with topology-preserving simplifications for
+    each level of detail; GeoLocation objects, GeoJSON features and TopoJSON topologies are built on
+    first access and cached.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        geojson_precision: int | None = 6,
+        simplification_levels: tuple[tuple[int, float], ...] = SIMPLIFICATION_LEVELS,
+        topojson_quantization: int = 100_000,
+    ):
         """
         Initialize `CSVGeoDataRepository` with CSV file path.
 
         Args:
             file_path (str): Path to the geolocation data CSV file.
+            geojson_precision (int | None): Decimal places kept in GeoJSON coordinates
+                (6 is roughly 10 cm); None keeps full precision.
+            simplification_levels (tuple): (max zoom, tolerance in degrees) pairs, coarsest first.
+            topojson_quantization (int): Grid steps per axis used to quantize the TopoJSON topology.
         """
         super().__init__(file_path)
 
+        self._geojson_precision = geojson_precision
+        self._simplification_levels = tuple(sorted(simplification_levels))
+        self._geometries: dict[str, object] = {}
+        self._simplified_geometries: dict[float, dict[str, object]] = {}
+        self._geo_locations: dict[str, GeoLocation] = {}
+        self._geojson_features: dict[tuple[str, float], dict] = {}
+        self._topojson_encoder = TopoJSONEncoder(topojson_quantization)
+        self._topologies: dict[float, dict] = {}
+        self._postal_code_registry = PostalCodeRegistry(())
+
         self._df = self._load_csv(sep=";")
         self._transform()
 
@@ -42,6 +76,33 @@ class CSVGeoDataRepository(GeoDataRepository, CSVRepository):
         self._df["PLZ"] = self._df["PLZ"].astype(str)
         logger.info("Transformed PLZ column to string type. DataFrame shape: %s", self._df.shape)
 
+        self._postal_code_registry = PostalCodeRegistry(self._df["PLZ"].unique())
+        logger.info(
+            "Registered %d postal codes (%d invalid skipped)",
+            len(self._postal_code_registry),
+            self._postal_code_registry.skipped_count,
+        )
+
+        # Parse all WKT boundaries in one vectorized call; the first row wins for duplicate PLZs.
+        geometries = shapely.from_wkt(self._df["geometry"].astype(str).to_numpy(), on_invalid="ignore")
+        for plz, geometry in zip(self._df["PLZ"].tolist(), geometries):
+            if geometry is None:
+                logger.warning("Skipping invalid boundary WKT for PLZ: %s", plz)
+                continue
+            self._geometries.setdefault(plz, geometry)
+        logger.info("Parsed %d postal code boundaries", len(self._geometries))
+
+        plzs = list(self._geometries)
+        full_detail = list(self._geometries.values())
+        for _, tolerance in self._simplification_levels:
+            simplified = shapely.simplify(full_detail, tolerance, preserve_topology=True)
+            self._simplified_geometries[tolerance] = dict(zip(plzs, simplified))
+            logger.info(
+                "Simplified boundaries with tolerance %s: %d vertices",
+                tolerance,
+                int(shapely.get_num_coordinates(simplified).sum()),
+            )
+
     def fetch_geolocation_data(self, postal_code: PostalCode):
         """
         Fetch geographic data for a given postal code.
@@ -52,28 +113,131 @@ class CSVGeoDataRepository(GeoDataRepository, CSVRepository):
         Returns:
             GeoLocation: Geographic location data for the given postal code or None if not found.
         """
-        logger.info("CSVGeoDataRepository: Fetching geolocation for PLZ: %s", postal_code.value)
-        logger.info("DataFrame shape: %s", self._df.shape)
-        logger.info("DataFrame columns: %s", self._df.columns.tolist())
-        logger.info("Available PLZ values (first 10): %s", self._df["PLZ"].head(10).tolist())
+        cached = self._geo_locations.get(postal_code.value)
+        if cached is not None:
+            return cached
 
-        result = self._df[self._df["PLZ"] == postal_code.value]
-        logger.info("Query result shape: %s", result.shape)
-        if result.empty:
+        geometry = self._geometries.get(postal_code.value)
+        if geometry is None:
             logger.warning("No geometry found for PLZ: %s", postal_code.value)
             return None
 
-        raw_boundary = result.iloc[0]["geometry"]
-        logger.info("Boundary type: %s", type(raw_boundary))
-        logger.info("Boundary value (first 200 chars): %s", str(raw_boundary)[:200])
-
-        boundary = self._coerce_boundary(raw_boundary)
-
-        logger.info("Creating GeoLocation object with postal_code=%s", postal_code.value)
+        logger.debug("Creating GeoLocation object with postal_code=%s", postal_code.value)
+        boundary = self._coerce_boundary(geometry)
         geo_location = GeoLocation(postal_code=postal_code, boundary=boundary)
-        logger.info("✓ GeoLocation created successfully")
+
+        self._geo_locations[postal_code.value] = geo_location
         return geo_location
 
+    def get_simplification_tolerance(self, zoom: int | None) -> float:
+        """
+        Pick the simplification tolerance for a map zoom level.
+
+        Args:
+            zoom (int | None): Map zoom level; None requests full detail.
+
+        Returns:
+            float: Tolerance in degrees, or 0.0 for full detail.
+        """
+        if zoom is None:
+            return 0.0
+        for max_zoom, tolerance in self._simplification_levels:
+            if zoom <= max_zoom:
+                return tolerance
+        return 0.0
+
+    def get_boundary_geojson(self, postal_code: PostalCode, zoom: int | None = None) -> dict | None:
+        """
+        Fetch the boundary of a postal code as a GeoJSON Feature.
+
+        The Feature is serialized once per level of detail and shared between callers; treat it
+        as read-only.
+
+        Args:
+            postal_code (PostalCode): The postal code to fetch the boundary for.
+            zoom (int | None): Map zoom level used to pick the level of detail; None for full detail.
+
+        Returns:
+            dict: GeoJSON Feature with the PLZ as `id` and `properties.PLZ`, or None if not found.
+        """
+        feature = self._get_geojson_feature(postal_code.value, self.get_simplification_tolerance(zoom))
+        if feature is None:
+            logger.warning("No geometry found for PLZ: %s", postal_code.value)
+        return feature
+
+    def get_boundaries_feature_collection(
+        self, postal_codes: list[PostalCode] | None = None, zoom: int | None = None
+    ) -> dict:
+        """
+        Fetch the boundaries of several postal codes as one GeoJSON FeatureCollection.
+
+        Args:
+            postal_codes (list[PostalCode] | None): Postal codes to include; None includes all.
+            zoom (int | None): Map zoom level used to pick the level of detail; None for full detail.
+
+        Returns:
+            dict: GeoJSON FeatureCollection; postal codes without a boundary are omitted.
+        """
+        if postal_codes is None:
+            plzs = list(self._geometries)
+        else:
+            plzs = [postal_code.value for postal_code in postal_codes]
+
+        tolerance = self.get_simplification_tolerance(zoom)
+        features = [self._get_geojson_feature(plz, tolerance) for plz in plzs]
+        return {"type": "FeatureCollection", "features": [feature for feature in features if feature is not None]}
+
+    def get_boundaries_topology(self, zoom: int | None = None) -> dict:
+        """
+        Fetch all boundaries as one quantized TopoJSON topology.
+
+        Shared borders are stored once, so the topology is several times smaller than the
+        equivalent GeoJSON. The postal codes are the geometries of the `postal_codes` object,
+        with the PLZ as `id` and `properties.PLZ`. The topology is built once per level of
+        detail and shared between callers; treat it as read-only.
+
+        Args:
+            zoom (int | None): Map zoom level used to pick the level of detail; None for full detail.
+
+        Returns:
+            dict: TopoJSON topology.
+        """
+        tolerance = self.get_simplification_tolerance(zoom)
+        topology = self._topologies.get(tolerance)
+        if topology is None:
+            # Simplify the shared arcs rather than each polygon, so neighboring areas stay gap-free.
+            topology = self._topojson_encoder.encode(self._geometries, TOPOLOGY_OBJECT_NAME, tolerance)
+            for geometry in topology["objects"][TOPOLOGY_OBJECT_NAME]["geometries"]:
+                geometry["properties"] = {"PLZ": geometry["id"]}
+            self._topologies[tolerance] = topology
+        return topology
+
+    def _get_geojson_feature(self, plz: str, tolerance: float = 0.0) -> dict | None:
+        """Return the cached GeoJSON Feature of a PLZ at a level of detail, serializing it on first access."""
+        key = (plz, tolerance)
+        feature = self._geojson_features.get(key)
+        if feature is not None:
+            return feature
+
+        geometries = self._simplified_geometries.get(tolerance, self._geometries)
+        geometry = geometries.get(plz)
+        if geometry is None or geometry.is_empty:
+            return None
+
+        if self._geojson_precision is not None:
+            precision = self._geojson_precision
+            geometry = shapely.transform(geometry, lambda coords: np.round(coords, precision))
+
+        # Features carry an id so folium does not add (and thereby mutate) one when rendering.
+        feature = {
+            "type": "Feature",
+            "id": plz,
+            "properties": {"PLZ": plz},
+            "geometry": json.loads(shapely.to_geojson(geometry)),
+        }
+        self._geojson_features[key] = feature
+        return feature
+
     def _coerce_boundary(self, raw_boundary) -> GeopandasBoundary:
         """Convert raw boundary data into a GeopandasBoundary."""
         if isinstance(raw_boundary, GeopandasBoundary):
@@ -110,6 +274,17 @@ class CSVGeoDataRepository(GeoDataRepository, CSVRepository):
         """Public method to inspect DataFrame values for testing."""
         return self._df.iloc[row][column]
 
+    def get_postal_code_registry(self) -> PostalCodeRegistry:
+        """
+        Get the registry of all valid postal codes in the dataset.
+
+        This serves as the 'Source of Truth' for postal codes across the application.
+
+        Returns:
+            PostalCodeRegistry: Interned postal codes with set-based membership checks.
+        """
+        return self._postal_code_registry
+
     def get_all_postal_codes(self) -> list[int]:
         """
         Retrieve all unique postal codes available in the dataset.
@@ -117,14 +292,6 @@ class CSVGeoDataRepository(GeoDataRepository, CSVRepository):
         This serves as the 'Source of Truth' for validation in the UI.
 
         Returns:
-            list[int]: List of valid postal code integers.
+            list[int]: List of valid postal code integers, in ascending order.
         """
-        try:
-            if "PLZ" in self._df.columns:
-                return self._df["PLZ"].astype(int).unique().tolist()
-
-            logger.error("Column 'PLZ' not found in GeoData repository.")
-            return []
-        except Exception as e:
-            logger.error("Error retrieving all postal codes: %s", e)
-            return []
+        return self._postal_code_registry.to_ints()
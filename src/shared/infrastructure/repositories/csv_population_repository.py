@@ -2,38 +2,66 @@
 CSV-based implementation of PopulationRepository.
 """
 
-from src.shared.domain.value_objects import PostalCode
+from collections.abc import Iterable
+
+import numpy as np
+
+from src.shared.domain.value_objects import PostalCode, PostalCodeRegistry
 from src.shared.infrastructure.repositories import CSVRepository, PopulationRepository
 
+from .csv_schema import CSVColumn, CSVSchema
+
+RESIDENTS_SCHEMA = CSVSchema(
+    columns=(
+        CSVColumn("plz", "str"),
+        CSVColumn("einwohner", "int32"),
+        CSVColumn("qkm", "float64"),
+        CSVColumn("lat", "float64"),
+        CSVColumn("lon", "float64"),
+    ),
+    sep=",",
+)
+
 
 class CSVPopulationRepository(PopulationRepository, CSVRepository):
     """
     CSV-based implementation of `PopulationRepository`.
 
     This repository provides residents / population data for postal codes.
+
+    Residents, area (km²) and coordinates are aggregated per postal code once at load, so
+    single and bulk lookups are dictionary accesses instead of scans of the whole table.
     """
 
-    def __init__(self, file_path: str):
+    schema = RESIDENTS_SCHEMA
+
+    def __init__(self, file_path: str, postal_code_registry: PostalCodeRegistry | None = None):
         """
         Initialize `CSVPopulationRepository` with CSV file path.
 
         Args:
             file_path (str): Path to the population CSV file.
+            postal_code_registry (PostalCodeRegistry | None): Registry of the postal codes known to the
+                application; postal codes outside it are ignored. Defaults to the valid postal codes of
+                the population dataset itself.
         """
         super().__init__(file_path)
 
-        self._df = self._load_csv(sep=",")
-        self._transform()
+        self._df = self._load_typed_csv()
 
-    def _transform(self):
-        """
-        Transform the loaded DataFrame for consistent data types.
-        """
+        # Postal codes may span several rows; residents and area add up, coordinates of the first row are kept.
+        self._areas = self._df.groupby("plz", sort=False).agg(
+            einwohner=("einwohner", "sum"), qkm=("qkm", "sum"), lat=("lat", "first"), lon=("lon", "first")
+        )
+        self._residents: dict[str, int] = dict(zip(self._areas.index, self._areas["einwohner"].tolist()))
+        self._area_km2: dict[str, float] = dict(zip(self._areas.index, self._areas["qkm"].tolist()))
 
-        # Ensure string type for comparison and replace ',' with '.' for decimal consistency.
-        self._df["plz"] = self._df["plz"].astype(str)
-        self._df["lat"] = self._df["lat"].astype(str).str.replace(",", ".")
-        self._df["lon"] = self._df["lon"].astype(str).str.replace(",", ".")
+        plzs = self._areas.index.tolist()
+        if postal_code_registry is None:
+            postal_code_registry = PostalCodeRegistry(plzs)
+        self._postal_codes: list[PostalCode] = [
+            postal_code_registry.get(plz) for plz in plzs if plz in postal_code_registry
+        ]
 
     def get_all_postal_codes(self) -> list[PostalCode]:
         """
@@ -42,16 +70,7 @@ class CSVPopulationRepository(PopulationRepository, CSVRepository):
         Returns:
             List of PostalCode value objects
         """
-        postal_codes: list[PostalCode] = []
-        for plz in self._df["plz"].unique():
-            try:
-                postal_code = PostalCode(plz)
-                postal_codes.append(postal_code)
-            except ValueError:
-                # Skip invalid postal codes.
-                continue
-
-        return postal_codes
+        return list(self._postal_codes)
 
     def get_residents_count(self, postal_code: PostalCode) -> int:
         """
@@ -62,14 +81,31 @@ class CSVPopulationRepository(PopulationRepository, CSVRepository):
         Returns:
             int: Number of residents in the given postal code.
         """
-        df_filtered = self._df[self._df["plz"] == postal_code.value]
+        return self._residents.get(postal_code.value, 0)
 
-        if df_filtered.empty:
-            return 0
+    def get_residents_counts(self, postal_codes: Iterable[PostalCode]) -> np.ndarray:
+        """
+        Get the number of residents for many postal codes at once.
 
-        residents_count = df_filtered["einwohner"].sum()
+        Args:
+            postal_codes (Iterable[PostalCode]): Postal codes to get resident counts for.
+        Returns:
+            np.ndarray: Number of residents per postal code, aligned with the input; 0 for unknown postal codes.
+        """
+        residents = self._residents
+        return np.fromiter((residents.get(postal_code.value, 0) for postal_code in postal_codes), dtype=np.int64)
 
-        return int(residents_count)
+    def get_area_sizes(self, postal_codes: Iterable[PostalCode]) -> np.ndarray:
+        """
+        Get the area of many postal codes at once.
+
+        Args:
+            postal_codes (Iterable[PostalCode]): Postal codes to get the area for.
+        Returns:
+            np.ndarray: Area in km² per postal code, aligned with the input; NaN for unknown postal codes.
+        """
+        area_km2 = self._area_km2
+        return np.fromiter((area_km2.get(postal_code.value, np.nan) for postal_code in postal_codes), dtype=np.float64)
 
     def get_dataframe_column_dtype(self, column: str) -> str:
         """Public method to inspect DataFrame column data type for testing."""
@@ -2,10 +2,36 @@
 Base CSV Repository Module.
 """
 
+import os
+
 from abc import ABC
+from collections.abc import Callable
+from dataclasses import dataclass
 
 import pandas as pd
 
+from src.shared.infrastructure.caching import DataFrameSnapshot
+from src.shared.infrastructure.logging_config import get_logger
+
+from .csv_schema import CSVSchema
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class IngestReport:
+    """
+    Row counts of a filtered, chunked CSV ingest.
+    """
+
+    rows_read: int
+    rows_kept: int
+
+    @property
+    def rows_dropped(self) -> int:
+        """Number of rows discarded by the row filter."""
+        return self.rows_read - self.rows_kept
+
 
 class CSVRepository(ABC):
     """
@@ -13,11 +39,49 @@ class CSVRepository(ABC):
     Provides common functionality for loading CSV files.
     """
 
-    def __init__(self, file_path: str):
+    # Tag of the parsed data layout written to snapshots. Subclasses change it whenever their
+    # parsing or transformation changes so that snapshots of the old layout are discarded.
+    snapshot_schema: str = ""
+
+    # Declarative parsing schema used by `_load_typed_csv`.
+    schema: CSVSchema | None = None
+
+    def __init__(self, file_path: str, snapshot_dir: str | os.PathLike | None = None):
         """
         Initialize `CSVRepository` with CSV file path.
+
+        Args:
+            file_path (str): Path to the CSV file.
+            snapshot_dir (str | os.PathLike | None): Directory for columnar snapshots of the
+                parsed data. Snapshots are disabled when None.
         """
         self._file_path = file_path
+        self._ingest_report: IngestReport | None = None
+        self._snapshot = None
+        if snapshot_dir is not None:
+            name = os.path.splitext(os.path.basename(file_path))[0]
+            self._snapshot = DataFrameSnapshot(file_path, snapshot_dir, name, schema=self.snapshot_schema)
+
+    def _read_snapshot(self) -> pd.DataFrame | None:
+        """
+        Load the snapshot of the parsed data if it is still valid for the CSV file.
+
+        Returns:
+            pd.DataFrame or None if snapshots are disabled or the snapshot is stale.
+        """
+        if self._snapshot is None:
+            return None
+        return self._snapshot.load()
+
+    def _write_snapshot(self, df: pd.DataFrame) -> None:
+        """
+        Persist the parsed data so later startups can skip parsing the CSV file.
+
+        Args:
+            df (pd.DataFrame): Parsed (and transformed) data.
+        """
+        if self._snapshot is not None:
+            self._snapshot.save(df)
 
     def _load_csv(self, sep: str, **kwargs) -> pd.DataFrame:
         """
@@ -33,6 +97,72 @@ class CSVRepository(ABC):
 
         return pd.read_csv(self._file_path, sep=sep, **kwargs)
 
+    def _load_csv_chunked(
+        self,
+        sep: str,
+        row_filter: Callable[[pd.DataFrame], pd.Series],
+        chunksize: int = 20_000,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Stream a CSV file in chunks and keep only the rows accepted by `row_filter`.
+
+        Only one chunk of unfiltered rows is held in memory at a time. Combine with
+        `usecols` to also skip materializing unused columns. The resulting row counts are
+        available through `ingest_report`.
+
+        Args:
+            sep (str): The separator used in the CSV file.
+            row_filter (Callable): Maps a chunk to a boolean mask of rows to keep.
+            chunksize (int): Number of rows parsed per chunk.
+            **kwargs: Additional keyword arguments passed to `pandas.read_csv`
+
+        Returns:
+            pd.DataFrame: The kept rows of the CSV file.
+        """
+        rows_read = 0
+        kept: list[pd.DataFrame] = []
+        for chunk in pd.read_csv(self._file_path, sep=sep, chunksize=chunksize, **kwargs):
+            rows_read += len(chunk)
+            kept.append(chunk[row_filter(chunk)])
+
+        df = pd.concat(kept, ignore_index=True) if kept else pd.DataFrame()
+        self._ingest_report = IngestReport(rows_read=rows_read, rows_kept=len(df))
+        logger.info(
+            "Ingested %s: kept %d of %d rows (%d dropped)",
+            os.path.basename(self._file_path),
+            self._ingest_report.rows_kept,
+            self._ingest_report.rows_read,
+            self._ingest_report.rows_dropped,
+        )
+        return df
+
+    def _load_typed_csv(self, row_filter: Callable[[pd.DataFrame], pd.Series] | None = None) -> pd.DataFrame:
+        """
+        Load the CSV file as described by the repository `schema`.
+
+        Decimal separators, encoding and column projection are handled by the parser, so numeric
+        columns arrive as numeric arrays instead of strings.
+
+        Args:
+            row_filter (Callable | None): If given, the file is streamed in chunks and only rows
+                accepted by the filter (evaluated on the raw CSV headers) are kept.
+
+        Returns:
+            pd.DataFrame: Typed DataFrame with the schema's column names.
+        """
+        kwargs = self.schema.read_csv_kwargs()
+        if row_filter is None:
+            df = self._load_csv(**kwargs)
+        else:
+            df = self._load_csv_chunked(row_filter=row_filter, **kwargs)
+        return self.schema.apply(df)
+
+    @property
+    def ingest_report(self) -> IngestReport | None:
+        """Row counts of the last chunked ingest, or None if the data was not streamed from CSV."""
+        return self._ingest_report
+
     def load_csv(self, sep: str, **kwargs) -> pd.DataFrame:
         """
         Public method to load CSV file for testing and inspection purposes.
@@ -0,0 +1,103 @@
+"""
+Shared Infrastructure - Declarative CSV Schema Module.
+"""
+
+from dataclasses import dataclass, field
+
+import pandas as pd
+from pandas.api.types import is_integer_dtype, is_numeric_dtype
+
+# Dtypes the CSV parser can assign without inspecting values; numeric dtypes are coerced after parsing
+# so that a single malformed cell becomes NaN instead of aborting the whole load.
+_PARSER_DTYPES = ("str", "category")
+
+
+@dataclass(frozen=True)
+class CSVColumn:
+    """
+    A column read from a CSV file.
+
+    Attributes:
+        source: Column header in the CSV file.
+        dtype: Target dtype (e.g. "str", "category", "float64", "int32").
+        name: Column name after loading; defaults to `source`.
+    """
+
+    source: str
+    dtype: str
+    name: str | None = None
+
+    @property
+    def target(self) -> str:
+        """Column name after loading."""
+        return self.name or self.source
+
+
+@dataclass(frozen=True)
+class CSVSchema:
+    """
+    Declarative description of how a repository parses its CSV file.
+
+    The schema drives `pandas.read_csv` (separator, encoding, decimal separator, column
+    projection) and the final dtypes and names of the loaded columns.
+    """
+
+    columns: tuple[CSVColumn, ...]
+    sep: str = ","
+    decimal: str = "."
+    encoding: str = "utf-8"
+    read_options: dict = field(default_factory=dict)
+
+    @property
+    def usecols(self) -> list[str]:
+        """CSV headers to parse."""
+        return [column.source for column in self.columns]
+
+    def read_csv_kwargs(self) -> dict:
+        """
+        Build the keyword arguments for `pandas.read_csv`.
+
+        Returns:
+            dict: Parser options including separator, encoding, decimal separator, columns and dtypes.
+        """
+        return {
+            "sep": self.sep,
+            "decimal": self.decimal,
+            "encoding": self.encoding,
+            "usecols": self.usecols,
+            "dtype": {column.source: column.dtype for column in self.columns if column.dtype in _PARSER_DTYPES},
+            **self.read_options,
+        }
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Project, type and rename a parsed DataFrame according to the schema.
+
+        Numeric columns that arrive as text (e.g. with a decimal comma) are converted; values
+        that cannot be parsed become NaN. Missing values of text columns become None.
+
+        Args:
+            df: DataFrame as returned by the CSV parser.
+
+        Returns:
+            pd.DataFrame: New DataFrame with exactly the schema columns, dtypes and names.
+        """
+        typed = {}
+        for column in self.columns:
+            values = df[column.source]
+            if column.dtype == "str":
+                # Missing text stays missing (None) instead of becoming the string "nan".
+                typed[column.target] = values.astype(column.dtype).where(values.notna(), None)
+                continue
+            if column.dtype in _PARSER_DTYPES:
+                typed[column.target] = values.astype(column.dtype)
+                continue
+
+            if not is_numeric_dtype(values):
+                values = pd.to_numeric(values.astype(str).str.replace(self.decimal, ".", regex=False), errors="coerce")
+            if is_integer_dtype(pd.api.types.pandas_dtype(column.dtype)):
+                # Integer arrays cannot hold NaN; unparsable counts are treated as zero.
+                values = values.fillna(0)
+            typed[column.target] = values.astype(column.dtype)
+
+        return pd.DataFrame(typed, index=df.index)
@@ -0,0 +1,14 @@
+"""
+src.shared.infrastructure.visualization - Shared Infrastructure Visualization module.
+"""
+
+from .color_ramp import BLUE_RAMP, GREEN_RAMP, NORMALIZATIONS, ORANGE_RAMP, PURPLE_RAMP, ColorRamp
+
+__all__ = [
+    "BLUE_RAMP",
+    "ColorRamp",
+    "GREEN_RAMP",
+    "NORMALIZATIONS",
+    "ORANGE_RAMP",
+    "PURPLE_RAMP",
+]
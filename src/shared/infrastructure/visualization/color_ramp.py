@@ -0,0 +1,152 @@
+"""
+Shared Infrastructure - Color Ramp Module.
+"""
+
+import numpy as np
+
+NORMALIZATIONS = ("linear", "log", "quantile")
+
+
+class ColorRamp:
+    """
+    Two-color gradient backed by a precomputed lookup table of hex colors.
+
+    The table is built once per ramp; coloring a value array normalizes it to [0, 1]
+    and indexes the table in one vectorized call, so no per-feature RGB math or string
+    formatting happens at render time. NaN values get the no-data color.
+    """
+
+    def __init__(self, start_color: str, end_color: str, size: int = 256, no_data_color: str = "#f0f0f0"):
+        """
+        Initialize `ColorRamp`.
+
+        Args:
+            start_color: Hex color (e.g. "#e3f2fd") for the lowest values.
+            end_color: Hex color for the highest values.
+            size: Number of entries in the lookup table.
+            no_data_color: Hex color for NaN values.
+        """
+        if size < 2:
+            raise ValueError("Color ramp size must be at least 2.")
+
+        start = np.array(self._parse_hex(start_color), dtype=np.float64)
+        end = np.array(self._parse_hex(end_color), dtype=np.float64)
+        steps = np.linspace(0.0, 1.0, size)[:, np.newaxis]
+        rgb = (start + (end - start) * steps).astype(np.int64)
+
+        self._lut = np.array([f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist()])
+        self._no_data_color = no_data_color
+
+    @property
+    def start_color(self) -> str:
+        """Color of the lowest values."""
+        return str(self._lut[0])
+
+    @property
+    def end_color(self) -> str:
+        """Color of the highest values."""
+        return str(self._lut[-1])
+
+    @property
+    def no_data_color(self) -> str:
+        """Color of NaN values."""
+        return self._no_data_color
+
+    def colors(
+        self, values, normalization: str = "linear", vmin: float | None = None, vmax: float | None = None
+    ) -> list[str]:
+        """
+        Map values to hex colors.
+
+        Args:
+            values: Numeric values; NaN marks missing data.
+            normalization: "linear", "log" or "quantile".
+            vmin: Value mapped to the start color (defaults to the smallest value).
+            vmax: Value mapped to the end color (defaults to the largest value).
+
+        Returns:
+            list[str]: One hex color per value, in input order.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        normalized = self.normalize(values, normalization, vmin, vmax)
+
+        indices = np.rint(np.nan_to_num(normalized) * (len(self._lut) - 1)).astype(np.int64)
+        colors = self._lut[indices]
+        if np.isnan(values).any():
+            colors = np.where(np.isnan(values), self._no_data_color, colors)
+        return colors.tolist()
+
+    def color(self, value: float, vmin: float, vmax: float) -> str:
+        """
+        Map a single value to a hex color with linear normalization.
+
+        Args:
+            value: Numeric value; NaN marks missing data.
+            vmin: Value mapped to the start color.
+            vmax: Value mapped to the end color.
+
+        Returns:
+            str: Hex color.
+        """
+        return self.colors([value], vmin=vmin, vmax=vmax)[0]
+
+    @staticmethod
+    def normalize(
+        values: np.ndarray, normalization: str = "linear", vmin: float | None = None, vmax: float | None = None
+    ) -> np.ndarray:
+        """
+        Scale values to [0, 1].
+
+        Values outside [vmin, vmax] are clipped. If all values are equal, they map to 0.5.
+        Quantile normalization ranks values among the non-NaN input (ties share their
+        mid-rank) and ignores `vmin` and `vmax`.
+
+        Args:
+            values: Numeric values; NaN values stay NaN.
+            normalization: "linear", "log" or "quantile".
+            vmin: Lower bound (defaults to the smallest value).
+            vmax: Upper bound (defaults to the largest value).
+
+        Returns:
+            np.ndarray: Normalized values.
+        """
+        if normalization not in NORMALIZATIONS:
+            raise ValueError(f"Unknown normalization '{normalization}', expected one of {NORMALIZATIONS}.")
+
+        valid = values[~np.isnan(values)]
+        if valid.size == 0:
+            return np.full(values.shape, np.nan)
+
+        if normalization == "quantile":
+            ordered = np.sort(valid)
+            if ordered.size == 1:
+                return np.where(np.isnan(values), np.nan, 0.5)
+            left = np.searchsorted(ordered, values, side="left")
+            right = np.searchsorted(ordered, values, side="right")
+            normalized = (left + right - 1) / (2 * (ordered.size - 1))
+            return np.where(np.isnan(values), np.nan, normalized)
+
+        low = valid.min() if vmin is None else vmin
+        high = valid.max() if vmax is None else vmax
+        if high <= low:
+            return np.where(np.isnan(values), np.nan, 0.5)
+
+        clipped = np.clip(values, low, high) - low
+        if normalization == "log":
+            return np.log1p(clipped) / np.log1p(high - low)
+        return clipped / (high - low)
+
+    @staticmethod
+    def _parse_hex(color: str) -> tuple[int, int, int]:
+        """Parse a "#rrggbb" color into an RGB triple."""
+        color = color.lstrip("#")
+        if len(color) != 6:
+            raise ValueError(f"Expected a #rrggbb color, got '{color}'.")
+        return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+
+
+# Palettes of the choropleth layers.
+BLUE_RAMP = ColorRamp("#e3f2fd", "#0d47a1")
+GREEN_RAMP = ColorRamp("#c8e6c9", "#1b5e20")
+ORANGE_RAMP = ColorRamp("#ffe0b2", "#e65100")
+PURPLE_RAMP = ColorRamp("#f3e5f5", "#4a148c")
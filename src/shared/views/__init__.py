@@ -6,9 +6,20 @@ This module provides reusable UI components and utilities shared across bounded
 
 from src.shared.views.about_view import AboutView
 from src.shared.views.components import (
+    add_choropleth_layer,
+    add_station_cluster_layer,
     get_map_center_and_zoom,
+    get_map_zoom,
     validate_plz_input,
     render_sidebar,
 )
 
-__all__ = ["AboutView", "get_map_center_and_zoom", "render_sidebar", "validate_plz_input"]
+__all__ = [
+    "AboutView",
+    "add_choropleth_layer",
+    "add_station_cluster_layer",
+    "get_map_center_and_zoom",
+    "get_map_zoom",
+    "render_sidebar",
+    "validate_plz_input",
+]
@@ -5,19 +5,51 @@ This module provides reusable UI components and helper functions
 that are used across different bounded contexts.
 """
 
+from collections.abc import Container, Iterable
+
+import folium
 import streamlit
+from folium.plugins import FastMarkerCluster
 
+from src.shared.domain.entities import ChargingStation
 from src.shared.domain.value_objects import GeoLocation, PostalCode
 from src.shared.application.services import GeoLocationService
-
-
-def validate_plz_input(plz_input: str, valid_plzs: list[int]) -> tuple[bool, str]:
+from src.shared.infrastructure.geospatial import TopoJSONEncoder
+
+# Builds one canvas circle marker per [lat, lon, kW, PLZ] row; popups are created from the
+# shared template only when a marker is opened.
+_STATION_MARKER_CALLBACK = """(function () {
+    var renderer = L.canvas({padding: 0.5});
+    return function (row) {
+        var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+            renderer: renderer,
+            radius: 8,
+            color: "#148f77",
+            weight: 3,
+            fillColor: "#1bbc9b",
+            fillOpacity: 1
+        });
+        marker.bindTooltip("⚡ " + row[2] + " kW");
+        marker.bindPopup(function () {
+            return '<div style="font-family: Arial; min-width: 150px;">'
+                + "<b>⚡ Charging Station</b><br>"
+                + '<hr style="margin: 5px 0;">'
+                + "📍 <b>PLZ:</b> " + row[3] + "<br>"
+                + "🔋 <b>Power:</b> " + row[2] + " kW"
+                + "</div>";
+        }, {maxWidth: 250});
+        return marker;
+    };
+})()"""
+
+
+def validate_plz_input(plz_input: str, valid_plzs: Container[int]) -> tuple[bool, str]:
     """
     Validate a postal code input string against Berlin requirements.
 
     Args:
         plz_input: The raw input string from the user.
-        valid_plzs: List of valid Berlin postal codes.
+        valid_plzs: Valid Berlin postal codes (e.g. a `PostalCodeRegistry` for O(1) membership checks).
 
     Returns:
         tuple[bool, str]: A tuple containing (is_valid, error_message).
@@ -76,10 +108,114 @@ def get_map_center_and_zoom(
     return default_center, default_zoom
 
 
+def get_map_zoom(folium_map: folium.Map) -> int | None:
+    """
+    Read the initial zoom level of a Folium map.
+
+    Args:
+        folium_map: The Folium map object.
+
+    Returns:
+        int | None: The zoom level the map is rendered at, or None if unknown.
+    """
+    return folium_map.options.get("zoom")
+
+
+def add_choropleth_layer(
+    folium_map: folium.Map,
+    topology: dict,
+    properties: dict[str, dict],
+    name: str,
+    tooltip_fields: dict[str, str],
+    line_color: str = "#666666",
+    line_weight: int = 1,
+    fill_opacity: float = 0.7,
+) -> int:
+    """
+    Add postal code areas to the map as a single data-driven TopoJson layer.
+
+    Every area is styled from its own properties, so the whole choropleth is one layer over
+    the shared, quantized boundary topology instead of one GeoJson layer per area.
+
+    Args:
+        folium_map: The Folium map object to add the layer to.
+        topology: Boundary topology from `GeoLocationService.get_boundaries_topology`.
+        properties: Area properties keyed by PLZ: `fill_color`, optional `line_color` /
+            `line_weight` overrides and pre-formatted tooltip values. Areas without
+            properties are not drawn.
+        name: Layer name.
+        tooltip_fields: Properties shown in the tooltip, mapped to their labels.
+        line_color: Default border color.
+        line_weight: Default border weight.
+        fill_opacity: Fill opacity of all areas.
+
+    Returns:
+        int: Number of areas added.
+    """
+    data = TopoJSONEncoder.with_properties(topology, properties)
+    object_name = next(iter(data["objects"]))
+    areas = len(data["objects"][object_name]["geometries"])
+    if areas == 0:
+        return 0
+
+    folium.TopoJson(
+        data,
+        object_path=f"objects.{object_name}",
+        name=name,
+        style_function=lambda feature: {
+            "fillColor": feature["properties"]["fill_color"],
+            "color": feature["properties"].get("line_color", line_color),
+            "weight": feature["properties"].get("line_weight", line_weight),
+            "fillOpacity": fill_opacity,
+        },
+        tooltip=folium.GeoJsonTooltip(fields=list(tooltip_fields), aliases=list(tooltip_fields.values())),
+    ).add_to(folium_map)
+    return areas
+
+
+def add_station_cluster_layer(
+    folium_map: folium.Map, stations: Iterable[ChargingStation], name: str = "Charging stations"
+) -> int:
+    """
+    Add charging stations to the map as one client-side clustered marker layer.
+
+    Stations are embedded as a compact array of [lat, lon, kW, PLZ] rows and turned into
+    canvas circle markers in the browser, so thousands of stations stay lightweight.
+
+    Args:
+        folium_map: The Folium map object to add the layer to.
+        stations: Charging stations to show.
+        name: Layer name.
+
+    Returns:
+        int: Number of stations added.
+    """
+    data = [
+        [
+            round(station.latitude, 6),
+            round(station.longitude, 6),
+            station.power_capacity.kilowatts,
+            station.postal_code.value,
+        ]
+        for station in stations
+    ]
+    if not data:
+        return 0
+
+    FastMarkerCluster(
+        data,
+        callback=_STATION_MARKER_CALLBACK,
+        name=name,
+        disableClusteringAtZoom=15,
+        chunkedLoading=True,
+    ).add_to(folium_map)
+    return len(data)
+
+
 def render_sidebar(  # pylint: disable=too-many-locals
     postal_code_residents_service,
     charging_station_service,
-    valid_plzs: list[int],
+    valid_plzs: Container[int],
 ) -> tuple[str, str, str, str]:
     """
     Render sidebar with search and filter options.
@@ -87,7 +223,7 @@ def render_sidebar(  # pylint: disable=too-many-locals
     Args:
         postal_code_residents_service: Service for postal code resident operations.
         charging_station_service: Service for charging station operations.
-        valid_plzs: List of valid Berlin postal codes.
+        valid_plzs: Valid Berlin postal codes.
 
     Returns:
         tuple: (selected_plz, view_mode, layer_selection, capacity_filter)
@@ -120,13 +256,13 @@ def render_sidebar(  # pylint: disable=too-many-locals
 
         if selected_plz != "All areas":
             postal_code_obj = PostalCode(selected_plz)
-            postal_code_area = charging_station_service.search_by_postal_code(postal_code_obj)
+            station_count = charging_station_service.count_stations(postal_code_obj)
             resident_data = postal_code_residents_service.get_resident_data(postal_code_obj)
 
-            if postal_code_area and resident_data:
+            if resident_data:
                 info_parts = []
                 info_parts.append(f"👥 Pop: {resident_data.get_population():,}")
-                info_parts.append(f"⚡ Stations: {postal_code_area.station_count}")
+                info_parts.append(f"⚡ Stations: {station_count}")
                 streamlit.sidebar.info("\n\n".join(info_parts))
             else:
                 streamlit.sidebar.warning(f"PLZ {selected_plz} is valid, but no data available.")
@@ -143,7 +279,7 @@ def render_sidebar(  # pylint: disable=too-many-locals
     capacity_filter = "All"
 
     if view_mode == "Basic View":
-        layer_options = ["Residents", "All Charging Stations"]
+        layer_options = ["Residents", "Population Density", "All Charging Stations"]
         if view_mode_changed:
             streamlit.session_state["layer_selection"] = "All Charging Stations"
     else:
@@ -12,6 +12,7 @@ from streamlit_folium import folium_static
 
 from src.shared.infrastructure import get_logger
 from src.shared.domain.events import IDomainEventPublisher
+from src.shared.domain.value_objects import PostalCodeRegistry
 from src.shared.application.services import (
     ChargingStationService,
     GeoLocationService,
@@ -49,7 +50,7 @@ class StreamlitApp:  # pylint: disable=too-many-instance-attributes
         demand_analysis_service: DemandAnalysisService,
         power_capacity_service: PowerCapacityService,
         event_bus: IDomainEventPublisher,
-        valid_plzs: list[int],
+        valid_plzs: PostalCodeRegistry,
     ):
         """
         Initialize EVision Berlin Streamlit application.
@@ -61,7 +62,7 @@ class StreamlitApp:  # pylint: disable=too-many-instance-attributes
             demand_analysis_service: Service for demand analysis.
             power_capacity_service: Service for power capacity analysis.
             event_bus: Domain event bus interface.
-            valid_plzs: List of valid Berlin postal codes for validation.
+            valid_plzs: Registry of valid Berlin postal codes for validation.
         """
         # Store services and configuration
         self.postal_code_residents_service = postal_code_residents_service
@@ -125,6 +126,8 @@ class StreamlitApp:  # pylint: disable=too-many-instance-attributes
         # Delegate to appropriate bounded context view
         if layer_selection == "Residents":
             self.station_discovery_view.render_residents_layer(folium_map, selected_postal_code)
+        elif layer_selection == "Population Density":
+            self.station_discovery_view.render_density_layer(folium_map, selected_postal_code)
         elif layer_selection == "All Charging Stations":
             self.station_discovery_view.render_charging_stations_layer(folium_map, selected_postal_code)
         elif layer_selection == "Power Capacity":
@@ -139,6 +142,7 @@ class StreamlitApp:  # pylint: disable=too-many-instance-attributes
         Render main content area with tabs for different views.
 
         Orchestrates the display of map view, demand analysis, and about sections.
+        Tabs are rendered lazily: only the selected tab is computed on a rerun.
         """
         # Get session state
         selected_plz = streamlit.session_state.get("selected_plz", "All areas")
@@ -150,17 +154,40 @@ class StreamlitApp:  # pylint: disable=too-many-instance-attributes
         else:
             layer_selection = streamlit.session_state.get("layer_selection", "All Charging Stations")
 
-        # Create tabs and delegate to views
-        main_tab, demand_analysis_tab, about_tab = streamlit.tabs(["🗺️ Map View", "📊 Demand Analysis", "ℹ️ About"])
+        # Create tabs and delegate to views; switching tabs reruns the script with the new selection,
+        # so sidebar interactions on one tab never compute the content of the others.
+        main_tab, demand_analysis_tab, about_tab = self._create_tabs(["🗺️ Map View", "📊 Demand Analysis", "ℹ️ About"])
 
-        with main_tab:
-            self._render_map_view(selected_plz, layer_selection)
+        # Tabs of Streamlit releases without lazy tabs have no `open` flag; all of them are rendered.
+        if getattr(main_tab, "open", True):
+            with main_tab:
+                self._render_map_view(selected_plz, layer_selection)
 
-        with demand_analysis_tab:
-            self.demand_analysis_view.render_demand_analysis(selected_plz)
+        if getattr(demand_analysis_tab, "open", True):
+            with demand_analysis_tab:
+                self.demand_analysis_view.render_demand_analysis(selected_plz)
 
-        with about_tab:
-            self.about_view.render_about()
+        if getattr(about_tab, "open", True):
+            with about_tab:
+                self.about_view.render_about()
+
+    @staticmethod
+    def _create_tabs(labels: list[str]):
+        """
+        Create the main tabs, lazily if the installed Streamlit supports it.
+
+        Args:
+            labels: Tab labels.
+
+        Returns:
+            Sequence of tab containers.
+        """
+        try:
+            return streamlit.tabs(labels, key="active_tab", on_change="rerun")
+        except TypeError:
+            # Older Streamlit releases do not accept `key` / `on_change`; fall back to eager tabs.
+            logger.warning("Installed Streamlit has no lazy tabs; rendering all tabs on every rerun.")
+            return streamlit.tabs(labels)
 
     def run(self):
         """
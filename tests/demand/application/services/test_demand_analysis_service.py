@@ -9,6 +9,8 @@ Test categories:
 - get_demand_analysis use case tests
 - update_demand_analysis use case tests
 - get_recommendations use case tests
+- analyze_areas_batch use case tests
+- Demand snapshot use case tests
 - Event publishing integration tests
 - Error handling tests
 """
@@ -24,9 +26,9 @@ from src.shared.domain.exceptions import InvalidPostalCodeError
 from src.shared.application.services import BaseService
 from src.shared.domain.value_objects import PostalCode
 from src.demand.application.services import DemandAnalysisService
-from src.demand.application.dtos import DemandAnalysisDTO
+from src.demand.application.dtos import DemandAnalysisDTO, DemandSnapshotDTO
 from src.demand.domain.aggregates import DemandAnalysisAggregate
-from src.demand.infrastructure.repositories import DemandAnalysisRepository
+from src.demand.infrastructure.repositories import DemandAnalysisRepository, InMemoryDemandAnalysisRepository
 
 
 # Test fixtures
@@ -473,6 +475,112 @@ class TestGetRecommendationsUseCase:
             demand_analysis_service.get_recommendations("10115")
 
 
+class TestAnalyzeAreasBatchUseCase:
+    """Test the vectorized analyze_areas_batch use case."""
+
+    def test_analyze_areas_batch_returns_columnar_result(self, demand_analysis_service):
+        """Test that all areas are analyzed in one result."""
+        result = demand_analysis_service.analyze_areas_batch(["10115", "12345"], [30000, 14000], [5, 4])
+
+        assert result.demand_priority.tolist() == ["High", "Medium"]
+        assert result.recommended_additional_stations.tolist() == [10, 3]
+
+    def test_analyze_areas_batch_does_not_store_or_publish(
+        self, demand_analysis_service, mock_repository, mock_event_bus
+    ):
+        """Test that the batch use case bypasses aggregates and events."""
+        demand_analysis_service.analyze_areas_batch(["10115"], [30000], [5])
+
+        mock_repository.save.assert_not_called()
+        mock_event_bus.publish.assert_not_called()
+
+
+class TestDemandSnapshotUseCase:
+    """Test building and caching of demand snapshots."""
+
+    AREAS = [
+        {"postal_code": "10115", "population": 30000, "station_count": 5},
+        {"postal_code": "12345", "population": 14000, "station_count": 4},
+        {"postal_code": "13579", "population": 9000, "station_count": 6},
+        {"postal_code": "invalid", "population": 1000, "station_count": 1},
+    ]
+
+    @pytest.fixture
+    def in_memory_service(self, mock_event_bus):
+        """Create a service backed by a real in-memory repository."""
+        return DemandAnalysisService(InMemoryDemandAnalysisRepository(), mock_event_bus)
+
+    def test_build_demand_snapshot_contains_analyses_and_recommendations(self, in_memory_service):
+        """Test that the snapshot holds one analysis and recommendation per valid area."""
+        snapshot = in_memory_service.build_demand_snapshot(self.AREAS, target_ratio=3000.0)
+
+        assert isinstance(snapshot, DemandSnapshotDTO)
+        assert list(snapshot.analyses) == ["10115", "12345", "13579"]
+        assert snapshot.target_ratio == 3000.0
+        assert snapshot.get_recommendations("10115")["recommended_additional_stations"] == 5
+        assert snapshot.get_recommendations("10115")["target_ratio"] == 3000.0
+        assert snapshot.get_analysis("99999") is None
+
+    def test_snapshot_high_priority_areas_and_counts(self, in_memory_service):
+        """Test that the snapshot answers the overview queries without the repository."""
+        snapshot = in_memory_service.build_demand_snapshot(self.AREAS)
+
+        assert [area.postal_code for area in snapshot.get_high_priority_areas()] == ["10115"]
+        assert snapshot.count_by_priority() == {"High": 1, "Medium": 1, "Low": 1}
+
+    def test_snapshot_ranks_equally_urgent_areas_by_density(self, in_memory_service):
+        """Test that high-priority areas of equal urgency are ranked by residents per km²."""
+        areas = [
+            {"postal_code": "12629", "population": 30000, "station_count": 2, "residents_per_km2": 2500.0},
+            {"postal_code": "10437", "population": 30000, "station_count": 2, "residents_per_km2": 24000.0},
+            {"postal_code": "13591", "population": 30000, "station_count": 2, "residents_per_km2": float("nan")},
+            {"postal_code": "10115", "population": 30000, "station_count": 2, "residents_per_km2": 13000.0},
+        ]
+
+        snapshot = in_memory_service.build_demand_snapshot(areas)
+
+        assert [area.postal_code for area in snapshot.get_high_priority_areas()] == ["10437", "10115", "12629", "13591"]
+        assert snapshot.get_density("10437") == 24000.0
+        assert snapshot.get_density("13591") is None
+        assert snapshot.get_density("99999") is None
+
+    def test_snapshot_urgency_ranks_before_density(self, in_memory_service):
+        """Test that a more urgent area ranks first even if it is less dense."""
+        areas = [
+            {"postal_code": "10437", "population": 12000, "station_count": 2, "residents_per_km2": 24000.0},
+            {"postal_code": "12629", "population": 30000, "station_count": 2, "residents_per_km2": 2500.0},
+        ]
+
+        snapshot = in_memory_service.build_demand_snapshot(areas)
+
+        assert [area.postal_code for area in snapshot.get_high_priority_areas()] == ["12629", "10437"]
+
+    def test_get_demand_snapshot_builds_once_per_target_ratio(self, in_memory_service):
+        """Test that areas are only loaded when no snapshot is cached for the target ratio."""
+        load_areas = Mock(return_value=self.AREAS)
+
+        first = in_memory_service.get_demand_snapshot(load_areas)
+        second = in_memory_service.get_demand_snapshot(load_areas)
+        other_ratio = in_memory_service.get_demand_snapshot(load_areas, target_ratio=3000.0)
+
+        assert first is second
+        assert other_ratio is not first
+        assert load_areas.call_count == 2
+
+    def test_get_demand_snapshot_uses_shared_cache(self, mock_event_bus):
+        """Test that services sharing a cache reuse each other's snapshots."""
+        cache = {}
+        load_areas = Mock(return_value=self.AREAS)
+        first_service = DemandAnalysisService(InMemoryDemandAnalysisRepository(), mock_event_bus, snapshot_cache=cache)
+        second_service = DemandAnalysisService(InMemoryDemandAnalysisRepository(), mock_event_bus, snapshot_cache=cache)
+
+        snapshot = first_service.get_demand_snapshot(load_areas)
+
+        assert second_service.get_demand_snapshot(load_areas) is snapshot
+        assert cache == {2000.0: snapshot}
+        load_areas.assert_called_once()
+
+
 class TestEventPublishingIntegration:
     """Test event publishing integration."""
 
@@ -0,0 +1,111 @@
+"""
+Unit Tests for BatchDemandCalculator.
+
+Test categories:
+- Equivalence with the aggregate business rules
+- Columnar result tests
+- Edge cases and validation
+"""
+
+import numpy as np
+import pytest
+
+from src.shared.domain.value_objects import PostalCode
+from src.demand.domain.aggregates import DemandAnalysisAggregate
+from src.demand.domain.services import BatchDemandCalculator, BatchDemandResult
+
+# Populations and station counts around every threshold (2000, 3000, 5000, 10000 residents/station).
+POPULATIONS = [0, 1, 1999, 2000, 2001, 3000, 3001, 4999, 5000, 5001, 9999, 10000, 10001, 30000]
+STATION_COUNTS = [0, 1, 2, 3, 7]
+
+
+class TestBatchDemandCalculatorEquivalence:
+    """Test that the vectorized rules match DemandAnalysisAggregate."""
+
+    @pytest.mark.parametrize("target_ratio", [2000.0, 1500.0, 3333.0])
+    def test_matches_aggregate_for_all_threshold_combinations(self, target_ratio):
+        """Test every metric against the aggregate on a grid around the thresholds."""
+        pairs = [(population, stations) for population in POPULATIONS for stations in STATION_COUNTS]
+
+        result = BatchDemandCalculator.calculate(
+            ["10115"] * len(pairs),
+            [population for population, _ in pairs],
+            [stations for _, stations in pairs],
+            target_ratio=target_ratio,
+        )
+
+        for i, (population, stations) in enumerate(pairs):
+            aggregate = DemandAnalysisAggregate.create(PostalCode("10115"), population, stations)
+            priority = aggregate.demand_priority
+
+            assert result.demand_priority[i] == priority.level.value
+            assert result.residents_per_station[i] == priority.residents_per_station
+            assert result.urgency_score[i] == priority.get_urgency_score()
+            assert result.is_high_priority[i] == aggregate.is_high_priority()
+            assert result.needs_expansion[i] == aggregate.needs_infrastructure_expansion()
+            assert result.coverage_assessment[i] == aggregate.get_coverage_assessment().value
+            assert result.recommended_additional_stations[i] == aggregate.calculate_recommended_stations(target_ratio)
+
+
+class TestBatchDemandResult:
+    """Test the columnar result."""
+
+    def test_result_keeps_input_order(self):
+        """Test that results are returned per area in input order."""
+        result = BatchDemandCalculator.calculate(["10115", "10117"], [30000, 1000], [5, 1])
+
+        assert isinstance(result, BatchDemandResult)
+        assert len(result) == 2
+        assert result.postal_codes.tolist() == ["10115", "10117"]
+        assert result.demand_priority.tolist() == ["High", "Low"]
+        assert result.target_ratio == 2000.0
+
+    def test_to_dict_uses_dto_field_names(self):
+        """Test that the columns are named like DemandAnalysisDTO fields."""
+        columns = BatchDemandCalculator.calculate(["10115"], [30000], [5]).to_dict()
+
+        assert list(columns) == [
+            "postal_code",
+            "population",
+            "station_count",
+            "demand_priority",
+            "residents_per_station",
+            "urgency_score",
+            "is_high_priority",
+            "needs_expansion",
+            "coverage_assessment",
+            "recommended_additional_stations",
+        ]
+        assert all(isinstance(column, np.ndarray) for column in columns.values())
+
+    def test_empty_input(self):
+        """Test that no areas yield an empty result."""
+        result = BatchDemandCalculator.calculate([], [], [])
+
+        assert len(result) == 0
+        assert result.demand_priority.size == 0
+
+
+class TestBatchDemandCalculatorValidation:
+    """Test input validation."""
+
+    def test_mismatched_lengths_raise(self):
+        """Test that all input columns must have the same length."""
+        with pytest.raises(ValueError, match="same length"):
+            BatchDemandCalculator.calculate(["10115", "10117"], [1000], [1, 2])
+
+    def test_negative_population_raises(self):
+        """Test that negative populations are rejected."""
+        with pytest.raises(ValueError, match="Population cannot be negative"):
+            BatchDemandCalculator.calculate(["10115"], [-1], [1])
+
+    def test_negative_station_count_raises(self):
+        """Test that negative station counts are rejected."""
+        with pytest.raises(ValueError, match="Station count cannot be negative"):
+            BatchDemandCalculator.calculate(["10115"], [1000], [-1])
+
+    @pytest.mark.parametrize("target_ratio", [0, -100.0])
+    def test_non_positive_target_ratio_raises(self, target_ratio):
+        """Test that the target ratio must be positive."""
+        with pytest.raises(ValueError, match="Target ratio must be positive"):
+            BatchDemandCalculator.calculate(["10115"], [1000], [1], target_ratio=target_ratio)
@@ -206,6 +206,18 @@ class TestPostalCodeAreaAggregateQueries:
         assert fast2 in categories["FAST"]
         assert normal in categories["NORMAL"]
 
+    def test_get_statistics_summarizes_stations(self, valid_postal_code, mock_charging_station, mock_slow_station):
+        """Test get_statistics returns counts and capacity of the area's stations."""
+        aggregate = PostalCodeAreaAggregate.create_with_stations(
+            valid_postal_code, [mock_charging_station, mock_slow_station]
+        )
+
+        statistics = aggregate.get_statistics()
+
+        assert statistics.station_count == 2
+        assert statistics.fast_charger_count == 1
+        assert statistics.total_capacity_kw == aggregate.get_total_capacity_kw()
+
 
 class TestPostalCodeAreaAggregateCommands:
     """Test command methods that modify state."""
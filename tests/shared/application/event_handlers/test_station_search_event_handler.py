@@ -6,6 +6,7 @@ Test categories:
 - handle_failure method tests
 - handle_no_results method tests
 - handle_stations_found method tests
+- handle_statistics_queried method tests
 """
 
 # pylint: disable=redefined-outer-name
@@ -20,6 +21,7 @@ from src.shared.domain.events import (
     StationSearchFailedEvent,
     StationSearchPerformedEvent,
     StationsFoundEvent,
+    StationStatisticsQueriedEvent,
 )
 from src.shared.domain.value_objects import PostalCode
 
@@ -140,6 +142,24 @@ class TestStationSearchEventHandlerHandleStationsFound:
         )
 
 
+class TestStationSearchEventHandlerHandleStatisticsQueried:
+    """Test handle_statistics_queried method."""
+
+    @patch("src.shared.application.event_handlers.station_search_event_handler.logger")
+    def test_handle_statistics_queried_logs_summary(self, mock_logger):
+        """Test that handle_statistics_queried logs one summary line for a bulk query."""
+        event = StationStatisticsQueriedEvent(postal_codes_queried=190, areas_without_stations=4, stations_total=3700)
+
+        StationSearchEventHandler.handle_statistics_queried(event)
+
+        mock_logger.info.assert_called_once_with(
+            "[EVENT] Station statistics queried for %d postal codes (%d stations, %d areas without stations)",
+            190,
+            3700,
+            4,
+        )
+
+
 class TestStationSearchEventHandlerIntegration:
     """Integration tests for StationSearchEventHandler."""
 
@@ -164,6 +164,23 @@ class TestBaseServicePublishEvents:
         assert calls[2] == call(event3)
 
 
+class TestBaseServicePublishEvent:
+    """Test publishing single events not raised by an aggregate."""
+
+    def test_publish_event_forwards_to_event_bus(self, base_service_with_event_bus, mock_event_bus):
+        """Test that publish_event publishes the given event."""
+        event = MockDomainEvent()
+
+        base_service_with_event_bus.publish_event(event)
+
+        mock_event_bus.publish.assert_called_once_with(event)
+
+    def test_publish_event_without_event_bus_does_nothing(self, base_service_without_event_bus):
+        """Test that publish_event returns early when no event bus configured."""
+        # Should not raise error
+        base_service_without_event_bus.publish_event(MockDomainEvent())
+
+
 class TestBaseServiceEventBusInteraction:
     """Test interaction with event bus."""
 
@@ -5,6 +5,7 @@ Test categories:
 - Initialization tests
 - Search by postal code tests
 - Find stations by postal code tests
+- Bulk search by postal codes tests
 - Event publishing integration tests
 """
 
@@ -15,14 +16,16 @@ from unittest.mock import Mock
 import pytest
 
 from src.shared.domain.entities import ChargingStation
-from src.shared.domain.value_objects import PostalCode
+from src.shared.domain.value_objects import PostalCode, StationStatistics
 from src.shared.application.services import BaseService, ChargingStationService
 from src.shared.domain.events import (
     IDomainEventPublisher,
     StationSearchFailedEvent,
     NoStationsFoundEvent,
     StationsFoundEvent,
+    StationStatisticsQueriedEvent,
 )
+from src.shared.infrastructure.caching import LRUCache
 from src.shared.infrastructure.repositories import ChargingStationRepository
 from src.discovery.application.dtos import PostalCodeAreaDTO
 
@@ -255,6 +258,145 @@ class TestFindStationsByPostalCode:
         assert isinstance(result, list)
 
 
+class TestSearchByPostalCodeResultCache:
+    """Test search_by_postal_code with a result cache."""
+
+    def test_repeated_search_is_served_from_cache(self, mock_repository, mock_event_bus, mock_station_list):
+        """Test that the repository is queried once per postal code and events are published on every search."""
+        service = ChargingStationService(mock_repository, mock_event_bus, result_cache=LRUCache())
+        mock_repository.find_stations_by_postal_code.return_value = mock_station_list
+
+        first = service.search_by_postal_code(PostalCode("10115"))
+        second = service.search_by_postal_code(PostalCode("10115"))
+
+        assert second is first
+        mock_repository.find_stations_by_postal_code.assert_called_once()
+        published = [call.args[0] for call in mock_event_bus.publish.call_args_list]
+        assert [type(event) for event in published] == [StationsFoundEvent, StationsFoundEvent]
+        assert all(event.stations_found == 3 for event in published)
+        assert service.result_cache_stats.hits == 1
+        assert service.result_cache_stats.misses == 1
+
+    def test_failed_search_is_not_cached(self, mock_repository, mock_event_bus):
+        """Test that a failed search is retried on the next call."""
+        service = ChargingStationService(mock_repository, mock_event_bus, result_cache=LRUCache())
+        mock_repository.find_stations_by_postal_code.side_effect = [ConnectionError("Connection failed"), []]
+
+        with pytest.raises(ConnectionError):
+            service.search_by_postal_code(PostalCode("10115"))
+
+        assert service.search_by_postal_code(PostalCode("10115")).station_count == 0
+        assert mock_repository.find_stations_by_postal_code.call_count == 2
+
+    def test_cached_empty_search_publishes_no_stations_event(self, mock_repository, mock_event_bus):
+        """Test that a cache hit for an area without stations publishes NoStationsFoundEvent again."""
+        service = ChargingStationService(mock_repository, mock_event_bus, result_cache=LRUCache())
+        mock_repository.find_stations_by_postal_code.return_value = []
+
+        service.search_by_postal_code(PostalCode("10115"))
+        service.search_by_postal_code(PostalCode("10115"))
+
+        published = [call.args[0] for call in mock_event_bus.publish.call_args_list]
+        assert [type(event) for event in published] == [NoStationsFoundEvent, NoStationsFoundEvent]
+        assert service.result_cache_stats.hits == 1
+
+    def test_no_cache_stats_without_cache(self, charging_station_service):
+        """Test that services without a result cache report no stats."""
+        assert charging_station_service.result_cache_stats is None
+
+
+class TestSearchByPostalCodes:
+    """Test search_by_postal_codes method."""
+
+    def test_bulk_search_returns_dto_per_postal_code(
+        self, charging_station_service, mock_station_list, mock_repository, mock_event_bus
+    ):
+        """Test that every requested postal code gets a DTO and its own event."""
+        mock_repository.find_stations_by_postal_codes.return_value = {"10115": mock_station_list}
+
+        result = charging_station_service.search_by_postal_codes([PostalCode("10115"), PostalCode("10117")])
+
+        mock_repository.find_stations_by_postal_codes.assert_called_once()
+        assert result["10115"].station_count == 3
+        assert result["10117"].station_count == 0
+        published = [call.args[0] for call in mock_event_bus.publish.call_args_list]
+        assert [type(event) for event in published] == [StationsFoundEvent, NoStationsFoundEvent]
+
+    def test_bulk_search_publishes_failed_events_on_exception(
+        self, charging_station_service, mock_repository, mock_event_bus
+    ):
+        """Test that a failing bulk query publishes a failure event per area and re-raises."""
+        mock_repository.find_stations_by_postal_codes.side_effect = ConnectionError("Connection failed")
+
+        with pytest.raises(ConnectionError):
+            charging_station_service.search_by_postal_codes([PostalCode("10115"), PostalCode("10117")])
+
+        published = [call.args[0] for call in mock_event_bus.publish.call_args_list]
+        assert len(published) == 2
+        assert all(isinstance(event, StationSearchFailedEvent) for event in published)
+
+    def test_find_stations_by_postal_codes_delegates_to_repository(self, charging_station_service, mock_repository):
+        """Test that the bulk query interface returns the repository result unchanged."""
+        mock_repository.find_stations_by_postal_codes.return_value = {"10115": []}
+
+        assert charging_station_service.find_stations_by_postal_codes([PostalCode("10115")]) == {"10115": []}
+
+
+class TestGetAreaStatistics:
+    """Test get_area_statistics method."""
+
+    def test_returns_dtos_from_repository_statistics(self, charging_station_service, mock_repository):
+        """Test that statistics are converted to DTOs without loading stations."""
+        mock_repository.get_station_statistics.return_value = {
+            "10115": StationStatistics(station_count=6, fast_charger_count=2, total_capacity_kw=180.0)
+        }
+
+        result = charging_station_service.get_area_statistics([PostalCode("10115")])
+
+        assert result["10115"].station_count == 6
+        assert result["10115"].average_power_kw == 30.0
+        assert result["10115"].is_well_equipped is True
+        assert result["10115"].coverage_level == "ADEQUATE"
+        mock_repository.find_stations_by_postal_codes.assert_not_called()
+
+    def test_publishes_single_summary_event(self, charging_station_service, mock_repository, mock_event_bus):
+        """Test that a bulk query records usage with one summary event instead of per-area events."""
+        mock_repository.get_station_statistics.return_value = {
+            "10115": StationStatistics(station_count=6, fast_charger_count=2, total_capacity_kw=180.0),
+            "10117": StationStatistics(),
+            "10119": StationStatistics(station_count=1, total_capacity_kw=11.0),
+        }
+
+        charging_station_service.get_area_statistics([PostalCode("10115"), PostalCode("10117"), PostalCode("10119")])
+
+        mock_event_bus.publish.assert_called_once()
+        event = mock_event_bus.publish.call_args[0][0]
+        assert isinstance(event, StationStatisticsQueriedEvent)
+        assert event.postal_codes_queried == 3
+        assert event.areas_without_stations == 1
+        assert event.stations_total == 7
+
+    def test_get_area_stats_for_single_postal_code(self, charging_station_service, mock_repository, mock_event_bus):
+        """Test that single-area metrics are read without building aggregates or publishing events."""
+        mock_repository.get_station_statistics.return_value = {
+            "10115": StationStatistics(station_count=2, fast_charger_count=1, total_capacity_kw=72.0)
+        }
+
+        result = charging_station_service.get_area_stats(PostalCode("10115"))
+
+        assert result.postal_code == "10115"
+        assert result.has_fast_charging is True
+        mock_event_bus.publish.assert_not_called()
+
+    def test_count_stations(self, charging_station_service, mock_repository, mock_event_bus):
+        """Test that counting stations reads the repository statistics and publishes nothing."""
+        mock_repository.get_station_statistics.return_value = {"10115": StationStatistics(station_count=4)}
+
+        assert charging_station_service.count_stations(PostalCode("10115")) == 4
+        mock_repository.get_station_statistics.assert_called_once()
+        mock_event_bus.publish.assert_not_called()
+
+
 class TestChargingStationServiceIntegration:
     """Integration tests for ChargingStationService."""
 
@@ -14,8 +14,9 @@ from unittest.mock import Mock
 import pytest
 
 from src.shared.application.services import BaseService, GeoLocationService
-from src.shared.domain.value_objects import GeoLocation, PostalCode
+from src.shared.domain.value_objects import GeoLocation, PostalCode, PostalCodeRegistry
 from src.shared.domain.events import IDomainEventPublisher
+from src.shared.infrastructure.caching import LRUCache
 from src.shared.infrastructure.repositories import GeoDataRepository
 
 
@@ -27,6 +28,10 @@ def mock_repository():
     # Configure the mock to have the necessary methods
     repository.fetch_geolocation_data = Mock()
     repository.get_all_postal_codes = Mock()
+    repository.get_boundary_geojson = Mock()
+    repository.get_boundaries_feature_collection = Mock()
+    repository.get_boundaries_topology = Mock()
+    repository.get_postal_code_registry = Mock()
     return repository
 
 
@@ -143,6 +148,31 @@ class TestGetGeolocationDataForPostalCode:
         mock_event_bus.publish.assert_not_called()
 
 
+class TestGeolocationResultCache:
+    """Test get_geolocation_data_for_postal_code with a result cache."""
+
+    def test_repeated_lookup_is_served_from_cache(self, mock_repository, mock_event_bus, mock_geo_location):
+        """Test that the repository is queried once per postal code."""
+        service = GeoLocationService(mock_repository, mock_event_bus, result_cache=LRUCache())
+        mock_repository.fetch_geolocation_data.return_value = mock_geo_location
+
+        assert service.get_geolocation_data_for_postal_code(PostalCode("10115")) is mock_geo_location
+        assert service.get_geolocation_data_for_postal_code(PostalCode("10115")) is mock_geo_location
+
+        mock_repository.fetch_geolocation_data.assert_called_once()
+
+    def test_missing_geolocation_is_cached(self, mock_repository, mock_event_bus):
+        """Test that postal codes without geodata are not looked up again."""
+        service = GeoLocationService(mock_repository, mock_event_bus, result_cache=LRUCache())
+        mock_repository.fetch_geolocation_data.return_value = None
+
+        service.get_geolocation_data_for_postal_code(PostalCode("10115"))
+        assert service.get_geolocation_data_for_postal_code(PostalCode("10115")) is None
+
+        mock_repository.fetch_geolocation_data.assert_called_once()
+        assert service.result_cache_stats.hit_rate == 0.5
+
+
 class TestGetAllPostalCodes:
     """Test get_all_plzs method."""
 
@@ -196,6 +226,52 @@ class TestGetAllPostalCodes:
         assert result == large_list
 
 
+class TestBoundaryGeoJSON:
+    """Test GeoJSON boundary accessors."""
+
+    def test_get_boundary_geojson_delegates_to_repository(
+        self, geo_location_service, mock_repository, valid_postal_code
+    ):
+        """Test that the cached GeoJSON Feature is returned from the repository."""
+        feature = {"type": "Feature", "id": "10115", "properties": {"PLZ": "10115"}, "geometry": {}}
+        mock_repository.get_boundary_geojson.return_value = feature
+
+        result = geo_location_service.get_boundary_geojson(valid_postal_code)
+
+        assert result is feature
+        mock_repository.get_boundary_geojson.assert_called_once_with(valid_postal_code, None)
+
+    def test_get_boundaries_feature_collection_delegates_to_repository(
+        self, geo_location_service, mock_repository, mock_event_bus
+    ):
+        """Test that the bulk accessor passes the postal codes through and publishes no events."""
+        collection = {"type": "FeatureCollection", "features": []}
+        mock_repository.get_boundaries_feature_collection.return_value = collection
+
+        result = geo_location_service.get_boundaries_feature_collection(zoom=10)
+
+        assert result is collection
+        mock_repository.get_boundaries_feature_collection.assert_called_once_with(None, 10)
+        mock_event_bus.publish.assert_not_called()
+
+    def test_get_boundaries_topology_delegates_to_repository(self, geo_location_service, mock_repository):
+        """Test that the topology is returned from the repository for the given zoom."""
+        topology = {"type": "Topology", "objects": {}, "arcs": []}
+        mock_repository.get_boundaries_topology.return_value = topology
+
+        result = geo_location_service.get_boundaries_topology(12)
+
+        assert result is topology
+        mock_repository.get_boundaries_topology.assert_called_once_with(12)
+
+    def test_get_postal_code_registry_delegates_to_repository(self, geo_location_service, mock_repository):
+        """Test that the postal code registry is returned from the repository."""
+        registry = PostalCodeRegistry(["10115"])
+        mock_repository.get_postal_code_registry.return_value = registry
+
+        assert geo_location_service.get_postal_code_registry() is registry
+
+
 class TestGeoLocationServiceIntegration:
     """Integration tests for GeoLocationService."""
 
@@ -11,6 +11,7 @@ Test categories:
 
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from src.shared.application.services import BaseService, PostalCodeResidentService
@@ -18,6 +19,7 @@ from src.shared.domain.enums import PopulationDensityCategory
 from src.shared.domain.events import IDomainEventPublisher
 from src.shared.domain.exceptions import InvalidPostalCodeError
 from src.shared.domain.value_objects import PostalCode, PopulationData
+from src.shared.infrastructure.caching import LRUCache
 from src.shared.infrastructure.repositories import PopulationRepository
 
 
@@ -28,6 +30,8 @@ def mock_repository():
     repository = Mock(spec=PopulationRepository)
     repository.get_all_postal_codes = Mock()
     repository.get_residents_count = Mock()
+    repository.get_residents_counts = Mock()
+    repository.get_area_sizes = Mock()
     return repository
 
 
@@ -327,6 +331,59 @@ class TestGetResidentData:
         mock_event_bus.publish.assert_not_called()
 
 
+class TestResidentDataResultCache:
+    """Test get_resident_data with a result cache."""
+
+    def test_repeated_lookup_is_served_from_cache(self, mock_repository, mock_event_bus, valid_postal_code):
+        """Test that the repository is queried once per postal code."""
+        service = PostalCodeResidentService(mock_repository, mock_event_bus, result_cache=LRUCache())
+        mock_repository.get_residents_count.return_value = 5000
+
+        first = service.get_resident_data(valid_postal_code)
+        second = service.get_resident_data(PostalCode(valid_postal_code.value))
+
+        assert second is first
+        mock_repository.get_residents_count.assert_called_once_with(valid_postal_code)
+        assert service.result_cache_stats.hits == 1
+
+
+class TestGetResidentsCounts:
+    """Test get_residents_counts method."""
+
+    def test_returns_repository_counts(self, postal_code_resident_service, mock_repository):
+        """Test that counts come from a single bulk repository call."""
+        postal_codes = [PostalCode("10115"), PostalCode("10117")]
+        mock_repository.get_residents_counts.return_value = np.array([5000, 0])
+
+        result = postal_code_resident_service.get_residents_counts(postal_codes)
+
+        assert result.tolist() == [5000, 0]
+        mock_repository.get_residents_counts.assert_called_once_with(postal_codes)
+        mock_repository.get_residents_count.assert_not_called()
+
+
+class TestGetAreaDensities:
+    """Test get_area_densities method."""
+
+    def test_combines_population_area_and_infrastructure(self, postal_code_resident_service, mock_repository):
+        """Test that densities are calculated from bulk population and area lookups."""
+        postal_codes = [PostalCode("10115"), PostalCode("12629")]
+        mock_repository.get_residents_counts.return_value = np.array([24000, 10000])
+        mock_repository.get_area_sizes.return_value = np.array([2.0, 4.0])
+
+        result = postal_code_resident_service.get_area_densities(
+            postal_codes, station_counts=[10, 2], total_capacity_kw=[500.0, 44.0]
+        )
+
+        assert result.postal_codes.tolist() == ["10115", "12629"]
+        assert result.residents_per_km2.tolist() == [12000.0, 2500.0]
+        assert result.stations_per_km2.tolist() == [5.0, 0.5]
+        assert result.kw_per_km2.tolist() == [250.0, 11.0]
+        assert result.density_category.tolist() == ["HIGH", "LOW"]
+        mock_repository.get_residents_counts.assert_called_once_with(postal_codes)
+        mock_repository.get_area_sizes.assert_called_once_with(postal_codes)
+
+
 class TestPostalCodeResidentServiceIntegration:
     """Integration tests for PostalCodeResidentService."""
 
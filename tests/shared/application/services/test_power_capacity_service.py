@@ -28,6 +28,15 @@ def mock_repository():
     """Create a mock ChargingStationRepository."""
     repository = Mock(spec=ChargingStationRepository)
     repository.find_stations_by_postal_code = Mock()
+    # Bulk lookups resolve through the single-code mock, like the interface's default implementation.
+    repository.find_stations_by_postal_codes = Mock(
+        side_effect=lambda postal_codes: {
+            postal_code.value: repository.find_stations_by_postal_code(postal_code) for postal_code in postal_codes
+        }
+    )
+    repository.get_station_statistics = Mock(
+        side_effect=lambda postal_codes: ChargingStationRepository.get_station_statistics(repository, postal_codes)
+    )
     return repository
 
 
@@ -152,6 +161,26 @@ class TestGetPowerCapacityByPostalCode:
         assert result_dict["10117"].total_capacity_kw == 150.0
         assert result_dict["10119"].total_capacity_kw == 0.0
 
+    def test_queries_repository_once_for_all_postal_codes(self, power_capacity_service, mock_repository):
+        """Test that all postal codes are fetched with a single bulk repository call."""
+        postal_codes = [PostalCode("10115"), PostalCode("10117")]
+        mock_repository.find_stations_by_postal_code.return_value = []
+
+        power_capacity_service.get_power_capacity_by_postal_code(postal_codes)
+
+        mock_repository.find_stations_by_postal_codes.assert_called_once_with(postal_codes)
+
+    def test_accepts_generator_of_postal_codes(self, power_capacity_service, mock_station_list, mock_repository):
+        """Test that a one-shot iterable yields a DTO for every postal code."""
+        mock_repository.find_stations_by_postal_code.return_value = mock_station_list
+
+        result = power_capacity_service.get_power_capacity_by_postal_code(
+            PostalCode(value) for value in ("10115", "10117")
+        )
+
+        assert [dto.postal_code for dto in result] == ["10115", "10117"]
+        assert all(dto.total_capacity_kw == 72.0 for dto in result)
+
     def test_calls_repository_with_correct_postal_code(
         self, power_capacity_service, valid_postal_code, mock_repository
     ):
@@ -343,6 +372,29 @@ class TestGetColorForCapacity:
         assert color_high != color_low
 
 
+class TestGetColorsForCapacities:
+    """Test get_colors_for_capacities method."""
+
+    def test_matches_single_value_colors(self, power_capacity_service):
+        """Test that the vectorized colors equal the per-capacity colors."""
+        capacities = [0.0, 10.0, 50.0, 100.0, 150.0]
+
+        colors = power_capacity_service.get_colors_for_capacities(capacities, 100.0)
+
+        assert colors == [power_capacity_service.get_color_for_capacity(capacity, 100.0) for capacity in capacities]
+        assert colors[0] == "#f0f0f0"
+        assert colors[-1] == "#0d47a1"
+
+    def test_defaults_to_largest_capacity(self, power_capacity_service):
+        """Test that the largest capacity gets the darkest blue without an explicit maximum."""
+        assert power_capacity_service.get_colors_for_capacities([10.0, 40.0])[-1] == "#0d47a1"
+
+    def test_all_zero_and_empty(self, power_capacity_service):
+        """Test that no capacity yields light gray and no input yields no colors."""
+        assert power_capacity_service.get_colors_for_capacities([0.0, 0.0]) == ["#f0f0f0", "#f0f0f0"]
+        assert not power_capacity_service.get_colors_for_capacities([])
+
+
 class TestFilterByCapacityCategory:
     """Test filter_by_capacity_category method."""
 
@@ -6,6 +6,7 @@ Test categories:
 - Business rules (fast charging, categorization)
 - PowerCapacity integration
 - Edge cases and boundary values
+- Identity and memory layout
 """
 
 # pylint: disable=redefined-outer-name  # pytest fixtures redefine names
@@ -445,3 +446,28 @@ class TestChargingStationRealWorldScenarios:
         assert station.power_capacity.kilowatts == 350.0
         assert station.is_fast_charger() is True
         assert station.get_charging_category() == ChargingCategory.ULTRA
+
+
+class TestChargingStationIdentity:
+    """Test entity identity and compact representation."""
+
+    def test_station_id_is_used_as_identity(self):
+        """Test that a given register ID is the entity identity."""
+        first = ChargingStation("10115", 52.52, 13.40, 22.0, station_id="1010338")
+        second = ChargingStation("10117", 52.50, 13.39, 50.0, station_id="1010338")
+
+        assert first.id == "1010338"
+        assert first == second
+        assert hash(first) == hash(second)
+
+    def test_generated_identity_is_deterministic(self):
+        """Test that stations without an ID get the same identity for the same attributes."""
+        assert ChargingStation("10115", 52.52, 13.40, 22.0).id == ChargingStation("10115", 52.52, 13.40, 22.0).id
+
+    def test_station_has_no_instance_dict(self):
+        """Test that stations are slotted and reject unknown attributes."""
+        station = ChargingStation("10115", 52.52, 13.40, 22.0, station_id="1")
+
+        assert not hasattr(station, "__dict__")
+        with pytest.raises(AttributeError):
+            station.operator = "unknown"  # pylint: disable=assigning-non-slot
@@ -0,0 +1,39 @@
+"""Tests for Station Statistics Queried Event."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.shared.domain.events import StationStatisticsQueriedEvent
+
+
+def test_initialization():
+    """
+    Test that the event is initialized correctly with required fields.
+    """
+    event = StationStatisticsQueriedEvent(postal_codes_queried=3, areas_without_stations=1, stations_total=7)
+
+    assert event.postal_codes_queried == 3
+    assert event.areas_without_stations == 1
+    assert event.stations_total == 7
+    assert event.event_id is not None
+    assert event.occurred_at is not None
+
+
+def test_immutability():
+    """
+    Test that attributes cannot be changed after creation.
+    """
+    event = StationStatisticsQueriedEvent(postal_codes_queried=3, areas_without_stations=1, stations_total=7)
+
+    with pytest.raises(FrozenInstanceError):
+        event.stations_total = 10
+
+
+def test_event_type_name():
+    """
+    Test that the event type name is correct.
+    """
+    event = StationStatisticsQueriedEvent(postal_codes_queried=0, areas_without_stations=0, stations_total=0)
+
+    assert event.event_type() == "StationStatisticsQueriedEvent"
@@ -0,0 +1,92 @@
+"""
+Unit Tests for AreaDensityCalculator.
+
+Test categories:
+- Density calculations
+- Density categorization
+- Edge cases and validation
+"""
+
+import numpy as np
+import pytest
+
+from src.shared.domain.services import AreaDensityCalculator, AreaDensityResult, PopulationAnalysisService
+
+
+class TestAreaDensityCalculation:
+    """Test the per-km² metrics."""
+
+    def test_calculates_densities_per_km2(self):
+        """Test residents, stations and kW per km² in input order."""
+        result = AreaDensityCalculator.calculate(
+            ["10115", "12629"], [24000, 10000], [2.0, 4.0], station_count=[10, 2], total_capacity_kw=[500.0, 44.0]
+        )
+
+        assert isinstance(result, AreaDensityResult)
+        assert len(result) == 2
+        assert result.postal_codes.tolist() == ["10115", "12629"]
+        assert result.area_km2.tolist() == [2.0, 4.0]
+        assert result.residents_per_km2.tolist() == [12000.0, 2500.0]
+        assert result.stations_per_km2.tolist() == [5.0, 0.5]
+        assert result.kw_per_km2.tolist() == [250.0, 11.0]
+
+    def test_infrastructure_defaults_to_zero(self):
+        """Test that station and capacity densities are zero when not given."""
+        result = AreaDensityCalculator.calculate(["10115"], [24000], [2.0])
+
+        assert result.stations_per_km2.tolist() == [0.0]
+        assert result.kw_per_km2.tolist() == [0.0]
+
+    @pytest.mark.parametrize("area_km2", [0.0, -1.0, float("nan")])
+    def test_unknown_area_yields_nan(self, area_km2):
+        """Test that areas without a positive size get NaN densities instead of infinity."""
+        result = AreaDensityCalculator.calculate(["10115"], [24000], [area_km2], station_count=[3])
+
+        assert np.isnan(result.residents_per_km2[0])
+        assert np.isnan(result.stations_per_km2[0])
+        assert np.isnan(result.kw_per_km2[0])
+        assert result.density_category.tolist() == ["LOW"]
+
+    def test_to_dict_columns(self):
+        """Test that the columns can be turned into a DataFrame."""
+        columns = AreaDensityCalculator.calculate(["10115"], [24000], [2.0]).to_dict()
+
+        assert list(columns) == [
+            "postal_code",
+            "area_km2",
+            "residents_per_km2",
+            "stations_per_km2",
+            "kw_per_km2",
+            "density_category",
+        ]
+
+
+class TestAreaDensityCategory:
+    """Test that the vectorized categories match PopulationAnalysisService."""
+
+    def test_matches_scalar_categories_around_thresholds(self):
+        """Test every category boundary against get_area_density_category."""
+        densities = [0.0, 3999.0, 4000.0, 4001.0, 9999.0, 10000.0, 10001.0, 26000.0]
+
+        result = AreaDensityCalculator.calculate(["10115"] * len(densities), densities, [1.0] * len(densities))
+
+        expected = [PopulationAnalysisService.get_area_density_category(density).value for density in densities]
+        assert result.density_category.tolist() == expected
+
+
+class TestAreaDensityCalculatorValidation:
+    """Test input validation."""
+
+    def test_mismatched_lengths_raise(self):
+        """Test that all input columns must have the same length."""
+        with pytest.raises(ValueError, match="same length"):
+            AreaDensityCalculator.calculate(["10115", "10117"], [1000, 2000], [1.0])
+
+    def test_negative_population_raises(self):
+        """Test that negative populations are rejected."""
+        with pytest.raises(ValueError, match="Population cannot be negative"):
+            AreaDensityCalculator.calculate(["10115"], [-1], [1.0])
+
+    def test_empty_input(self):
+        """Test that no areas yield an empty result."""
+        assert len(AreaDensityCalculator.calculate([], [], [])) == 0
@@ -5,11 +5,13 @@ Test categories:
 - Quantile calculation tests
 - Capacity classification tests
 - Range definition tests
+- Vectorized breakpoint and category code tests
 - Edge cases and validation
 """
 
 # pylint: disable=redefined-outer-name
 
+import numpy as np
 import pytest
 
 from src.shared.domain.enums import CapacityCategory
@@ -166,3 +168,72 @@ class TestClassifyCapacities:
         _, categories = CapacityClassificationService.classify_capacities(capacities)
 
         assert len(categories) == len(capacities)
+
+
+def reference_quantile(capacities: list[float], quantile: float) -> float:
+    """Index-based quantile of the original list implementation."""
+    sorted_capacities = sorted(capacities)
+    return sorted_capacities[min(int(len(sorted_capacities) * quantile), len(sorted_capacities) - 1)]
+
+
+class TestVectorizedClassification:
+    """Test breakpoints and category codes of the vectorized classifier."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_list_based_classification(self, seed):
+        """Test that quantiles and categories reproduce the list-based semantics, including ties."""
+        rng = np.random.default_rng(seed)
+        capacities = rng.choice([0.0, 11.0, 22.0, 50.0, 150.0, 300.0], size=int(rng.integers(1, 200))).tolist()
+        non_zero = [capacity for capacity in capacities if capacity > 0]
+
+        range_definitions, categories = CapacityClassificationService.classify_capacities(capacities)
+
+        if not non_zero:
+            assert categories == ["None"] * len(capacities)
+            return
+
+        q33, q66 = reference_quantile(non_zero, 0.33), reference_quantile(non_zero, 0.66)
+        assert range_definitions == {"Low": (0, q33), "Medium": (q33, q66), "High": (q66, max(capacities))}
+        assert categories == [
+            CapacityClassificationService.classify_capacity(capacity, q33, q66) for capacity in capacities
+        ]
+
+    def test_breakpoints_for_deciles(self):
+        """Test that arbitrary quantile sets use the same index rule."""
+        capacities = [float(value) for value in range(1, 101)]
+        deciles = [i / 10 for i in range(1, 10)]
+
+        breakpoints = CapacityClassificationService.calculate_breakpoints(capacities, deciles)
+
+        assert breakpoints.tolist() == [reference_quantile(capacities, quantile) for quantile in deciles]
+
+    def test_codes_for_quintiles(self):
+        """Test that quintile classification yields codes 0 (None) to 5."""
+        capacities = [0.0] + [float(value) for value in range(1, 11)]
+
+        breakpoints, codes = CapacityClassificationService.classify_capacity_codes(
+            capacities, quantiles=(0.2, 0.4, 0.6, 0.8)
+        )
+
+        assert breakpoints.tolist() == [3.0, 5.0, 7.0, 9.0]
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [0, 1, 1, 1, 2, 2, 3, 3, 4, 4, 5]
+
+    def test_value_equal_to_breakpoint_falls_into_lower_class(self):
+        """Test the inclusive upper bound of each class."""
+        codes = CapacityClassificationService.classify_codes([50.0, 50.1, 100.0, 100.1], np.array([50.0, 100.0]))
+
+        assert codes.tolist() == [1, 2, 2, 3]
+
+    def test_codes_without_positive_capacities(self):
+        """Test that only zero capacities yield zero breakpoints and the None code."""
+        breakpoints, codes = CapacityClassificationService.classify_capacity_codes([0.0, 0.0])
+
+        assert breakpoints.tolist() == [0.0, 0.0]
+        assert codes.tolist() == [0, 0]
+
+    @pytest.mark.parametrize("quantiles", [(), (0.66, 0.33), (-0.1, 0.5), (0.5, 1.5)])
+    def test_invalid_quantiles_raise(self, quantiles):
+        """Test that quantiles must be ascending values between 0 and 1."""
+        with pytest.raises(ValueError, match="Quantiles must be ascending"):
+            CapacityClassificationService.calculate_breakpoints([10.0, 20.0], quantiles)
@@ -33,6 +33,25 @@ class TestDensityCategory:
         assert PopulationAnalysisService.get_density_category(0) == PopulationDensityCategory.LOW
 
 
+class TestAreaDensityCategory:
+    """Test get_area_density_category business logic."""
+
+    def test_high_area_density_category(self):
+        """Test HIGH category for more than 10,000 residents/km²."""
+        assert PopulationAnalysisService.get_area_density_category(10001) == PopulationDensityCategory.HIGH
+        assert PopulationAnalysisService.get_area_density_category(26000.5) == PopulationDensityCategory.HIGH
+
+    def test_medium_area_density_category(self):
+        """Test MEDIUM category (4,000 - 10,000 residents/km²)."""
+        assert PopulationAnalysisService.get_area_density_category(10000) == PopulationDensityCategory.MEDIUM
+        assert PopulationAnalysisService.get_area_density_category(4000.1) == PopulationDensityCategory.MEDIUM
+
+    def test_low_area_density_category(self):
+        """Test LOW category (up to 4,000 residents/km²)."""
+        assert PopulationAnalysisService.get_area_density_category(4000) == PopulationDensityCategory.LOW
+        assert PopulationAnalysisService.get_area_density_category(0) == PopulationDensityCategory.LOW
+
+
 class TestHighDensityCheck:
     """Test is_high_density business rule."""
 
@@ -4,7 +4,7 @@ Unit Tests for PostalCode Value Object.
 Test categories:
 - Validation tests (invariants)
 - Business rules (Berlin-specific postal codes)
-- Static methods (get_values)
+- Static methods (get_values, is_valid)
 - Immutability tests
 - Edge cases and boundary values
 """
@@ -203,6 +203,22 @@ class TestPostalCodeGetValues:
         assert values == ["10115", "10115", "12045"]
 
 
+class TestPostalCodeIsValid:
+    """Test the non-raising is_valid check."""
+
+    @pytest.mark.parametrize("value", ["10115", " 14199 ", 12529])
+    def test_valid_values(self, value):
+        """Test that values accepted by the constructor are valid."""
+        assert PostalCode.is_valid(value) is True
+
+    @pytest.mark.parametrize("value", [None, "", "   ", "abcde", "1011", "01011", "99999", "10000"])
+    def test_invalid_values(self, value):
+        """Test that values rejected by the constructor are invalid."""
+        assert PostalCode.is_valid(value) is False
+        with pytest.raises(InvalidPostalCodeError):
+            PostalCode(value)
+
+
 class TestPostalCodeImmutability:
     """Test immutability of PostalCode (frozen dataclass)."""
 
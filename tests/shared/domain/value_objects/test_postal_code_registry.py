@@ -0,0 +1,67 @@
+"""
+Unit Tests for PostalCodeRegistry.
+
+Test categories:
+- Construction (validation, deduplication, ordering)
+- Interning and lookups
+- Membership checks
+"""
+
+from src.shared.domain.value_objects import PostalCode, PostalCodeRegistry
+
+
+class TestPostalCodeRegistryConstruction:
+    """Test building a registry from raw values."""
+
+    def test_invalid_and_duplicate_values_are_skipped(self):
+        """Test that only distinct valid postal codes are registered."""
+        registry = PostalCodeRegistry(["10247", "10115", " 10115", "99999", "abc", None, 12529])
+
+        assert registry.to_list() == [PostalCode("10115"), PostalCode("10247"), PostalCode("12529")]
+        assert registry.skipped_count == 2
+        assert len(registry) == 3
+
+    def test_iteration_and_ints_are_sorted(self):
+        """Test that postal codes are returned in ascending order."""
+        registry = PostalCodeRegistry(["14199", "10115"])
+
+        assert [postal_code.value for postal_code in registry] == ["10115", "14199"]
+        assert registry.to_ints() == [10115, 14199]
+
+    def test_empty_registry(self):
+        """Test that a registry without values is empty."""
+        registry = PostalCodeRegistry(())
+
+        assert len(registry) == 0
+        assert not registry.to_list()
+
+
+class TestPostalCodeRegistryLookups:
+    """Test interned lookups and membership."""
+
+    def test_get_returns_interned_instance(self):
+        """Test that every lookup returns the same PostalCode instance."""
+        registry = PostalCodeRegistry(["10115"])
+
+        interned = registry.get("10115")
+        assert registry.get(10115) is interned
+        assert registry.get(" 10115 ") is interned
+        assert registry.get(PostalCode("10115")) is interned
+
+    def test_get_unknown_value_returns_none(self):
+        """Test that unknown and invalid values are not found."""
+        registry = PostalCodeRegistry(["10115"])
+
+        assert registry.get("10117") is None
+        assert registry.get("abc") is None
+        assert registry.get(None) is None
+
+    def test_membership_accepts_str_int_and_postal_code(self):
+        """Test set-based membership checks for all supported types."""
+        registry = PostalCodeRegistry(["10115"])
+
+        assert "10115" in registry
+        assert 10115 in registry
+        assert PostalCode("10115") in registry
+        assert 10117 not in registry
+        assert 10115.0 not in registry
@@ -0,0 +1,82 @@
+"""
+Unit Tests for StationStatistics Value Object.
+
+Test categories:
+- Validation tests (invariants)
+- Derived metrics
+- Business rules (well-equipped, coverage level)
+"""
+
+import pytest
+
+from src.shared.domain.enums import CoverageLevel
+from src.shared.domain.value_objects import StationStatistics
+
+
+class TestStationStatisticsValidation:
+    """Test validation logic in __post_init__."""
+
+    def test_default_is_empty_area(self):
+        """Test that default statistics describe an area without stations."""
+        statistics = StationStatistics()
+
+        assert statistics.station_count == 0
+        assert statistics.get_coverage_level() == CoverageLevel.NO_COVERAGE
+
+    def test_negative_values_raise(self):
+        """Test that negative metrics are rejected."""
+        with pytest.raises(ValueError, match="cannot be negative"):
+            StationStatistics(station_count=-1)
+
+    def test_more_fast_chargers_than_stations_raises(self):
+        """Test that fast chargers cannot outnumber stations."""
+        with pytest.raises(ValueError, match="cannot exceed"):
+            StationStatistics(station_count=1, fast_charger_count=2)
+
+
+class TestStationStatisticsMetrics:
+    """Test derived metrics."""
+
+    def test_average_power(self):
+        """Test that average power divides total capacity by station count."""
+        assert StationStatistics(station_count=4, total_capacity_kw=100.0).get_average_power_kw() == 25.0
+
+    def test_average_power_without_stations(self):
+        """Test that average power is zero without stations."""
+        assert StationStatistics().get_average_power_kw() == 0.0
+
+    def test_has_fast_charging(self):
+        """Test fast charging capability detection."""
+        assert StationStatistics(station_count=1, fast_charger_count=1).has_fast_charging()
+        assert not StationStatistics(station_count=1).has_fast_charging()
+
+
+class TestStationStatisticsBusinessRules:
+    """Test well-equipped and coverage rules."""
+
+    @pytest.mark.parametrize(
+        "station_count, fast_charger_count, expected",
+        [(4, 1, False), (5, 0, True), (2, 2, True)],
+    )
+    def test_is_well_equipped(self, station_count, fast_charger_count, expected):
+        """Test the quantity-or-quality well-equipped rule."""
+        statistics = StationStatistics(station_count=station_count, fast_charger_count=fast_charger_count)
+
+        assert statistics.is_well_equipped() is expected
+
+    @pytest.mark.parametrize(
+        "station_count, fast_charger_count, expected",
+        [
+            (0, 0, CoverageLevel.NO_COVERAGE),
+            (4, 4, CoverageLevel.POOR),
+            (5, 0, CoverageLevel.ADEQUATE),
+            (10, 2, CoverageLevel.GOOD),
+            (20, 5, CoverageLevel.EXCELLENT),
+            (25, 1, CoverageLevel.ADEQUATE),
+        ],
+    )
+    def test_coverage_level(self, station_count, fast_charger_count, expected):
+        """Test coverage level thresholds."""
+        statistics = StationStatistics(station_count=station_count, fast_charger_count=fast_charger_count)
+
+        assert statistics.get_coverage_level() == expected
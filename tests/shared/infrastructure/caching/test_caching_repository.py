@@ -0,0 +1,171 @@
+"""Tests for the read-through Caching Repository."""
+
+# pylint: disable=redefined-outer-name
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from src.shared.domain.value_objects import PostalCode
+from src.shared.infrastructure.caching import CachingRepository, LRUCache
+from src.shared.infrastructure.repositories import ChargingStationRepository
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def repository():
+    """Create a mock station repository with one populated postal code."""
+    repository = Mock(spec=ChargingStationRepository)
+    repository.find_stations_by_postal_code.side_effect = lambda postal_code: (
+        ["station-1", "station-2"] if postal_code.value == "10115" else []
+    )
+    repository.find_stations_by_postal_codes.side_effect = lambda postal_codes: {
+        postal_code.value: [] for postal_code in postal_codes
+    }
+    repository.get_station_statistics.return_value = {}
+    return repository
+
+
+@pytest.fixture
+def caching_repository(repository):
+    """Wrap the repository with a cache of its station lookups."""
+    return CachingRepository(
+        repository,
+        LRUCache(max_size=16),
+        methods=["find_stations_by_postal_code", "find_stations_by_postal_codes"],
+    )
+
+
+class TestReadThrough:
+    """Test cached and delegated calls."""
+
+    def test_repeated_call_is_served_from_cache(self, caching_repository, repository):
+        """Test that the wrapped repository is only queried once per argument."""
+        first = caching_repository.find_stations_by_postal_code(PostalCode("10115"))
+        second = caching_repository.find_stations_by_postal_code(PostalCode("10115"))
+
+        assert first == second == ["station-1", "station-2"]
+        repository.find_stations_by_postal_code.assert_called_once()
+        assert caching_repository.cache_stats.hits == 1
+
+    def test_different_arguments_are_cached_separately(self, caching_repository, repository):
+        """Test that the cache key contains the arguments."""
+        caching_repository.find_stations_by_postal_code(PostalCode("10115"))
+        caching_repository.find_stations_by_postal_code(PostalCode("10117"))
+
+        assert repository.find_stations_by_postal_code.call_count == 2
+
+    def test_cached_lists_are_returned_as_copies(self, caching_repository):
+        """Test that modifying a result does not modify the cached value."""
+        caching_repository.find_stations_by_postal_code(PostalCode("10115")).append("foreign")
+
+        assert caching_repository.find_stations_by_postal_code(PostalCode("10115")) == ["station-1", "station-2"]
+
+    def test_nested_lists_of_cached_dicts_are_returned_as_copies(self, caching_repository, repository):
+        """Test that modifying a station list of a bulk result does not modify the cached value."""
+        repository.find_stations_by_postal_codes.side_effect = None
+        repository.find_stations_by_postal_codes.return_value = {"10115": ["station-1"]}
+
+        caching_repository.find_stations_by_postal_codes([PostalCode("10115")])["10115"].append("foreign")
+
+        assert caching_repository.find_stations_by_postal_codes([PostalCode("10115")]) == {"10115": ["station-1"]}
+
+    def test_list_and_iterator_arguments_share_a_key(self, caching_repository, repository):
+        """Test that unhashable and one-shot iterable arguments are cached and still reach the repository."""
+        postal_codes = [PostalCode("10115"), PostalCode("10117")]
+
+        first = caching_repository.find_stations_by_postal_codes(postal_codes)
+        second = caching_repository.find_stations_by_postal_codes(iter(postal_codes))
+
+        assert first == second == {"10115": [], "10117": []}
+        repository.find_stations_by_postal_codes.assert_called_once()
+
+    def test_other_attributes_are_delegated(self, caching_repository, repository):
+        """Test that methods without caching are called on every access."""
+        caching_repository.get_station_statistics([PostalCode("10115")])
+        caching_repository.get_station_statistics([PostalCode("10115")])
+
+        assert repository.get_station_statistics.call_count == 2
+        assert caching_repository.repository is repository
+
+    def test_unknown_method_raises(self, repository):
+        """Test that configuring a method the repository lacks fails early."""
+        with pytest.raises(AttributeError):
+            CachingRepository(repository, LRUCache(), methods=["find_everything"])
+
+    def test_clear_cache(self, caching_repository, repository):
+        """Test that clearing the cache forces the next call through."""
+        caching_repository.find_stations_by_postal_code(PostalCode("10115"))
+        caching_repository.clear_cache()
+        caching_repository.find_stations_by_postal_code(PostalCode("10115"))
+
+        assert repository.find_stations_by_postal_code.call_count == 2
+
+
+class TestNegativeCaching:
+    """Test caching of empty results."""
+
+    def test_empty_results_are_cached(self, caching_repository, repository):
+        """Test that a postal code without stations is not looked up again."""
+        for _ in range(3):
+            assert not caching_repository.find_stations_by_postal_code(PostalCode("12529"))
+
+        repository.find_stations_by_postal_code.assert_called_once()
+        assert caching_repository.negative_hits == 2
+
+    def test_negative_hits_are_counted_across_threads(self, caching_repository):
+        """Test that concurrent negative hits are all counted."""
+        caching_repository.find_stations_by_postal_code(PostalCode("12529"))
+
+        def search():
+            for _ in range(500):
+                caching_repository.find_stations_by_postal_code(PostalCode("12529"))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(search) for _ in range(8)]:
+                future.result()
+
+        assert caching_repository.negative_hits == 4000
+
+    def test_negative_caching_can_be_disabled(self, repository):
+        """Test that empty results are fetched every time without negative caching."""
+        caching_repository = CachingRepository(
+            repository, LRUCache(), methods=["find_stations_by_postal_code"], negative_caching=False
+        )
+
+        caching_repository.find_stations_by_postal_code(PostalCode("12529"))
+        caching_repository.find_stations_by_postal_code(PostalCode("12529"))
+
+        assert repository.find_stations_by_postal_code.call_count == 2
+
+    def test_negative_entries_use_their_own_ttl(self, repository):
+        """Test that empty results expire after the negative TTL while others stay cached."""
+        clock = FakeClock()
+        caching_repository = CachingRepository(
+            repository,
+            LRUCache(ttl_seconds=3600, clock=clock),
+            methods=["find_stations_by_postal_code"],
+            negative_ttl_seconds=60,
+        )
+        caching_repository.find_stations_by_postal_code(PostalCode("10115"))
+        caching_repository.find_stations_by_postal_code(PostalCode("12529"))
+
+        clock.now = 60.0
+        caching_repository.find_stations_by_postal_code(PostalCode("10115"))
+        caching_repository.find_stations_by_postal_code(PostalCode("12529"))
+
+        assert [call.args[0].value for call in repository.find_stations_by_postal_code.call_args_list] == [
+            "10115",
+            "12529",
+            "12529",
+        ]
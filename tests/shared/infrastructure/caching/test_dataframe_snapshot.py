@@ -0,0 +1,87 @@
+"""Tests for the Parquet DataFrame Snapshot."""
+
+# pylint: disable=redefined-outer-name
+
+import os
+
+import pandas as pd
+import pytest
+
+from src.shared.infrastructure.caching import DataFrameSnapshot
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """Create a small source file on disk."""
+    path = tmp_path / "source.csv"
+    path.write_text("PLZ;KW\n10115;22,0\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def snapshot(tmp_path, source_file):
+    """Provide a snapshot bound to the source file."""
+    return DataFrameSnapshot(source_file, tmp_path / "snapshots", "source")
+
+
+@pytest.fixture
+def frame():
+    """Provide a DataFrame to persist."""
+    return pd.DataFrame({"PLZ": ["10115", "10117"], "KW": [22.0, 50.0]})
+
+
+def touch_later(path):
+    """Bump the modification time of a file without changing its content."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestDataFrameSnapshot:
+    """Test DataFrameSnapshot persistence and invalidation."""
+
+    def test_load_without_snapshot_returns_none(self, snapshot):
+        """Test that nothing is loaded before a snapshot was written."""
+        assert snapshot.load() is None
+
+    def test_round_trip(self, snapshot, frame):
+        """Test that a written snapshot loads back unchanged."""
+        assert snapshot.save(frame) is True
+
+        pd.testing.assert_frame_equal(snapshot.load(), frame)
+
+    def test_touched_but_unchanged_source_keeps_snapshot(self, snapshot, source_file, frame):
+        """Test that a new mtime with identical content still uses the snapshot."""
+        snapshot.save(frame)
+        touch_later(source_file)
+
+        pd.testing.assert_frame_equal(snapshot.load(), frame)
+
+    def test_changed_content_invalidates_snapshot(self, snapshot, source_file, frame):
+        """Test that a same-sized but modified source invalidates the snapshot."""
+        snapshot.save(frame)
+        source_file.write_text("PLZ;KW\n10117;22,0\n", encoding="utf-8")
+        touch_later(source_file)
+
+        assert snapshot.load() is None
+
+    def test_changed_size_invalidates_snapshot(self, snapshot, source_file, frame):
+        """Test that a resized source invalidates the snapshot."""
+        snapshot.save(frame)
+        source_file.write_text("PLZ;KW\n10115;22,0\n10117;11,0\n", encoding="utf-8")
+
+        assert snapshot.load() is None
+
+    def test_corrupt_snapshot_is_ignored(self, snapshot, frame):
+        """Test that an unreadable snapshot file falls back to None."""
+        snapshot.save(frame)
+        with open(snapshot.data_path, "wb") as file:
+            file.write(b"not parquet")
+
+        assert snapshot.load() is None
+
+    def test_missing_source_is_not_snapshotted(self, tmp_path, frame):
+        """Test that no snapshot is written for a source that does not exist."""
+        snapshot = DataFrameSnapshot(tmp_path / "missing.csv", tmp_path / "snapshots", "missing")
+
+        assert snapshot.save(frame) is False
+        assert snapshot.load() is None
@@ -0,0 +1,237 @@
+"""Tests for the LRU result cache."""
+
+# pylint: disable=redefined-outer-name
+
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.shared.infrastructure.caching import CacheStats, LRUCache, estimate_size
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a clock that only moves when told to."""
+    return FakeClock()
+
+
+class TestLRUCacheLookups:
+    """Test storing, reading and computing values."""
+
+    def test_get_returns_stored_value(self):
+        """Test that stored values are returned and missing keys yield the default."""
+        cache = LRUCache()
+        cache.put("10115", "result")
+
+        assert cache.get("10115") == "result"
+        assert cache.get("10117") is None
+        assert cache.get("10117", default="fallback") == "fallback"
+
+    def test_get_or_compute_computes_once(self):
+        """Test that a value is only computed on the first lookup."""
+        cache = LRUCache()
+        compute = Mock(return_value="result")
+
+        assert cache.get_or_compute("10115", compute) == "result"
+        assert cache.get_or_compute("10115", compute) == "result"
+        compute.assert_called_once()
+
+    def test_none_results_are_cached(self):
+        """Test that a None result counts as cached, e.g. for unknown postal codes."""
+        cache = LRUCache()
+        compute = Mock(return_value=None)
+
+        cache.get_or_compute("99999", compute)
+        cache.get_or_compute("99999", compute)
+
+        compute.assert_called_once()
+        assert "99999" in cache
+
+    def test_failed_computation_is_not_cached(self):
+        """Test that exceptions propagate and the next lookup computes again."""
+        cache = LRUCache()
+        compute = Mock(side_effect=[ConnectionError("down"), "result"])
+
+        with pytest.raises(ConnectionError):
+            cache.get_or_compute("10115", compute)
+
+        assert cache.get_or_compute("10115", compute) == "result"
+        assert compute.call_count == 2
+
+
+class TestLRUCacheBounds:
+    """Test eviction and expiry."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the size bound evicts the entry that was used least recently."""
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire_after_ttl(self, clock):
+        """Test that entries older than the TTL are recomputed."""
+        cache = LRUCache(ttl_seconds=60, clock=clock)
+        compute = Mock(side_effect=["old", "new"])
+
+        assert cache.get_or_compute("10115", compute) == "old"
+        clock.now = 59.9
+        assert cache.get_or_compute("10115", compute) == "old"
+        clock.now = 60.0
+        assert "10115" not in cache
+        assert cache.get_or_compute("10115", compute) == "new"
+        assert cache.stats.expirations == 1
+
+    def test_entry_ttl_overrides_cache_ttl(self, clock):
+        """Test that a per-entry TTL takes precedence over the cache TTL."""
+        cache = LRUCache(ttl_seconds=3600, clock=clock)
+        cache.put("short", 1, ttl_seconds=10)
+        cache.put("long", 2)
+
+        clock.now = 10.0
+
+        assert "short" not in cache
+        assert "long" in cache
+
+    def test_byte_bound_evicts_least_recently_used(self):
+        """Test that entries are evicted until the estimated size fits the byte bound."""
+        cache = LRUCache(max_bytes=250, sizeof=lambda value: value)
+        cache.put("a", 100)
+        cache.put("b", 100)
+        cache.get("a")
+        cache.put("c", 100)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats.size_bytes == 200
+        assert cache.stats.max_bytes == 250
+
+    def test_value_larger_than_byte_bound_is_not_stored(self):
+        """Test that a single oversized value is not cached and does not flush the cache."""
+        cache = LRUCache(max_bytes=250, sizeof=lambda value: value)
+        cache.put("a", 100)
+        cache.put("huge", 300)
+
+        assert "a" in cache
+        assert "huge" not in cache
+        assert cache.stats.evictions == 0
+
+    def test_replacing_and_dropping_entries_releases_bytes(self):
+        """Test that the byte count follows replaced, invalidated and cleared entries."""
+        cache = LRUCache(max_bytes=1000, sizeof=lambda value: value)
+        cache.put("a", 100)
+        cache.put("a", 300)
+        cache.put("b", 50)
+        assert cache.stats.size_bytes == 350
+
+        cache.invalidate("a")
+        assert cache.stats.size_bytes == 50
+
+        cache.clear()
+        assert cache.stats.size_bytes == 0
+
+    def test_invalidate_and_clear(self):
+        """Test dropping single entries and the whole cache."""
+        cache = LRUCache()
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        assert "a" not in cache
+
+        cache.clear()
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"ttl_seconds": 0}, {"ttl_seconds": -5}, {"max_bytes": 0}])
+    def test_invalid_bounds_raise(self, kwargs):
+        """Test that the size and TTL must be positive."""
+        with pytest.raises(ValueError):
+            LRUCache(**kwargs)
+
+
+class TestLRUCacheStats:
+    """Test the counters."""
+
+    def test_hits_and_misses_are_counted(self):
+        """Test hit and miss counters and the hit rate."""
+        cache = LRUCache(max_size=8)
+        compute = Mock(return_value="result")
+
+        for _ in range(4):
+            cache.get_or_compute("10115", compute)
+        cache.get("10117")
+
+        assert cache.stats == CacheStats(hits=3, misses=2, evictions=0, expirations=0, size=1, max_size=8)
+        assert cache.stats.hit_rate == pytest.approx(0.6)
+
+    def test_hit_rate_without_lookups(self):
+        """Test that an unused cache reports a hit rate of zero."""
+        assert LRUCache().stats.hit_rate == 0.0
+
+    def test_contains_does_not_count(self):
+        """Test that membership checks leave the counters untouched."""
+        cache = LRUCache()
+        cache.put("a", 1)
+
+        assert "a" in cache
+
+        assert cache.stats.hits == 0
+        assert cache.stats.misses == 0
+
+
+@dataclass(frozen=True)
+class SampleRecord:
+    """Small dataclass to measure."""
+
+    name: str
+    values: np.ndarray
+
+
+class SlottedRecord:
+    """Small slotted object to measure."""
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload):
+        self.payload = payload
+
+
+class TestEstimateSize:
+    """Test the size estimate used for the byte bound."""
+
+    def test_counts_array_buffers(self):
+        """Test that NumPy buffers are included."""
+        assert estimate_size(np.zeros(10_000)) >= 80_000
+
+    def test_follows_containers_dataclasses_and_slots(self):
+        """Test that nested values are included in the estimate."""
+        values = np.zeros(1_000)
+
+        assert estimate_size([SampleRecord("a", values)]) >= 8_000
+        assert estimate_size({"key": SlottedRecord(values)}) >= 8_000
+
+    def test_shared_objects_are_counted_once(self):
+        """Test that a value referenced twice is only counted once."""
+        values = np.zeros(10_000)
+
+        assert estimate_size([values, values]) < 2 * estimate_size(values)
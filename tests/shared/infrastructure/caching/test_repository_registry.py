@@ -0,0 +1,128 @@
+"""Tests for the process-wide Repository Registry."""
+
+# pylint: disable=redefined-outer-name
+
+import os
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.shared.infrastructure.caching import DatasetVersion, RepositoryRegistry, get_repository_registry
+
+
+@pytest.fixture
+def dataset_file(tmp_path):
+    """Create a small dataset file on disk."""
+    path = tmp_path / "dataset.csv"
+    path.write_text("PLZ;value\n10115;1\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def registry():
+    """Provide a fresh registry for each test."""
+    return RepositoryRegistry()
+
+
+def touch_later(path):
+    """Bump the modification time of a file so it counts as a new dataset version."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestDatasetVersion:
+    """Test DatasetVersion fingerprints."""
+
+    def test_same_file_gives_equal_versions(self, dataset_file):
+        """Test that an unchanged file yields the same version."""
+        assert DatasetVersion.from_paths(dataset_file) == DatasetVersion.from_paths(dataset_file)
+
+    def test_modified_file_gives_new_version(self, dataset_file):
+        """Test that changing the modification time yields a new version."""
+        before = DatasetVersion.from_paths(dataset_file)
+        touch_later(dataset_file)
+
+        after = DatasetVersion.from_paths(dataset_file)
+
+        assert before != after
+        assert before.token != after.token
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing dataset file is reported."""
+        with pytest.raises(FileNotFoundError):
+            DatasetVersion.from_paths(tmp_path / "missing.csv")
+
+    def test_no_sources_gives_empty_version(self):
+        """Test that a version without sources is stable."""
+        assert DatasetVersion.from_paths() == DatasetVersion()
+
+
+class TestRepositoryRegistry:
+    """Test RepositoryRegistry build-once semantics."""
+
+    def test_builds_instance_once_per_version(self, registry, dataset_file):
+        """Test that repeated lookups reuse the first instance."""
+        factory = MagicMock(side_effect=object)
+
+        first = registry.get_or_create("repo", factory, sources=[dataset_file])
+        second = registry.get_or_create("repo", factory, sources=[dataset_file])
+
+        assert first is second
+        factory.assert_called_once()
+
+    def test_rebuilds_when_source_changes(self, registry, dataset_file):
+        """Test that a changed dataset file triggers a rebuild."""
+        first = registry.get_or_create("repo", object, sources=[dataset_file])
+        touch_later(dataset_file)
+
+        second = registry.get_or_create("repo", object, sources=[dataset_file])
+
+        assert first is not second
+        assert registry.get_version("repo") == DatasetVersion.from_paths(dataset_file)
+
+    def test_entries_are_independent(self, registry, dataset_file):
+        """Test that different names hold different instances."""
+        first = registry.get_or_create("a", object, sources=[dataset_file])
+        second = registry.get_or_create("b", object, sources=[dataset_file])
+
+        assert first is not second
+        assert len(registry) == 2
+
+    def test_invalidate_single_entry(self, registry, dataset_file):
+        """Test that invalidating one entry forces only that entry to rebuild."""
+        first_a = registry.get_or_create("a", object, sources=[dataset_file])
+        first_b = registry.get_or_create("b", object, sources=[dataset_file])
+
+        registry.invalidate("a")
+
+        assert "a" not in registry
+        assert registry.get_or_create("a", object, sources=[dataset_file]) is not first_a
+        assert registry.get_or_create("b", object, sources=[dataset_file]) is first_b
+
+    def test_invalidate_all_entries(self, registry, dataset_file):
+        """Test that invalidating without a name clears the registry."""
+        registry.get_or_create("a", object, sources=[dataset_file])
+        registry.get_or_create("b", object, sources=[dataset_file])
+
+        registry.invalidate()
+
+        assert len(registry) == 0
+        assert registry.get_version("a") is None
+
+    def test_invalidate_unknown_entry_is_noop(self, registry):
+        """Test that invalidating an unknown name does not fail."""
+        registry.invalidate("unknown")
+
+        assert len(registry) == 0
+
+    def test_failed_factory_is_not_registered(self, registry, dataset_file):
+        """Test that a factory error leaves no entry behind."""
+        with pytest.raises(RuntimeError):
+            registry.get_or_create("repo", MagicMock(side_effect=RuntimeError("boom")), sources=[dataset_file])
+
+        assert "repo" not in registry
+
+    def test_process_wide_registry_is_shared(self):
+        """Test that the module-level accessor always returns the same registry."""
+        assert get_repository_registry() is get_repository_registry()
@@ -0,0 +1,111 @@
+"""Tests for the TopoJSON encoder."""
+
+# pylint: disable=redefined-outer-name
+
+import numpy as np
+import pytest
+from shapely.geometry import MultiPolygon, Point, Polygon
+
+from src.shared.infrastructure.geospatial import TopoJSONEncoder
+
+
+@pytest.fixture
+def neighbors():
+    """Two unit squares sharing the border x=1."""
+    return {
+        "west": Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+        "east": Polygon([(1, 0), (2, 0), (2, 1), (1, 1)]),
+    }
+
+
+def decode_ring(topology: dict, arc_ids: list[int]) -> Polygon:
+    """Decode a ring of arc indices back into a polygon in source coordinates."""
+    scale = np.array(topology["transform"]["scale"])
+    translate = np.array(topology["transform"]["translate"])
+    arcs = [np.cumsum(np.array(arc), axis=0) * scale + translate for arc in topology["arcs"]]
+
+    points = []
+    for arc_id in arc_ids:
+        arc = arcs[arc_id] if arc_id >= 0 else arcs[~arc_id][::-1]
+        points.extend(arc[:-1])
+    return Polygon(points)
+
+
+class TestTopoJSONEncoder:
+    """Test topology construction, quantization and simplification."""
+
+    def test_invalid_quantization_raises(self):
+        """Test that a grid needs at least two steps."""
+        with pytest.raises(ValueError, match="at least 2"):
+            TopoJSONEncoder(quantization=1)
+
+    def test_shared_border_is_stored_once(self, neighbors):
+        """Test that a border between two areas becomes one arc referenced by both."""
+        topology = TopoJSONEncoder().encode(neighbors, "areas")
+
+        geometries = topology["objects"]["areas"]["geometries"]
+        west, east = (geometry["arcs"][0] for geometry in geometries)
+
+        assert [geometry["id"] for geometry in geometries] == ["west", "east"]
+        assert len(topology["arcs"]) == 3
+        assert len(set(west) & {~arc_id for arc_id in east}) == 1
+
+    def test_round_trip_preserves_shapes(self, neighbors):
+        """Test that decoding the quantized, delta-encoded arcs reproduces the polygons."""
+        # 1001 grid steps across a width of 2 put every corner exactly on the grid.
+        topology = TopoJSONEncoder(quantization=1001).encode(neighbors, "areas")
+
+        for geometry in topology["objects"]["areas"]["geometries"]:
+            decoded = decode_ring(topology, geometry["arcs"][0])
+            assert decoded.symmetric_difference(neighbors[geometry["id"]]).area < 1e-6
+
+        assert topology["bbox"] == [0.0, 0.0, 2.0, 1.0]
+
+    def test_multipolygon_and_skipped_geometries(self):
+        """Test that multipolygons keep their parts and non-polygons are skipped."""
+        topology = TopoJSONEncoder().encode(
+            {
+                "islands": MultiPolygon(
+                    [Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]), Polygon([(2, 0), (3, 0), (3, 1), (2, 1)])]
+                ),
+                "point": Point(0, 0),
+            },
+            "areas",
+        )
+
+        (geometry,) = topology["objects"]["areas"]["geometries"]
+        assert geometry["type"] == "MultiPolygon"
+        assert len(geometry["arcs"]) == 2
+
+    def test_empty_input(self):
+        """Test that encoding nothing yields an empty topology."""
+        topology = TopoJSONEncoder().encode({}, "areas")
+
+        assert not topology["objects"]["areas"]["geometries"]
+        assert not topology["arcs"]
+
+    def test_simplification_keeps_shared_border_identical(self):
+        """Test that arcs are simplified once, so both neighbors reference the same simplified border."""
+        border = [(1, 1), (1.001, 0.5), (1, 0)]
+        geometries = {
+            "west": Polygon([(0, 0), *border[::-1], (0, 1)]),
+            "east": Polygon([(1, 0), (2, 0), (2, 1), *border[:-1]]),
+        }
+
+        detailed = TopoJSONEncoder().encode(geometries, "areas")
+        simplified = TopoJSONEncoder().encode(geometries, "areas", tolerance=0.01)
+
+        assert len(simplified["arcs"]) == len(detailed["arcs"]) == 3
+        assert sum(len(arc) for arc in simplified["arcs"]) < sum(len(arc) for arc in detailed["arcs"])
+
+    def test_with_properties_does_not_modify_topology(self, neighbors):
+        """Test that properties are attached to a copy restricted to the given ids."""
+        topology = TopoJSONEncoder().encode(neighbors, "areas")
+
+        view = TopoJSONEncoder.with_properties(topology, {"east": {"fill_color": "#ffffff"}})
+
+        (geometry,) = view["objects"]["areas"]["geometries"]
+        assert geometry["id"] == "east"
+        assert geometry["properties"] == {"fill_color": "#ffffff"}
+        assert view["arcs"] is topology["arcs"]
+        assert all("properties" not in geometry for geometry in topology["objects"]["areas"]["geometries"])
@@ -18,6 +18,7 @@ def repo_setup():
     Fixture to provide common setup data: raw CSV data and a dummy file path.
     """
     raw_data = {
+        "Ladeeinrichtungs-ID": ["1", "2", "3"],
         "Postleitzahl": ["10115", "10115", "12345"],
         "Bundesland": ["Berlin", "Berlin", "Berlin"],
         "Breitengrad": ["52,5323", "52,5324", "52,0000"],
@@ -38,7 +39,7 @@ def test_initialization_and_transform(mock_read_csv, repo_setup):
 
     # Create a real DataFrame to be returned by the mock
     mock_df = pd.DataFrame(raw_data)
-    mock_read_csv.return_value = mock_df
+    mock_read_csv.return_value = [mock_df]
 
     repo = CSVChargingStationRepository(file_path)
 
@@ -64,7 +65,7 @@ def test_find_stations_by_postal_code_found(mock_read_csv, repo_setup):
     """
     raw_data, file_path = repo_setup
     mock_df = pd.DataFrame(raw_data)
-    mock_read_csv.return_value = mock_df
+    mock_read_csv.return_value = [mock_df]
 
     repo = CSVChargingStationRepository(file_path)
 
@@ -92,7 +93,7 @@ def test_find_stations_by_postal_code_not_found(mock_read_csv, repo_setup):
     """
     raw_data, file_path = repo_setup
     mock_df = pd.DataFrame(raw_data)
-    mock_read_csv.return_value = mock_df
+    mock_read_csv.return_value = [mock_df]
 
     repo = CSVChargingStationRepository(file_path)
 
@@ -111,7 +112,7 @@ def test_get_dataframe_columns(mock_read_csv, repo_setup):
     """
     raw_data, file_path = repo_setup
     mock_df = pd.DataFrame(raw_data)
-    mock_read_csv.return_value = mock_df
+    mock_read_csv.return_value = [mock_df]
 
     repo = CSVChargingStationRepository(file_path)
 
@@ -129,10 +130,240 @@ def test_get_dataframe_value(mock_read_csv, repo_setup):
     """
     raw_data, file_path = repo_setup
     mock_df = pd.DataFrame(raw_data)
-    mock_read_csv.return_value = mock_df
+    mock_read_csv.return_value = [mock_df]
 
     repo = CSVChargingStationRepository(file_path)
 
     value = repo.get_dataframe_value(0, "PLZ")
 
     assert value == "10115"
+
+
+@patch("pandas.read_csv")
+def test_snapshot_skips_csv_parse_on_next_start(mock_read_csv, repo_setup, tmp_path):
+    """
+    Test that a second repository built from an unchanged file loads the snapshot instead of the CSV.
+    """
+    raw_data, _ = repo_setup
+    file_path = tmp_path / "register.csv"
+    file_path.write_text("placeholder", encoding="utf-8")
+    mock_read_csv.return_value = [pd.DataFrame(raw_data)]
+
+    first = CSVChargingStationRepository(str(file_path), snapshot_dir=tmp_path / "snapshots")
+    second = CSVChargingStationRepository(str(file_path), snapshot_dir=tmp_path / "snapshots")
+
+    mock_read_csv.assert_called_once()
+    assert second.get_dataframe_columns() == first.get_dataframe_columns()
+    assert len(second.find_stations_by_postal_code(PostalCode("10115"))) == 2
+
+
+@patch("pandas.read_csv")
+def test_ingest_keeps_only_berlin_rows(mock_read_csv):
+    """
+    Test that the streaming ingest drops stations outside Berlin and reports the counts.
+    """
+    chunks = [
+        pd.DataFrame(
+            {
+                "Ladeeinrichtungs-ID": [1, 2],
+                "Postleitzahl": [10115, 80331],
+                "Bundesland": ["Berlin", "Bayern"],
+                "Breitengrad": ["52,5", "48,1"],
+                "Längengrad": ["13,4", "11,6"],
+                "Nennleistung Ladeeinrichtung [kW]": ["22,0", "50,0"],
+            }
+        ),
+        pd.DataFrame(
+            {
+                "Ladeeinrichtungs-ID": [3, 4],
+                "Postleitzahl": [12529, 72535],
+                "Bundesland": ["Brandenburg", "Baden-Württemberg"],
+                "Breitengrad": ["52,4", "48,5"],
+                "Längengrad": ["13,5", "9,1"],
+                "Nennleistung Ladeeinrichtung [kW]": ["11,0", "22,0"],
+            }
+        ),
+    ]
+    mock_read_csv.return_value = chunks
+
+    repo = CSVChargingStationRepository("dummy_path.csv")
+
+    _, kwargs = mock_read_csv.call_args
+    assert "Postleitzahl" in kwargs.get("usecols")
+    assert kwargs.get("chunksize")
+    assert repo.get_dataframe_value(0, "PLZ") == "10115"
+    assert repo.get_dataframe_value(1, "PLZ") == "12529"
+    assert repo.ingest_report.rows_read == 4
+    assert repo.ingest_report.rows_kept == 2
+    assert repo.ingest_report.rows_dropped == 2
+    assert not repo.find_stations_by_postal_code(MagicMock(spec=PostalCode, value="80331"))
+
+
+@patch("pandas.read_csv")
+def test_columns_are_typed(mock_read_csv, repo_setup):
+    """
+    Test that coordinates and power are numeric and the parser handles decimal commas.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = [pd.DataFrame(raw_data)]
+
+    repo = CSVChargingStationRepository(file_path)
+
+    _, kwargs = mock_read_csv.call_args
+    assert kwargs.get("decimal") == ","
+    assert kwargs.get("encoding") == "Windows-1252"
+    assert repo.get_dataframe_value(0, "KW") == 22.0
+    assert repo.get_dataframe_value(0, "Breitengrad") == 52.5323
+
+
+@patch("pandas.read_csv")
+def test_lookup_groups_unsorted_postal_codes(mock_read_csv):
+    """
+    Test that stations of a postal code are found even when they are scattered across the register.
+    """
+    mock_read_csv.return_value = [
+        pd.DataFrame(
+            {
+                "Ladeeinrichtungs-ID": ["1", "2", "3", "4"],
+                "Postleitzahl": ["12345", "10115", "12345", "10115"],
+                "Bundesland": ["Berlin"] * 4,
+                "Breitengrad": ["52,1", "52,2", "52,3", "52,4"],
+                "Längengrad": ["13,1", "13,2", "13,3", "13,4"],
+                "Nennleistung Ladeeinrichtung [kW]": ["11,0", "22,0", "50,0", "150,0"],
+            }
+        )
+    ]
+
+    repo = CSVChargingStationRepository("dummy_path.csv")
+
+    stations = repo.find_stations_by_postal_code(PostalCode("12345"))
+    assert [station.latitude for station in stations] == [52.1, 52.3]
+    assert [station.power_capacity.kilowatts for station in stations] == [11.0, 50.0]
+    assert len(repo.find_stations_by_postal_code(PostalCode("10115"))) == 2
+
+
+@patch("pandas.read_csv")
+def test_rows_are_sorted_once_and_snapshot_is_stored_sorted(mock_read_csv, repo_setup, tmp_path):
+    """
+    Test that the register is sorted by PLZ once on ingest and the snapshot needs no further sort.
+    """
+    raw_data, _ = repo_setup
+    raw_data["Postleitzahl"] = ["12345", "10115", "10115"]
+    file_path = tmp_path / "register.csv"
+    file_path.write_text("placeholder", encoding="utf-8")
+    mock_read_csv.return_value = [pd.DataFrame(raw_data)]
+
+    with patch.object(pd.DataFrame, "sort_values", autospec=True, side_effect=pd.DataFrame.sort_values) as sort:
+        first = CSVChargingStationRepository(str(file_path), snapshot_dir=tmp_path / "snapshots")
+        assert sort.call_count == 1
+
+        second = CSVChargingStationRepository(str(file_path), snapshot_dir=tmp_path / "snapshots")
+        assert sort.call_count == 1
+
+    assert [second.get_dataframe_value(row, "PLZ") for row in range(3)] == ["10115", "10115", "12345"]
+    assert [station.id for station in second.find_stations_by_postal_code(PostalCode("10115"))] == ["2", "3"]
+    assert second.get_dataframe_columns() == first.get_dataframe_columns()
+
+
+@patch("pandas.read_csv")
+def test_stations_use_register_ids_and_share_power_capacities(mock_read_csv, repo_setup):
+    """
+    Test that station identities come from the register and equal power values share one value object.
+    """
+    raw_data, file_path = repo_setup
+    raw_data["Nennleistung Ladeeinrichtung [kW]"] = ["22,0", "22,0", "50,0"]
+    mock_read_csv.return_value = [pd.DataFrame(raw_data)]
+
+    repo = CSVChargingStationRepository(file_path)
+
+    first, second = repo.find_stations_by_postal_code(PostalCode("10115"))
+    (third,) = repo.find_stations_by_postal_code(PostalCode("12345"))
+
+    assert [first.id, second.id, third.id] == ["1", "2", "3"]
+    assert first.power_capacity is second.power_capacity
+    assert third.power_capacity.kilowatts == 50.0
+
+
+@patch("pandas.read_csv")
+def test_find_stations_by_postal_codes(mock_read_csv, repo_setup):
+    """
+    Test that a bulk lookup groups stations by postal code and includes codes without stations.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = [pd.DataFrame(raw_data)]
+
+    repo = CSVChargingStationRepository(file_path)
+
+    result = repo.find_stations_by_postal_codes([PostalCode("10115"), PostalCode("12345"), PostalCode("10117")])
+
+    assert list(result) == ["10115", "12345", "10117"]
+    assert len(result["10115"]) == 2
+    assert len(result["12345"]) == 1
+    assert not result["10117"]
+
+
+@patch("pandas.read_csv")
+def test_get_station_statistics(mock_read_csv, repo_setup):
+    """
+    Test that precomputed statistics match the station data without building entities.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = [pd.DataFrame(raw_data)]
+
+    repo = CSVChargingStationRepository(file_path)
+
+    with patch("src.shared.infrastructure.repositories.csv_charging_station_repository.ChargingStation") as entity:
+        result = repo.get_station_statistics([PostalCode("10115"), PostalCode("12345"), PostalCode("10117")])
+
+    entity.assert_not_called()
+    assert result["10115"].station_count == 2
+    assert result["10115"].total_capacity_kw == 33.0
+    assert result["12345"].fast_charger_count == 1
+    assert result["10117"].station_count == 0
+
+
+@patch("pandas.read_csv")
+def test_invalid_power_rows_are_dropped(mock_read_csv, repo_setup):
+    """
+    Test that stations with missing or out-of-range power are dropped, so statistics match the entities.
+    """
+    raw_data, file_path = repo_setup
+    raw_data["Ladeeinrichtungs-ID"] += ["4", "5", "6"]
+    raw_data["Postleitzahl"] += ["10115"] * 3
+    raw_data["Bundesland"] += ["Berlin"] * 3
+    raw_data["Breitengrad"] += ["52,5"] * 3
+    raw_data["Längengrad"] += ["13,4"] * 3
+    raw_data["Nennleistung Ladeeinrichtung [kW]"] += ["", "-11,0", "5000,0"]
+    raw_data["OtherCol"] += ["Ignored"] * 3
+    mock_read_csv.return_value = [pd.DataFrame(raw_data)]
+
+    repo = CSVChargingStationRepository(file_path)
+
+    stations = repo.find_stations_by_postal_code(PostalCode("10115"))
+    statistics = repo.get_station_statistics([PostalCode("10115")])["10115"]
+
+    assert [station.id for station in stations] == ["1", "2"]
+    assert statistics.station_count == 2
+    assert statistics.total_capacity_kw == sum(station.power_capacity.kilowatts for station in stations) == 33.0
+
+
+@patch("pandas.read_csv")
+def test_stations_without_register_id_keep_distinct_identities(mock_read_csv, repo_setup, tmp_path):
+    """
+    Test that stations with a missing register ID do not share the identity "nan", also after a snapshot reload.
+    """
+    raw_data, _ = repo_setup
+    raw_data["Ladeeinrichtungs-ID"] = ["1", None, None]
+    raw_data["Postleitzahl"] = ["10115"] * 3
+    file_path = tmp_path / "register.csv"
+    file_path.write_text("placeholder", encoding="utf-8")
+    mock_read_csv.return_value = [pd.DataFrame(raw_data)]
+
+    for _ in range(2):
+        repo = CSVChargingStationRepository(str(file_path), snapshot_dir=tmp_path / "snapshots")
+        ids = [station.id for station in repo.find_stations_by_postal_code(PostalCode("10115"))]
+
+        assert ids[0] == "1"
+        assert "nan" not in ids
+        assert len(set(ids)) == 3
+    mock_read_csv.assert_called_once()
@@ -122,6 +122,22 @@ def test_get_all_postal_codes(mock_read_csv, repo_setup):
     assert isinstance(plz_list[0], int)
 
 
+@patch("pandas.read_csv")
+def test_get_postal_code_registry(mock_read_csv, repo_setup):
+    """
+    Test that the repository registers the dataset's postal codes once, as interned instances.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVGeoDataRepository(file_path)
+
+    registry = repo.get_postal_code_registry()
+    assert registry.to_ints() == repo.get_all_postal_codes()
+    assert 10115 in registry
+    assert registry.get("10115") is registry.get(PostalCode("10115"))
+
+
 @patch("pandas.read_csv")
 def test_get_all_postal_codes_error_handling(mock_read_csv, repo_setup):
     """
@@ -247,3 +263,176 @@ def test_get_dataframe_value(mock_read_csv, repo_setup):
     value = repo.get_dataframe_value(0, "PLZ")
 
     assert value == "10115"
+
+
+@patch("pandas.read_csv")
+def test_fetch_geolocation_data_is_cached(mock_read_csv, repo_setup):
+    """
+    Test that repeated fetches return the same GeoLocation without re-parsing WKT.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVGeoDataRepository(file_path)
+
+    with patch("src.shared.infrastructure.repositories.csv_geo_data_repository.GeopandasBoundary.from_wkt") as from_wkt:
+        first = repo.fetch_geolocation_data(PostalCode("10115"))
+        second = repo.fetch_geolocation_data(PostalCode("10115"))
+
+    from_wkt.assert_not_called()
+    assert first is second
+    assert first.boundary.geometry.iloc[0].bounds == (13.3, 52.5, 13.4, 52.6)
+
+
+@patch("pandas.read_csv")
+def test_invalid_wkt_is_treated_as_missing(mock_read_csv):
+    """
+    Test that a boundary that cannot be parsed does not break loading the other boundaries.
+    """
+    mock_read_csv.return_value = pd.DataFrame(
+        {
+            "PLZ": [10115, 10247],
+            "geometry": ["NOT A POLYGON", "POLYGON((13.4 52.5, 13.5 52.5, 13.5 52.6, 13.4 52.5))"],
+        }
+    )
+
+    repo = CSVGeoDataRepository("dummy_geo.csv")
+
+    assert repo.fetch_geolocation_data(PostalCode("10115")) is None
+    assert repo.fetch_geolocation_data(PostalCode("10247")) is not None
+
+
+@patch("pandas.read_csv")
+def test_get_boundary_geojson_is_cached_feature(mock_read_csv, repo_setup):
+    """
+    Test that boundaries are served as GeoJSON Features that are serialized once.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVGeoDataRepository(file_path)
+
+    first = repo.get_boundary_geojson(PostalCode("10115"))
+    second = repo.get_boundary_geojson(PostalCode("10115"))
+
+    assert first is second
+    assert first["type"] == "Feature"
+    assert first["id"] == "10115"
+    assert first["properties"] == {"PLZ": "10115"}
+    assert first["geometry"]["type"] == "Polygon"
+    assert first["geometry"]["coordinates"][0][0] == [13.3, 52.5]
+
+
+@patch("pandas.read_csv")
+def test_get_boundary_geojson_not_found(mock_read_csv, repo_setup):
+    """
+    Test that an unknown postal code has no GeoJSON boundary.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVGeoDataRepository(file_path)
+
+    assert repo.get_boundary_geojson(PostalCode("12345")) is None
+
+
+@pytest.mark.parametrize("precision, expected", [(2, [13.12, 52.57]), (None, [13.123456789, 52.567891234])])
+@patch("pandas.read_csv")
+def test_get_boundary_geojson_trims_precision(mock_read_csv, precision, expected):
+    """
+    Test that GeoJSON coordinates are rounded to the configured precision.
+    """
+    mock_read_csv.return_value = pd.DataFrame(
+        {
+            "PLZ": [10115],
+            "geometry": ["POLYGON((13.123456789 52.567891234, 13.4 52.5, 13.4 52.6, 13.123456789 52.567891234))"],
+        }
+    )
+
+    repo = CSVGeoDataRepository("dummy_geo.csv", geojson_precision=precision)
+
+    feature = repo.get_boundary_geojson(PostalCode("10115"))
+    assert feature["geometry"]["coordinates"][0][0] == expected
+
+
+@patch("pandas.read_csv")
+def test_get_boundaries_feature_collection(mock_read_csv, repo_setup):
+    """
+    Test that the bulk accessor returns all or the requested boundaries, skipping unknown codes.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVGeoDataRepository(file_path)
+
+    collection = repo.get_boundaries_feature_collection()
+    subset = repo.get_boundaries_feature_collection([PostalCode("10247"), PostalCode("12345")])
+
+    assert collection["type"] == "FeatureCollection"
+    assert [feature["id"] for feature in collection["features"]] == ["10115", "10247"]
+    assert [feature["id"] for feature in subset["features"]] == ["10247"]
+    assert subset["features"][0] is repo.get_boundary_geojson(PostalCode("10247"))
+
+
+@pytest.mark.parametrize(
+    "zoom, expected", [(None, 0.0), (9, 0.0005), (10, 0.0005), (12, 0.0002), (13, 0.0001), (15, 0.0)]
+)
+@patch("pandas.read_csv")
+def test_get_simplification_tolerance(mock_read_csv, repo_setup, zoom, expected):
+    """
+    Test that zoom levels map to the configured levels of detail.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVGeoDataRepository(file_path)
+
+    assert repo.get_simplification_tolerance(zoom) == expected
+
+
+@patch("pandas.read_csv")
+def test_get_boundary_geojson_simplifies_for_low_zoom(mock_read_csv):
+    """
+    Test that low zoom levels receive a simplified boundary while full detail stays available.
+    """
+    # A square with a small notch that disappears at the coarse tolerance.
+    mock_read_csv.return_value = pd.DataFrame(
+        {
+            "PLZ": [10115],
+            "geometry": [
+                "POLYGON((13.3 52.5, 13.35 52.5, 13.35 52.5001, 13.3501 52.5, 13.4 52.5, 13.4 52.6, 13.3 52.6, 13.3 52.5))"
+            ],
+        }
+    )
+
+    repo = CSVGeoDataRepository("dummy_geo.csv", simplification_levels=((10, 0.001),))
+
+    coarse = repo.get_boundary_geojson(PostalCode("10115"), zoom=10)
+    full = repo.get_boundary_geojson(PostalCode("10115"), zoom=14)
+
+    assert len(coarse["geometry"]["coordinates"][0]) == 5
+    assert len(full["geometry"]["coordinates"][0]) == 8
+    assert coarse is repo.get_boundary_geojson(PostalCode("10115"), zoom=9)
+    assert repo.get_boundaries_feature_collection(zoom=10)["features"] == [coarse]
+
+
+@patch("pandas.read_csv")
+def test_get_boundaries_topology(mock_read_csv, repo_setup):
+    """
+    Test that all boundaries are exported as one cached topology with shared borders stored once.
+    """
+    raw_data, file_path = repo_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVGeoDataRepository(file_path)
+
+    topology = repo.get_boundaries_topology()
+    geometries = topology["objects"]["postal_codes"]["geometries"]
+
+    assert topology["type"] == "Topology"
+    assert [geometry["id"] for geometry in geometries] == ["10115", "10247"]
+    assert geometries[0]["properties"] == {"PLZ": "10115"}
+    # Both squares share the border at longitude 13.4.
+    assert len(topology["arcs"]) == 3
+    assert repo.get_boundaries_topology() is topology
+    assert repo.get_boundaries_topology(zoom=10) is not topology
@@ -6,10 +6,11 @@ Shared Infrastructure CSVPopulationRepository Tests.
 
 from unittest.mock import patch, MagicMock
 
+import numpy as np
 import pytest
 import pandas as pd
 
-from src.shared.domain.value_objects import PostalCode
+from src.shared.domain.value_objects import PostalCode, PostalCodeRegistry
 from src.shared.infrastructure.repositories import CSVPopulationRepository
 
 
@@ -22,6 +23,7 @@ def population_data_setup():
     raw_data = {
         "plz": ["10115", "10115", "10247", "99999"],
         "einwohner": [500, 300, 15000, 100],
+        "qkm": ["0.4", "0.6", "3.5", "1.0"],
         "lat": ["52,5323", "52,5323", "52,0000", "0,0"],
         "lon": ["13,3846", "13,3846", "13,0000", "0,0"],
         "other_col": ["ignore", "ignore", "ignore", "ignore"],
@@ -49,61 +51,36 @@ def test_initialization_and_transform(mock_read_csv, population_data_setup):
     assert kwargs.get("sep") == ","
 
 
-@patch("src.shared.infrastructure.repositories.csv_population_repository.PostalCode")
 @patch("pandas.read_csv")
-def test_get_all_postal_codes_success(mock_read_csv, mock_postal_code_cls, population_data_setup):
+def test_get_all_postal_codes_success(mock_read_csv, population_data_setup):
     """
-    Test retrieving all unique postal codes as PostalCode objects.
+    Test retrieving all unique valid postal codes as PostalCode objects.
     """
     raw_data, file_path = population_data_setup
-    mock_df = pd.DataFrame(raw_data)
-    mock_read_csv.return_value = mock_df
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
 
     repo = CSVPopulationRepository(file_path)
 
-    # Mock successful creation of PostalCode objects
-    mock_instance = MagicMock()
-    mock_postal_code_cls.return_value = mock_instance
-
     result = repo.get_all_postal_codes()
 
-    # The dataset has 3 unique PLZs: 10115, 10247, 99999
-    # (10115 appears twice, but unique() filters it)
-    assert len(result) == 3
-    assert all(res == mock_instance for res in result)
+    # 10115 appears twice but is returned once; 99999 is not a Berlin postal code and is skipped.
+    assert result == [PostalCode("10115"), PostalCode("10247")]
+    assert all(isinstance(postal_code, PostalCode) for postal_code in result)
 
-    # Verify PostalCode was instantiated with the string values
-    assert mock_postal_code_cls.call_count == 3
-    # Check that it was called with '10115' at least once
-    call_args_list = [args[0][0] for args in mock_postal_code_cls.call_args_list]
-    assert "10115" in call_args_list
-    assert "10247" in call_args_list
 
-
-@patch("src.shared.infrastructure.repositories.csv_population_repository.PostalCode")
 @patch("pandas.read_csv")
-def test_get_all_postal_codes_skip_invalid(mock_read_csv, mock_postal_code_cls, population_data_setup):
+def test_get_all_postal_codes_uses_registry(mock_read_csv, population_data_setup):
     """
-    Test that invalid postal codes (raising ValueError) are skipped gracefully.
+    Test that a shared registry restricts the postal codes and supplies its interned instances.
     """
     raw_data, file_path = population_data_setup
-    mock_df = pd.DataFrame(raw_data)
-    mock_read_csv.return_value = mock_df
-
-    repo = CSVPopulationRepository(file_path)
-
-    # Side effect: First call succeeds, second fails, third succeeds
-    def side_effect(plz):
-        if plz == "99999":
-            raise ValueError("Invalid PLZ")
-        return MagicMock(spec=PostalCode)
-
-    mock_postal_code_cls.side_effect = side_effect
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+    registry = PostalCodeRegistry(["10247", "10117"])
 
-    result = repo.get_all_postal_codes()
+    repo = CSVPopulationRepository(file_path, postal_code_registry=registry)
 
-    # Should contain 10115 and 10247, but skip 99999
-    assert len(result) == 2
+    (postal_code,) = repo.get_all_postal_codes()
+    assert postal_code is registry.get("10247")
 
 
 @patch("pandas.read_csv")
@@ -145,6 +122,52 @@ def test_get_residents_count_not_found(mock_read_csv, population_data_setup):
     assert count == 0
 
 
+@patch("pandas.read_csv")
+def test_get_residents_counts(mock_read_csv, population_data_setup):
+    """
+    Test bulk resident counts: aggregated per postal code, aligned with the input, 0 for unknown postal codes.
+    """
+    raw_data, file_path = population_data_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVPopulationRepository(file_path)
+
+    counts = repo.get_residents_counts([PostalCode("10247"), PostalCode("10117"), PostalCode("10115")])
+
+    assert isinstance(counts, np.ndarray)
+    assert counts.tolist() == [15000, 0, 800]
+    assert counts.tolist() == [repo.get_residents_count(PostalCode(plz)) for plz in ("10247", "10117", "10115")]
+
+
+@patch("pandas.read_csv")
+def test_get_residents_counts_empty(mock_read_csv, population_data_setup):
+    """
+    Test that no postal codes yield an empty array.
+    """
+    raw_data, file_path = population_data_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVPopulationRepository(file_path)
+
+    assert repo.get_residents_counts([]).size == 0
+
+
+@patch("pandas.read_csv")
+def test_get_area_sizes(mock_read_csv, population_data_setup):
+    """
+    Test bulk area sizes: summed per postal code, aligned with the input, NaN for unknown postal codes.
+    """
+    raw_data, file_path = population_data_setup
+    mock_read_csv.return_value = pd.DataFrame(raw_data)
+
+    repo = CSVPopulationRepository(file_path)
+
+    sizes = repo.get_area_sizes([PostalCode("10115"), PostalCode("10247"), PostalCode("10117")])
+
+    assert sizes[:2].tolist() == pytest.approx([1.0, 3.5])
+    assert np.isnan(sizes[2])
+
+
 @patch("pandas.read_csv")
 def test_get_dataframe_column_dtype(mock_read_csv, population_data_setup):
     """
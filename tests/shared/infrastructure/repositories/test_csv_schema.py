@@ -0,0 +1,90 @@
+"""Tests for the declarative CSV Schema."""
+
+# pylint: disable=redefined-outer-name
+
+import io
+
+import pandas as pd
+import pytest
+
+from src.shared.infrastructure.repositories import CSVColumn, CSVSchema
+
+
+@pytest.fixture
+def schema():
+    """Provide a schema with German number formatting."""
+    return CSVSchema(
+        columns=(
+            CSVColumn("Postleitzahl", "str", name="PLZ"),
+            CSVColumn("Bundesland", "category"),
+            CSVColumn("Leistung", "float64", name="KW"),
+            CSVColumn("Anzahl", "int32"),
+        ),
+        sep=";",
+        decimal=",",
+        read_options={"skiprows": 1},
+    )
+
+
+class TestCSVSchema:
+    """Test CSVSchema parser options and typing."""
+
+    def test_read_csv_kwargs(self, schema):
+        """Test that parser options, projection and parser dtypes are derived from the schema."""
+        kwargs = schema.read_csv_kwargs()
+
+        assert kwargs["sep"] == ";"
+        assert kwargs["decimal"] == ","
+        assert kwargs["skiprows"] == 1
+        assert kwargs["usecols"] == ["Postleitzahl", "Bundesland", "Leistung", "Anzahl"]
+        assert kwargs["dtype"] == {"Postleitzahl": "str", "Bundesland": "category"}
+
+    def test_parses_decimal_comma_natively(self, schema):
+        """Test that numeric columns arrive as numbers when parsed with the schema options."""
+        csv = "header line\nPostleitzahl;Bundesland;Leistung;Anzahl;Ignored\n10115;Berlin;22,5;2;x\n"
+
+        df = schema.apply(pd.read_csv(io.StringIO(csv), **schema.read_csv_kwargs()))
+
+        assert list(df.columns) == ["PLZ", "Bundesland", "KW", "Anzahl"]
+        assert df["PLZ"].iloc[0] == "10115"
+        assert df["KW"].iloc[0] == 22.5
+        assert str(df["Bundesland"].dtype) == "category"
+        assert str(df["Anzahl"].dtype) == "int32"
+
+    def test_apply_coerces_text_numbers(self, schema):
+        """Test that text numbers with decimal commas are converted and bad values become NaN."""
+        raw = pd.DataFrame(
+            {
+                "Postleitzahl": [10115, 10117],
+                "Bundesland": ["Berlin", "Berlin"],
+                "Leistung": ["11,0", "n/a"],
+                "Anzahl": ["3", ""],
+            }
+        )
+
+        df = schema.apply(raw)
+
+        assert df["PLZ"].tolist() == ["10115", "10117"]
+        assert df["KW"].iloc[0] == 11.0
+        assert pd.isna(df["KW"].iloc[1])
+        assert df["Anzahl"].tolist() == [3, 0]
+
+    def test_apply_keeps_missing_text_missing(self, schema):
+        """Test that a missing text value becomes None instead of the string "nan"."""
+        raw = pd.DataFrame(
+            {
+                "Postleitzahl": ["10115", None],
+                "Bundesland": ["Berlin", "Berlin"],
+                "Leistung": [11.0, 22.0],
+                "Anzahl": [1, 2],
+            }
+        )
+
+        df = schema.apply(raw)
+
+        assert df["PLZ"].tolist() == ["10115", None]
+
+    def test_apply_missing_column_raises(self, schema):
+        """Test that a CSV without a schema column is rejected."""
+        with pytest.raises(KeyError):
+            schema.apply(pd.DataFrame({"Postleitzahl": ["10115"]}))
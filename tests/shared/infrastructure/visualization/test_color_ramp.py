@@ -0,0 +1,73 @@
+"""Tests for the color ramp lookup tables."""
+
+import numpy as np
+import pytest
+
+from src.shared.infrastructure.visualization import BLUE_RAMP, ColorRamp
+
+
+def interpolate(start: tuple[int, int, int], end: tuple[int, int, int], normalized: float) -> tuple[int, ...]:
+    """Per-element RGB interpolation the lookup table replaces."""
+    return tuple(int(s - (s - e) * normalized) for s, e in zip(start, end))
+
+
+def rgb(color: str) -> tuple[int, ...]:
+    """Parse a hex color."""
+    return tuple(int(color[i : i + 2], 16) for i in (1, 3, 5))
+
+
+class TestColorRamp:
+    """Test lookup, normalization and validation."""
+
+    def test_endpoints_are_exact(self):
+        """Test that the lowest and highest values get exactly the ramp colors."""
+        assert BLUE_RAMP.colors([0.0, 50.0, 100.0])[::2] == ["#e3f2fd", "#0d47a1"]
+
+    def test_lookup_is_within_one_step_of_interpolation(self):
+        """Test that table colors stay within one RGB step of exact per-element interpolation."""
+        values = np.linspace(0.0, 1.0, 1001)
+
+        for value, color in zip(values, BLUE_RAMP.colors(values)):
+            expected = interpolate((227, 242, 253), (13, 71, 161), value)
+            assert max(abs(a - b) for a, b in zip(rgb(color), expected)) <= 1
+
+    def test_nan_gets_no_data_color(self):
+        """Test that missing values get the no-data color."""
+        ramp = ColorRamp("#000000", "#ffffff", no_data_color="#123456")
+
+        assert ramp.colors([np.nan, 0.0, 1.0]) == ["#123456", "#000000", "#ffffff"]
+
+    def test_equal_values_map_to_middle(self):
+        """Test that a constant input maps to the middle of the ramp."""
+        ramp = ColorRamp("#000000", "#ffffff", size=3)
+
+        assert ramp.colors([5, 5]) == ["#7f7f7f", "#7f7f7f"]
+
+    def test_values_are_clipped_to_bounds(self):
+        """Test that explicit bounds clip values outside them."""
+        assert BLUE_RAMP.colors([-10.0, 150.0], vmin=0.0, vmax=100.0) == ["#e3f2fd", "#0d47a1"]
+        assert BLUE_RAMP.color(150.0, 0.0, 100.0) == "#0d47a1"
+
+    def test_log_normalization(self):
+        """Test that log normalization spreads small values apart."""
+        normalized = ColorRamp.normalize(np.array([0.0, 9.0, 99.0]), "log")
+
+        np.testing.assert_allclose(normalized, [0.0, 0.5, 1.0])
+
+    def test_quantile_normalization_uses_ranks(self):
+        """Test that quantile normalization uses mid-ranks and ignores the value spacing."""
+        normalized = ColorRamp.normalize(np.array([1.0, 1000.0, 2.0, 2.0, np.nan]), "quantile")
+
+        np.testing.assert_allclose(normalized[:4], [0.0, 1.0, 0.5, 0.5])
+        assert np.isnan(normalized[4])
+
+    def test_unknown_normalization_raises(self):
+        """Test that only known normalizations are accepted."""
+        with pytest.raises(ValueError, match="Unknown normalization"):
+            BLUE_RAMP.colors([1.0], normalization="sqrt")
+
+    @pytest.mark.parametrize("start_color, size", [("#fff", 256), ("#ffffff", 1)])
+    def test_invalid_ramp_raises(self, start_color, size):
+        """Test that colors must be #rrggbb and the table needs two entries."""
+        with pytest.raises(ValueError):
+            ColorRamp(start_color, "#000000", size=size)